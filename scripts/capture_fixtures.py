@@ -2,27 +2,220 @@
 """Script to capture HTML fixtures from Webtop for recorded tests.
 
 Usage:
-    python scripts/capture_fixtures.py
+    python scripts/capture_fixtures.py [DD-MM-YYYY ...]
 
 This will:
 1. Launch a browser
 2. Navigate to Webtop (requires credentials)
-3. Save HTML pages as fixtures
+3. Save HTML pages as fixtures (today's page, or one per given date)
 4. Save them to tests/recorded/fixtures/
 """
 import asyncio
+import hashlib
 import os
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
 from playwright.async_api import async_playwright
 from webtop_il_kit.auth import WebtopAuth
 from webtop_il_kit.browser import WebtopBrowser
+from webtop_il_kit.config import Config
 from webtop_il_kit.navigator import WebtopNavigator
+from webtop_il_kit.pagination import WebtopPagination
+from webtop_il_kit.selectors import Selectors, Timeouts
+from webtop_il_kit.utils import parse_date
 
 FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "recorded" / "fixtures"
+ANONYMIZED_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "anonymized"
+
+# Patterns used by anonymize_html, compiled once at import
+_HEBREW_CHAR = re.compile(r"[\u0590-\u05FF]")
+_SHORT_NAME_CLASS = re.compile(r"short-name-span")
+_BOLD_TITLE_CLASS = re.compile(r"bold-text.*title|title.*bold-text")
+_BOLD_TEXT_CLASS = re.compile(r"bold-text")
+_BOLD_OR_TITLE_CLASS = re.compile(r"bold-text|title")
+_USER_TYPE_CLASS = re.compile(r"user-type")
+_USER_DETAILS_CLASS = re.compile(r"user-details|text-padding-right")
+_PRINT_ONLY_CLASS = re.compile(r"print-only-flex")
+_HEBREW_NAME = re.compile(r"[\u0590-\u05FF]{2,}(?:\s+[\u0590-\u05FF]{2,})+")
+_HEBREW_NAME_PAIR = re.compile(r"[\u0590-\u05FF]{2,}\s+[\u0590-\u05FF]{2,}")
+_LOGIN_TIMESTAMP = re.compile(r"\d{2}/\d{2}/\d{4}\s*\(\d{1,2}:\d{2}\)")
+_FOR_STUDENT_NAME = re.compile(r"עבור\s+[\u0590-\u05FF]{2,}\s+[\u0590-\u05FF]{2,},?\s*")
+
+# Dashboard labels that look like names but must be kept
+_SYSTEM_LABELS = frozenset(
+    {
+        "ריכוז מידע",
+        "תיבת הודעות",
+        "כרטיס תלמיד",
+    }
+)
+
+# Subjects and statuses that may appear in homework table cells
+_TABLE_SYSTEM_TERMS = frozenset(
+    {
+        "מתמטיקה",
+        "אנגלית",
+        "עברית",
+        "היסטוריה",
+        "גיאוגרפיה",
+        "מדעים",
+        "נוכח",
+        "נעדר",
+        "התקיים",
+        "טרם הוזנו נתונים",
+        "חנ``ג",
+        "מולדת",
+        "מוזיקה",
+        "אומנות",
+        "ספריה",
+        "חינוך",
+        "כישורי חיים",
+        "בשבילי המורשת",
+        "למידה חוץ כיתתית",
+    }
+)
+
+# System terms that may appear as standalone text nodes
+_STANDALONE_SYSTEM_TERMS = frozenset(
+    {
+        "ריכוז מידע",
+        "תיבת הודעות",
+        "כרטיס תלמיד",
+        "מתמטיקה",
+        "אנגלית",
+        "עברית",
+        "היסטוריה",
+        "גיאוגרפיה",
+        "מדעים",
+    }
+)
+
+# Tags whose text is never page content
+_NON_CONTENT_TAGS = frozenset({"script", "style"})
+
+
+def _is_standalone_name(text: str) -> bool:
+    """Check whether a text node is a name (2+ Hebrew words, not system text)."""
+    # Cheap probe on the raw node first: most text nodes are whitespace, numbers
+    # or English and can never contain two adjacent Hebrew words
+    if not _HEBREW_NAME_PAIR.search(text):
+        return False
+    text = text.strip()
+    return bool(_HEBREW_NAME.fullmatch(text)) and text not in _STANDALONE_SYSTEM_TERMS
+
+
+def _anonymize_initials(elem):
+    """Remove text from short-name-span elements (initials like "בא")."""
+    if elem.string:
+        elem.string = ""
+
+
+def _anonymize_user_name(elem):
+    """Remove text from user name elements (class contains "title" and "bold-text")."""
+    # If it looks like a name (2+ Hebrew words), remove it
+    if _HEBREW_NAME.fullmatch(elem.get_text(strip=True)):
+        elem.string = ""
+
+
+def _anonymize_last_login(elem):
+    """Remove user details text (like "כניסה אחרונה: 22/01/2026 (10:23)")."""
+    text = elem.get_text(strip=True)
+    # Remove text that contains login timestamps
+    if "כניסה אחרונה" in text or _LOGIN_TIMESTAMP.search(text):
+        elem.string = ""
+
+
+def _anonymize_user_type(elem):
+    """Remove school names from user-type elements.
+
+    Pattern: "תלמיד ב בית החינוך ע ש שמעון פרס" -> "תלמיד"
+    """
+    text = elem.get_text(strip=True)
+    if "תלמיד" in text:
+        # Keep just "תלמיד" part, remove school name
+        parts = text.split(" ב ")
+        if len(parts) > 1:
+            elem.string = parts[0]
+
+
+def _anonymize_user_details(elem):
+    """Remove names from user-details or text-padding-right containers."""
+    for child in elem.find_all(class_=_BOLD_OR_TITLE_CLASS):
+        text = child.get_text(strip=True)
+        # If it's a name (2+ Hebrew words, not system text), remove it
+        if _HEBREW_NAME.fullmatch(text) and text not in _SYSTEM_LABELS:
+            child.string = ""
+
+
+def _anonymize_print_header(elem):
+    """Remove student name from print-only header.
+
+    Pattern: "נושאי שיעור ושיעורי-בית עבור בר אגם, מחצית א - תשפ״ו"
+    """
+    text = elem.get_text(strip=True)
+    if "עבור" in text:
+        # Remove name part: "עבור בר אגם," -> remove entire "עבור [name]," part
+        elem.string = _FOR_STUDENT_NAME.sub("", text)
+
+
+def _anonymize_aria_label(elem):
+    """Remove names from an aria-label attribute."""
+    aria_label = elem.get("aria-label", "")
+    # Names look like 2-4 Hebrew words; a single sub() both detects and removes them
+    without_names = _HEBREW_NAME_PAIR.sub("", aria_label)
+    if without_names == aria_label:
+        return
+    if " - " in aria_label:
+        # Keep the prefix (like "פרופיל אישי"), remove the name
+        elem["aria-label"] = aria_label.split(" - ")[0]
+    else:
+        # Remove the name wherever it appears; a label that is only a name becomes empty
+        elem["aria-label"] = without_names.strip()
+
+
+def _is_table_row(tag) -> bool:
+    """Match <tr> elements and ARIA rows."""
+    return tag.name == "tr" or "row" in tag.get("role", "")
+
+
+def _is_table_cell(tag) -> bool:
+    """Match <td>/<th> elements and ARIA cells."""
+    return tag.name in ("td", "th") or "cell" in tag.get("role", "")
+
+
+def _anonymize_table(table):
+    """Remove names from table cells (teacher names in homework table)."""
+    # Handle both <tr> and divs with role="row"
+    for row in table.find_all(_is_table_row):
+        # Get both td/th and span/div elements with role="cell"
+        cells = row.find_all(_is_table_cell)
+        # Skip header rows
+        if any(cell.name == "th" for cell in cells):
+            continue
+        # If this looks like a data row, anonymize potential name cells
+        for cell in cells:
+            text = cell.get_text(strip=True)
+            # If cell contains what looks like a name (2+ Hebrew words)
+            # and it's not a subject name or system text
+            if _HEBREW_NAME.fullmatch(text) and text not in _TABLE_SYSTEM_TERMS:
+                # Clear all text content from the cell, including nested text
+                cell.string = ""
+
+
+# Class-based anonymization rules, applied in order to every element whose
+# joined class string matches the pattern
+_CLASS_RULES = (
+    (_SHORT_NAME_CLASS, _anonymize_initials),
+    (_BOLD_TITLE_CLASS, _anonymize_user_name),
+    (_BOLD_TEXT_CLASS, _anonymize_last_login),
+    (_USER_TYPE_CLASS, _anonymize_user_type),
+    (_USER_DETAILS_CLASS, _anonymize_user_details),
+    (_PRINT_ONLY_CLASS, _anonymize_print_header),
+)
 
 
 def anonymize_html(html_content: str) -> str:
@@ -31,182 +224,78 @@ def anonymize_html(html_content: str) -> str:
     Removes names, initials, and other personal identifiers while preserving
     the HTML structure for testing purposes.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    # Remove text from short-name-span elements (initials like "בא")
-    for elem in soup.find_all(class_=re.compile(r"short-name-span")):
-        if elem.string:
-            elem.string = ""
-
-    # Remove text from user name elements (class contains "title" and "bold-text")
-    for elem in soup.find_all(class_=re.compile(r"bold-text.*title|title.*bold-text")):
-        text = elem.get_text(strip=True)
-        # If it looks like a name (2+ Hebrew words), remove it
-        if re.search(r"^[\u0590-\u05FF]{2,}(\s+[\u0590-\u05FF]{2,})+$", text):
-            elem.string = ""
-
-    # Remove names from aria-label attributes
-    for elem in soup.find_all(attrs={"aria-label": True}):
-        aria_label = elem.get("aria-label", "")
-        # Check if aria-label contains what looks like a name
-        # Pattern: 2-4 Hebrew words (typical name format)
-        name_match = re.search(r"([\u0590-\u05FF]{2,}\s+[\u0590-\u05FF]{2,})", aria_label)
-        if name_match:
-            # Remove the name part, keep the prefix if it exists
-            if " - " in aria_label:
-                # Keep the prefix (like "פרופיל אישי"), remove the name
-                parts = aria_label.split(" - ")
-                elem["aria-label"] = parts[0]
-            elif name_match.group(1) == aria_label.strip():
-                # If it's just a name, remove it entirely
-                elem["aria-label"] = ""
-            else:
-                # Remove the name from the middle/end
-                elem["aria-label"] = re.sub(r"[\u0590-\u05FF]{2,}\s+[\u0590-\u05FF]{2,}", "", aria_label).strip()
-
-    # Remove user details text (like "כניסה אחרונה: 22/01/2026 (10:23)")
-    for elem in soup.find_all(class_=re.compile(r"bold-text")):
-        text = elem.get_text(strip=True)
-        # Remove text that contains login timestamps
-        if "כניסה אחרונה" in text or re.search(r"\d{2}/\d{2}/\d{4}\s*\(\d{1,2}:\d{2}\)", text):
-            elem.string = ""
-
-    # Remove school names from user-type elements
-    # Pattern: "תלמיד ב בית החינוך ע ש שמעון פרס" -> "תלמיד"
-    for elem in soup.find_all(class_=re.compile(r"user-type")):
-        text = elem.get_text(strip=True)
-        if "תלמיד" in text:
-            # Keep just "תלמיד" part, remove school name
-            parts = text.split(" ב ")
-            if len(parts) > 1:
-                elem.string = parts[0]
-
-    # Remove text content from divs with user-details or text-padding-right
-    # that contain names
-    for elem in soup.find_all(class_=re.compile(r"user-details|text-padding-right")):
-        for child in elem.find_all(class_=re.compile(r"bold-text|title")):
-            text = child.get_text(strip=True)
-            # If it's a name (2+ Hebrew words, not system text), remove it
-            if re.search(r"^[\u0590-\u05FF]{2,}(\s+[\u0590-\u05FF]{2,})+$", text):
-                # Don't remove if it's a system label
-                if text not in ["ריכוז מידע", "תיבת הודעות", "כרטיס תלמיד"]:
-                    child.string = ""
-
-    # Remove student name from print-only header
-    # Pattern: "נושאי שיעור ושיעורי-בית עבור בר אגם, מחצית א - תשפ״ו"
-    for elem in soup.find_all(class_=re.compile(r"print-only-flex")):
-        text = elem.get_text(strip=True)
-        if "עבור" in text:
-            # Remove name part: "עבור בר אגם," -> remove entire "עבור [name]," part
-            text = re.sub(r"עבור\s+[\u0590-\u05FF]{2,}\s+[\u0590-\u05FF]{2,},?\s*", "", text)
-            elem.string = text
-
-    # Remove names from table cells (teacher names in homework table)
-    # Handle both <table> elements and divs with role="table"
-    tables = soup.find_all("table") + soup.find_all(attrs={"role": re.compile(r"table")})
-    for table in tables:
-        # Handle both <tr> and divs with role="row"
-        rows = table.find_all("tr") + table.find_all(attrs={"role": re.compile(r"row")})
-        for row in rows:
-            # Get both td/th and span/div elements with role="cell"
-            cells = row.find_all(["td", "th"]) + row.find_all(attrs={"role": re.compile(r"cell")})
-            # Skip header rows
-            if any(cell.name == "th" for cell in cells):
-                continue
-            # If this looks like a data row, anonymize potential name cells
-            for _, cell in enumerate(cells):
-                text = cell.get_text(strip=True)
-                # If cell contains what looks like a name (2+ Hebrew words)
-                # and it's not a subject name or system text
-                if re.search(r"^[\u0590-\u05FF]{2,}(\s+[\u0590-\u05FF]{2,})+$", text):
-                    # Don't remove if it's a known subject or system term
-                    system_terms = [
-                        "מתמטיקה",
-                        "אנגלית",
-                        "עברית",
-                        "היסטוריה",
-                        "גיאוגרפיה",
-                        "מדעים",
-                        "נוכח",
-                        "נעדר",
-                        "התקיים",
-                        "טרם הוזנו נתונים",
-                        "חנ``ג",
-                        "מולדת",
-                        "מוזיקה",
-                        "אומנות",
-                        "ספריה",
-                        "חינוך",
-                        "כישורי חיים",
-                        "בשבילי המורשת",
-                        "למידה חוץ כיתתית",
-                    ]
-                    if text not in system_terms:
-                        # Clear all text content from the cell
-                        cell.string = ""
-                        # Also clear any nested text
-                        for child in cell.descendants:
-                            if hasattr(child, "string") and child.string:
-                                if re.search(
-                                    r"[\u0590-\u05FF]{2,}\s+[\u0590-\u05FF]{2,}",
-                                    child.string,
-                                ):
-                                    child.string = ""
-
-    # Remove names from any standalone text nodes that contain names
-    # This handles text between elements (but be careful not to remove too much)
-    for elem in soup.find_all(string=True):
-        if elem.parent and elem.strip():
-            text = elem.strip()
-            # Only process if it's a standalone text node (not inside other tags)
-            # Check if it's a name (2+ Hebrew words, not system text)
-            if re.search(r"^[\u0590-\u05FF]{2,}(\s+[\u0590-\u05FF]{2,})+$", text):
-                # Don't remove if it's a known system term
-                system_terms = [
-                    "ריכוז מידע",
-                    "תיבת הודעות",
-                    "כרטיס תלמיד",
-                    "מתמטיקה",
-                    "אנגלית",
-                    "עברית",
-                    "היסטוריה",
-                    "גיאוגרפיה",
-                    "מדעים",
-                ]
-                if text not in system_terms:
-                    # Check if parent is not a system element
-                    parent = elem.parent
-                    parent_class = parent.get("class", [])
-                    parent_class_str = " ".join(parent_class) if parent_class else ""
-                    # Only remove if it's not in a navigation or system element
-                    if "navText" not in parent_class_str and parent.name not in [
-                        "script",
-                        "style",
-                    ]:
-                        elem.replace_with("")
+    # Every personal detail Webtop renders sits next to Hebrew UI text, so a page
+    # without any Hebrew (error or loading states) has nothing to anonymize
+    if not _HEBREW_CHAR.search(html_content):
+        return html_content
+
+    soup = BeautifulSoup(html_content, "lxml")
+
+    # Apply every element-level rule in a single walk over the tree
+    for elem in soup.find_all(True):
+        class_str = " ".join(elem.get("class") or ())
+        if class_str:
+            for pattern, rule in _CLASS_RULES:
+                if pattern.search(class_str):
+                    rule(elem)
+
+        if elem.has_attr("aria-label"):
+            _anonymize_aria_label(elem)
+
+        # Handle both <table> elements and divs with role="table"
+        if elem.name == "table" or "table" in elem.get("role", ""):
+            _anonymize_table(elem)
+
+        # Remove names from standalone text nodes directly inside this element,
+        # unless it's a navigation or system element
+        if "navText" not in class_str and elem.name not in _NON_CONTENT_TAGS:
+            for child in list(elem.children):
+                if isinstance(child, NavigableString) and _is_standalone_name(child):
+                    child.replace_with("")
 
     return str(soup)
 
 
+def anonymize_html_cached(html_content: str) -> str:
+    """Anonymize HTML content, reusing a previous result for identical input.
+
+    Results are cached on disk keyed by a hash of the raw HTML and of this
+    script, so editing the anonymization rules invalidates the cache.
+    """
+    digest = hashlib.sha1(Path(__file__).read_bytes())
+    digest.update(html_content.encode("utf-8"))
+    cache_path = ANONYMIZED_CACHE_DIR / f"{digest.hexdigest()}.html"
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    anonymized = anonymize_html(html_content)
+    ANONYMIZED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(anonymized.encode("utf-8"))
+    return anonymized
+
+
 async def capture_homework_page(page, date_str: str = None):
-    """Capture a homework page and save it as a fixture file."""
-    # Navigate to homework page
-    navigator = WebtopNavigator()
-    success = await navigator.navigate_to_homework(page)
-    if not success:
-        print("Failed to navigate to homework page")
+    """Capture a homework page and save it as a fixture file.
+
+    The page must already be on the homework view.
+    """
+    # Page through to the requested date
+    if date_str and not await WebtopPagination().navigate_to_date_page(page, parse_date(date_str)):
+        print(f"Failed to find date {date_str}")
         return None
 
-    # Wait for content to load
-    await page.wait_for_load_state("networkidle")
-    await asyncio.sleep(2)
+    # Wait for the date cards to render rather than sleeping a fixed time
+    try:
+        await page.wait_for_selector(Selectors.DATE_HEADING, state="attached", timeout=Timeouts.ELEMENT_WAIT)
+    except Exception:
+        print("No date headings rendered, capturing page as-is")
 
     # Get HTML content
     html_content = await page.content()
 
     # Anonymize personal information
     print("Anonymizing personal information...")
-    html_content = anonymize_html(html_content)
+    html_content = anonymize_html_cached(html_content)
 
     # Generate filename
     if date_str:
@@ -218,12 +307,19 @@ async def capture_homework_page(page, date_str: str = None):
     # Save to fixtures directory
     FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
     fixture_path = FIXTURES_DIR / filename
-    fixture_path.write_text(html_content, encoding="utf-8")
+    fixture_path.write_bytes(html_content.encode("utf-8"))
 
     print(f"✓ Saved fixture: {fixture_path}")
     return fixture_path
 
 
+async def capture_homework_page_in_new_tab(context, date_str: str):
+    """Open the homework view in a new tab of the logged-in context and capture a date."""
+    page = await WebtopBrowser.create_page(context)
+    await page.goto(Config.HOMEWORK_URL, wait_until="domcontentloaded")
+    return await capture_homework_page(page, date_str)
+
+
 async def main():
     """Capture HTML fixtures from Webtop for recorded tests."""
     # Check credentials
@@ -235,6 +331,8 @@ async def main():
         print("MINISTRY_OF_EDUCATION_PASSWORD must be set")
         return
 
+    dates = sys.argv[1:]
+
     print("Capturing Webtop HTML fixtures...")
     print(f"Fixtures will be saved to: {FIXTURES_DIR}")
 
@@ -254,15 +352,23 @@ async def main():
 
             print("Login successful")
 
-            # Capture today's homework page
-            print("\nCapturing today's homework page...")
-            await capture_homework_page(page)
+            # Navigate to homework page
+            if not await WebtopNavigator().navigate_to_homework(page):
+                print("Failed to navigate to homework page")
+                return
 
-            # Optionally capture other dates
-            # Uncomment to capture specific dates:
-            # from datetime import timedelta
-            # yesterday = (datetime.now() - timedelta(days=1)).strftime("%d-%m-%Y")
-            # await capture_homework_page(page, yesterday)
+            if not dates:
+                # Capture today's homework page
+                print("\nCapturing today's homework page...")
+                await capture_homework_page(page)
+            else:
+                # The logged-in page captures the first date; the others get their own
+                # tab in the same context so the page loads overlap
+                print(f"\nCapturing homework pages for {', '.join(dates)}...")
+                await asyncio.gather(
+                    capture_homework_page(page, dates[0]),
+                    *(capture_homework_page_in_new_tab(context, date_str) for date_str in dates[1:]),
+                )
 
             print("\n✓ Fixture capture complete!")
 
@@ -46,13 +46,6 @@ if not _logger.handlers:
     # but set propagate to False to avoid duplicate logs if root logger is configured
     _logger.propagate = False
 
-    # Ensure all child loggers of this package inherit the level
-    # This makes loggers like 'webtop_il_kit.extractor' inherit the level
-    for _ in logging.root.handlers:
-        # If root logger has handlers, we might get duplicates
-        # So we keep propagate=False
-        pass
-
 # Lazy import to avoid loading playwright dependencies when only
 # importing utilities
 
@@ -62,6 +55,8 @@ def __getattr__(name):
     if name == "WebtopScraper":
         from .scraper import WebtopScraper
 
+        # Cache on the module so later lookups skip __getattr__
+        globals()["WebtopScraper"] = WebtopScraper
         return WebtopScraper
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
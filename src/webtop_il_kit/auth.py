@@ -1,14 +1,55 @@
 """Authentication module for Webtop login."""
 import asyncio
 import logging
+import re
+from typing import Any, Awaitable, Coroutine, Dict, List, Optional, Set
 
-from playwright.async_api import Page
+from playwright.async_api import Locator, Page
 
 from .config import Config
 from .selectors import Delays, Selectors, TextPatterns, Timeouts
+from .utils import AsyncWait, first_match
 
 logger = logging.getLogger(__name__)
 
+# Page titles shown when Cloudflare blocks the request
+_CLOUDFLARE_BLOCK_RE = re.compile(r"could not be satisfied|cloudflare", re.IGNORECASE)
+
+# Matches any error keyword in the browser, so page text never has to be transferred
+_ERROR_TEXT_SELECTOR = f"text=/{Selectors.ERROR_KEYWORD_RE.pattern}/i"
+
+_BUTTON_ENABLED_JS = "button => !!button && !button.hasAttribute('disabled') && button.getAttribute('aria-disabled') !== 'true'"
+
+# Mirrors Playwright's visibility rule: a non-empty box that is not visibility:hidden
+_FIRST_VISIBLE_JS = """elements => {
+    const e = elements[0];
+    if (!e) return false;
+    const rect = e.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(e).visibility !== 'hidden';
+}"""
+
+# Reads the cookie and MOE button state on the login page in one round-trip
+_LOGIN_BUTTONS_STATE_JS = """([cookieText, moeText]) => {
+    const buttons = [...document.querySelectorAll('button')];
+    const hasText = (button, text) => button.textContent.toLowerCase().includes(text.toLowerCase());
+    const moe = buttons.find(button => hasText(button, moeText));
+    return {
+        cookie: buttons.some(button => hasText(button, cookieText)),
+        moeReady: !!moe && !moe.hasAttribute('disabled') && moe.getAttribute('aria-disabled') !== 'true',
+    };
+}"""
+
+# Summarizes matched elements in a single round-trip instead of one call per attribute
+_DESCRIBE_ELEMENTS_JS = """elements => elements.map(e => ({
+    text: e.textContent,
+    ariaSelected: e.getAttribute('aria-selected'),
+    className: e.getAttribute('class'),
+    role: e.getAttribute('role'),
+    type: e.getAttribute('type'),
+    parentRole: e.parentElement ? e.parentElement.getAttribute('role') : null,
+    inTablist: !!(e.parentElement && e.parentElement.closest('[role="tablist"]')),
+}))"""
+
 
 class WebtopAuth:
     """Handles authentication to Webtop."""
@@ -24,6 +65,7 @@ class WebtopAuth:
         self.username = username
         self.password = password
         self.login_url = Config.LOGIN_URL
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
 
     async def login(self, page: Page) -> bool:
         """
@@ -36,32 +78,32 @@ class WebtopAuth:
             True if login successful, False otherwise
         """
         try:
-            # Navigate to login page with a small delay to appear more natural
-            await asyncio.sleep(Delays.SHORT)
-            await page.goto(self.login_url, wait_until="networkidle", timeout=60000)
+            # Navigate to login page
+            await page.goto(self.login_url, wait_until="domcontentloaded", timeout=60000)
 
-            # Wait a bit for any Cloudflare checks to complete
-            await asyncio.sleep(Delays.MEDIUM)
+            # Wait for any Cloudflare checks to complete
+            await self._wait_for_document_ready(page)
 
             # Check for Cloudflare blocking
             page_title = await page.title()
-            if "could not be satisfied" in page_title.lower() or "cloudflare" in page_title.lower():
+            if self._is_cloudflare_blocked(page_title):
                 logger.warning("Cloudflare is blocking the request")
                 logger.debug("Waiting longer and retrying...")
                 await asyncio.sleep(Delays.EXTRA_LONG * 3)
-                await page.reload(wait_until="networkidle", timeout=60000)
-                await asyncio.sleep(Delays.MEDIUM)
+                await page.reload(wait_until="domcontentloaded", timeout=60000)
+                await self._wait_for_document_ready(page)
                 page_title = await page.title()
-                if "could not be satisfied" in page_title.lower():
+                if self._is_cloudflare_blocked(page_title):
                     logger.error("Still blocked by Cloudflare after retry")
                     await self._debug_login_failure(page)
                     return False
 
             # Accept cookies if present
-            await self._accept_cookies(page)
+            login_buttons = await self._accept_cookies(page)
 
-            # Click Ministry of Education authentication button
-            await self._click_moe_button(page)
+            # Click Ministry of Education authentication button, skipping the
+            # visibility and enabled waits if the button was already ready
+            await self._click_moe_button(page, ready=login_buttons.get("moeReady", False))
 
             # Wait for redirect and handle tab selection
             await self._handle_moe_login_page(page)
@@ -85,40 +127,160 @@ class WebtopAuth:
                 logger.debug(f"Could not save debug info: {debug_error}")
             return False
 
-    async def _accept_cookies(self, page: Page):
-        """Accept cookies if present."""
+    async def resume_session(self, page: Page) -> bool:
+        """
+        Check whether a context restored from a saved session is still logged in.
+
+        Args:
+            page: Playwright page in a context created from saved storage state
+
+        Returns:
+            True if Webtop opened without redirecting to the login page
+        """
+        try:
+            await page.goto(Config.BASE_URL, wait_until="domcontentloaded", timeout=Timeouts.PAGE_LOAD)
+        except Exception as e:
+            logger.debug(f"Could not open Webtop with saved session: {e}")
+            return False
+        return self._is_webtop_url(page.url)
+
+    async def wait_for_background_tasks(self):
+        """Wait for background work such as debug screenshots to finish.
+
+        Call this before closing the page or browser used for login.
+        """
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]):
+        """Schedule coro without awaiting it, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    @staticmethod
+    async def _first_truthy(*checks: Awaitable[Any]) -> Any:
+        """Run checks concurrently and return the first truthy result.
+
+        Checks still running once a truthy result arrives are cancelled.
+        """
+        tasks = [asyncio.ensure_future(check) for check in checks]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result:
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _first_is_visible(locator: Locator) -> bool:
+        """Check in one call that locator matches and its first element is visible."""
+        try:
+            return bool(await locator.evaluate_all(_FIRST_VISIBLE_JS))
+        except Exception:
+            return False
+
+    async def _describe_elements(self, locator: Locator) -> List[Dict[str, Any]]:
+        """Return text and attributes of every element matched by locator."""
+        return await locator.evaluate_all(_DESCRIBE_ELEMENTS_JS)
+
+    @staticmethod
+    def _is_username_password_tab(text: str) -> bool:
+        """Check whether tab text belongs to the username/password tab."""
+        return bool(text) and TextPatterns.USERNAME_PASSWORD_TAB in text and TextPatterns.MOBILE_TAB not in text
+
+    async def _wait_for_document_ready(self, page: Page):
+        """Wait until the document has finished loading and has a title."""
         try:
-            cookie_button = page.locator(Selectors.COOKIE_BUTTON)
-            if await cookie_button.count() > 0:
+            await page.wait_for_function("() => document.readyState === 'complete' && !!document.title", timeout=Timeouts.PAGE_LOAD)
+        except Exception as e:
+            logger.debug(f"Document ready wait timed out: {e}")
+
+    async def _wait_until_enabled(self, page: Page, button: Locator) -> bool:
+        """Wait in the browser until button is no longer disabled.
+
+        Returns:
+            True if the button became enabled, False on timeout
+        """
+        try:
+            handle = await button.element_handle()
+            await page.wait_for_function(
+                _BUTTON_ENABLED_JS,
+                arg=handle,
+                timeout=Timeouts.BUTTON_ENABLE_MAX_WAIT * Timeouts.BUTTON_ENABLE_DELAY * 1000,
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Button did not become enabled: {e}")
+            return False
+
+    async def _accept_cookies(self, page: Page) -> Dict[str, bool]:
+        """
+        Accept cookies if present.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            State of the cookie and MOE buttons, read in a single round-trip,
+            or an empty dict if it could not be read
+        """
+        cookie_button = page.locator(Selectors.COOKIE_BUTTON)
+        moe_button = page.locator(Selectors.MOE_BUTTON)
+        try:
+            # One wait resolves on whichever of the two buttons renders first
+            await cookie_button.or_(moe_button).first.wait_for(state="visible", timeout=Timeouts.ELEMENT_WAIT)
+        except Exception as e:
+            logger.debug(f"Login page buttons did not appear: {e}")
+            return {}
+
+        try:
+            state = await page.evaluate(_LOGIN_BUTTONS_STATE_JS, [TextPatterns.COOKIE_BUTTON_TEXT, TextPatterns.MOE_BUTTON_TEXT])
+            if state["cookie"]:
                 await cookie_button.click(timeout=Timeouts.ELEMENT_VISIBLE // 5)  # Short timeout for cookie button
-                await asyncio.sleep(Delays.AFTER_CLICK)
+                await AsyncWait.after_click(page)
+                # Dismissing the banner may re-render the MOE button
+                state["moeReady"] = False
+            return state
         except Exception:
-            pass
+            return {}
 
-    async def _click_moe_button(self, page: Page):
-        """Click the Ministry of Education authentication button."""
+    async def _click_moe_button(self, page: Page, ready: bool = False):
+        """
+        Click the Ministry of Education authentication button.
+
+        Args:
+            page: Playwright page object
+            ready: True if the button is already known to be visible and enabled
+        """
         logger.info("Clicking Ministry of Education authentication button...")
         moe_button = page.locator(Selectors.MOE_BUTTON)
-        await moe_button.wait_for(state="visible", timeout=Timeouts.ELEMENT_WAIT)
+        if not ready:
+            await moe_button.wait_for(state="visible", timeout=Timeouts.ELEMENT_WAIT)
 
-        # Wait for button to be enabled
-        for _ in range(Timeouts.BUTTON_ENABLE_MAX_WAIT):
-            is_disabled = await moe_button.get_attribute("disabled")
-            aria_disabled = await moe_button.get_attribute("aria-disabled")
-            if is_disabled is None and aria_disabled != "true":
-                break
-            await asyncio.sleep(Timeouts.BUTTON_ENABLE_DELAY)
+            # Wait for button to be enabled
+            await self._wait_until_enabled(page, moe_button)
         await moe_button.click()
 
     async def _handle_moe_login_page(self, page: Page):
         """Handle the Ministry of Education login page."""
         logger.debug("Waiting for redirect to Ministry of Education page...")
+        await AsyncWait.after_navigation(page, Selectors.MOE_LOGIN_URL_PATTERN, timeout=Timeouts.PAGE_LOAD)
+        await page.wait_for_load_state("domcontentloaded", timeout=Timeouts.PAGE_LOAD)
+
+        # Wait for the login tabs or the username field to render
         try:
-            await page.wait_for_url(Selectors.MOE_LOGIN_URL_PATTERN, timeout=Timeouts.PAGE_LOAD)
-        except Exception:
-            pass
-        await page.wait_for_load_state("networkidle", timeout=Timeouts.PAGE_LOAD)
-        await asyncio.sleep(Delays.EXTRA_LONG)
+            await page.wait_for_selector(
+                f"{Selectors.TAB_ROLE}, {Selectors.USERNAME_FORM_CONTROL}",
+                state="visible",
+                timeout=Timeouts.PAGE_LOAD,
+            )
+        except Exception as e:
+            logger.debug(f"Login form did not become visible: {e}")
 
         current_url = page.url
         if Selectors.MOE_DOMAIN not in current_url:
@@ -130,12 +292,11 @@ class WebtopAuth:
     async def _select_username_password_tab(self, page: Page):
         """Select the username/password tab on the MOE login page."""
         logger.info("Switching to username/password tab...")
-        await asyncio.sleep(Timeouts.TAB_CLICK_DELAY)
 
-        # Check if already selected
+        # Check if already selected; the caller has waited for the login form
         if await self._is_tab_already_selected(page):
             logger.debug("Correct tab is already selected, skipping tab click")
-            await asyncio.sleep(Delays.AFTER_TAB_SWITCH)
+            await AsyncWait.after_click(page, Selectors.PASSWORD_UNION)
             return
 
         # Try to click the correct tab
@@ -145,76 +306,71 @@ class WebtopAuth:
 
     async def _is_tab_already_selected(self, page: Page) -> bool:
         """Check if the username/password tab is already selected."""
-        # Method 1: Check if username field is visible
+        # The checks inspect different elements, so run them concurrently
+        return bool(
+            await self._first_truthy(
+                self._tab_selected_via_username_field(page),
+                self._tab_selected_via_aria(page),
+                self._tab_selected_via_password_field(page),
+            )
+        )
+
+    async def _tab_selected_via_username_field(self, page: Page) -> bool:
+        """Check if the username field is visible."""
         try:
-            for selector in Selectors.USERNAME_SELECTORS:
-                username_field = page.locator(selector).first
-                if await username_field.count() > 0 and await username_field.is_visible():
-                    logger.debug("Username field is visible - correct tab appears to be already selected")
-                    return True
+            if await self._first_is_visible(page.locator(Selectors.USERNAME_UNION)):
+                logger.debug("Username field is visible - correct tab appears to be already selected")
+                return True
         except Exception:
             pass
+        return False
 
-        # Method 2: Check aria-selected attribute
+    async def _tab_selected_via_aria(self, page: Page) -> bool:
+        """Check the aria-selected attribute and class of the tabs."""
         try:
-            all_tabs = await page.locator(Selectors.TAB_ROLE).all()
-            for tab in all_tabs:
-                tab_text = await tab.text_content()
-                if tab_text and TextPatterns.USERNAME_PASSWORD_TAB in tab_text and TextPatterns.MOBILE_TAB not in tab_text:
-                    aria_selected = await tab.get_attribute("aria-selected")
-                    class_attr = await tab.get_attribute("class")
-                    if aria_selected == "true" or (class_attr and ("selected" in class_attr.lower() or "active" in class_attr.lower())):
+            for tab in await self._describe_elements(page.locator(Selectors.TAB_ROLE)):
+                tab_text = tab["text"]
+                if self._is_username_password_tab(tab_text):
+                    class_attr = (tab["className"] or "").lower()
+                    if tab["ariaSelected"] == "true" or "selected" in class_attr or "active" in class_attr:
                         logger.debug(f"Correct tab is already selected: {tab_text}")
                         return True
         except Exception:
             pass
+        return False
 
-        # Method 3: Check password field
+    async def _tab_selected_via_password_field(self, page: Page) -> bool:
+        """Check if the username/password form's password field is visible."""
         try:
-            for selector in Selectors.PASSWORD_SELECTORS:
-                password_field = page.locator(selector).first
-                if await password_field.count() > 0 and await password_field.is_visible():
-                    aria_label = await password_field.get_attribute("aria-label")
-                    if aria_label and TextPatterns.PASSWORD_LABEL in aria_label and TextPatterns.MOBILE_TAB not in aria_label:
-                        logger.debug("Password field is visible - correct tab appears to be already selected")
-                        return True
+            password_fields = page.locator(Selectors.PASSWORD_UNION)
+            if await self._first_is_visible(password_fields):
+                aria_label = await password_fields.first.get_attribute("aria-label")
+                if aria_label and TextPatterns.PASSWORD_LABEL in aria_label and TextPatterns.MOBILE_TAB not in aria_label:
+                    logger.debug("Password field is visible - correct tab appears to be already selected")
+                    return True
         except Exception:
             pass
-
         return False
 
     async def _click_correct_tab(self, page: Page) -> bool:
         """Click the username/password tab."""
         # Method 1: Find by text content
         try:
-            all_tabs = await page.locator(Selectors.TAB_ROLE).all()
-            for tab in all_tabs:
-                tab_text = await tab.text_content()
-                if tab_text and TextPatterns.USERNAME_PASSWORD_TAB in tab_text and TextPatterns.MOBILE_TAB not in tab_text:
+            tabs = page.locator(Selectors.TAB_ROLE)
+            for index, info in enumerate(await self._describe_elements(tabs)):
+                tab_text = info["text"]
+                if self._is_username_password_tab(tab_text):
                     logger.debug(f"Found correct tab: {tab_text.strip()}")
+                    tab = tabs.nth(index)
                     await tab.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
                     await tab.click()
-                    await asyncio.sleep(Timeouts.TAB_CLICK_DELAY)
+                    await AsyncWait.after_click(page, Selectors.PASSWORD_UNION)
                     logger.debug("Tab clicked successfully")
                     return True
         except Exception as e:
             logger.debug(f"Method 1 failed: {e}")
 
-        # Method 2: get_by_role
-        try:
-            tab = page.get_by_role("tab", name=TextPatterns.USERNAME_PASSWORD_TAB, exact=True)
-            await tab.wait_for(state="visible", timeout=Timeouts.ELEMENT_WAIT)
-            tab_text = await tab.text_content()
-            if tab_text and TextPatterns.USERNAME_PASSWORD_TAB in tab_text and TextPatterns.MOBILE_TAB not in tab_text:
-                logger.debug(f"Found correct tab via get_by_role: {tab_text}")
-                await tab.click()
-                await asyncio.sleep(Timeouts.TAB_CLICK_DELAY)
-                logger.debug("Tab clicked using get_by_role")
-                return True
-        except Exception as e:
-            logger.debug(f"get_by_role failed: {e}")
-
-        # Method 3: Specific selector
+        # Method 2: Specific selector
         try:
             tab = page.locator(Selectors.TAB_SELECTOR).first
             if await tab.count() > 0:
@@ -222,43 +378,62 @@ class WebtopAuth:
                 logger.debug(f"Found tab with specific selector: {tab_text}")
                 await tab.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
                 await tab.click()
-                await asyncio.sleep(Timeouts.TAB_CLICK_DELAY)
+                await AsyncWait.after_click(page, Selectors.PASSWORD_UNION)
                 logger.debug("Tab clicked using specific selector")
                 return True
         except Exception as e:
             logger.debug(f"Specific selector failed: {e}")
 
+        # Method 3: get_by_role (slow path, computes accessible names)
+        try:
+            tab = page.get_by_role("tab", name=TextPatterns.USERNAME_PASSWORD_TAB, exact=True)
+            await tab.wait_for(state="visible", timeout=Timeouts.ELEMENT_WAIT)
+            tab_text = await tab.text_content()
+            if tab_text and TextPatterns.USERNAME_PASSWORD_TAB in tab_text and TextPatterns.MOBILE_TAB not in tab_text:
+                logger.debug(f"Found correct tab via get_by_role: {tab_text}")
+                await tab.click()
+                await AsyncWait.after_click(page, Selectors.PASSWORD_UNION)
+                logger.debug("Tab clicked using get_by_role")
+                return True
+        except Exception as e:
+            logger.debug(f"get_by_role failed: {e}")
+
         return False
 
     async def _fill_credentials(self, page: Page):
         """Fill in username and password."""
+        # Both fields are already rendered, so look them up concurrently
+        username_field, password_field = await asyncio.gather(self._find_username_field(page), self._find_password_field(page))
+
         # Fill username
         logger.info("Filling username...")
-        username_field = await self._find_username_field(page)
         await username_field.fill(self.username)
-        await asyncio.sleep(Delays.AFTER_FILL)
+        await AsyncWait.after_fill(username_field)
 
         # Fill password
         logger.info("Filling password...")
-        password_field = await self._find_password_field(page)
         await password_field.click()  # Remove readonly attribute
-        await asyncio.sleep(Delays.SHORT)
-        await password_field.fill(self.password)
-        await asyncio.sleep(Delays.AFTER_FILL)
-        await asyncio.sleep(Delays.VERY_LONG)  # Wait for reCAPTCHA if needed
+        await password_field.fill(self.password)  # fill() itself waits for the field to be editable
+        await AsyncWait.after_fill(password_field)
+
+        # Wait for reCAPTCHA to initialize, only if the page embeds it
+        try:
+            if await page.locator(Selectors.RECAPTCHA_IFRAME).count() > 0:
+                await page.wait_for_function("() => !!window.grecaptcha", timeout=Timeouts.ELEMENT_VISIBLE)
+        except Exception as e:
+            logger.debug(f"reCAPTCHA wait skipped: {e}")
 
     async def _find_username_field(self, page: Page):
         """Find and return the username field."""
-        for selector in Selectors.USERNAME_SELECTORS:
-            try:
-                field = page.locator(selector).first
-                if await field.count() > 0:
-                    await field.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
-                    return field
-            except Exception:
-                continue
-
-        # Try get_by_role
+        try:
+            field = await first_match(page, Selectors.USERNAME_SELECTORS)
+            if field is not None:
+                await field.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
+                return field
+        except Exception as e:
+            logger.debug(f"CSS username lookup failed: {e}")
+
+        # Slow path: role lookup only when no CSS selector matched
         try:
             return page.get_by_role(**Selectors.USERNAME_ROLE)
         except Exception:
@@ -266,16 +441,15 @@ class WebtopAuth:
 
     async def _find_password_field(self, page: Page):
         """Find and return the password field."""
-        for selector in Selectors.PASSWORD_SELECTORS:
-            try:
-                field = page.locator(selector).first
-                if await field.count() > 0:
-                    await field.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
-                    return field
-            except Exception:
-                continue
-
-        # Try get_by_role
+        try:
+            field = await first_match(page, Selectors.PASSWORD_SELECTORS)
+            if field is not None:
+                await field.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
+                return field
+        except Exception as e:
+            logger.debug(f"CSS password lookup failed: {e}")
+
+        # Slow path: role lookup only when no CSS selector matched
         try:
             return page.get_by_role(**Selectors.PASSWORD_ROLE)
         except Exception:
@@ -287,13 +461,7 @@ class WebtopAuth:
         login_button = await self._find_login_button(page)
 
         # Wait for button to be enabled
-        for _ in range(Timeouts.BUTTON_ENABLE_MAX_WAIT):
-            is_disabled = await login_button.get_attribute("disabled")
-            aria_disabled = await login_button.get_attribute("aria-disabled")
-            if is_disabled is None and aria_disabled != "true":
-                break
-            await asyncio.sleep(Timeouts.BUTTON_ENABLE_DELAY)
-        else:
+        if not await self._wait_until_enabled(page, login_button):
             logger.warning("Login button still disabled, attempting to click anyway")
 
         btn_text = await login_button.text_content()
@@ -302,58 +470,58 @@ class WebtopAuth:
 
     async def _find_login_button(self, page: Page):
         """Find the login button (not a tab)."""
-        # Method 1: Submit buttons
+        # The CSS-based methods are independent, so run them concurrently
+        # and keep the original priority when picking a result
+        by_submit, by_text, by_form = await asyncio.gather(
+            self._login_button_via_submit(page),
+            self._login_button_via_text(page),
+            self._login_button_via_form(page),
+        )
+        login_button = by_submit or by_text or await self._login_button_via_role(page) or by_form
+        if login_button is None:
+            raise Exception("Could not find login button (may have matched a tab instead)")
+        return login_button
+
+    async def _login_button_via_submit(self, page: Page) -> Optional[Locator]:
+        """Find the login button among submit buttons (method 1)."""
         try:
-            submit_buttons = await page.locator(Selectors.LOGIN_BUTTON_SUBMIT).all()
-            for btn in submit_buttons:
-                btn_text = await btn.text_content()
-                if btn_text and TextPatterns.LOGIN_BUTTON_TEXT in btn_text:
-                    role = await btn.get_attribute("role")
-                    if role != "tab":
-                        try:
-                            parent = btn.locator("xpath=..").first
-                            parent_role = await parent.get_attribute("role")
-                            if parent_role != "tablist" and parent_role != "tabpanel":
-                                logger.debug(f"Found login button (submit): {btn_text}")
-                                return btn
-                        except Exception:
-                            logger.debug(f"Found login button (submit, parent check skipped): {btn_text}")
-                            return btn
+            submit_buttons = page.locator(Selectors.LOGIN_BUTTON_SUBMIT)
+            for index, info in enumerate(await self._describe_elements(submit_buttons)):
+                btn_text = info["text"]
+                if btn_text and TextPatterns.LOGIN_BUTTON_TEXT in btn_text and info["role"] != "tab":
+                    if info["parentRole"] not in ("tablist", "tabpanel"):
+                        logger.debug(f"Found login button (submit): {btn_text}")
+                        return submit_buttons.nth(index)
         except Exception as e:
             logger.debug(f"Method 1 (submit button) failed: {e}")
+        return None
 
-        # Method 2: Buttons with login text
+    async def _login_button_via_text(self, page: Page) -> Optional[Locator]:
+        """Find the login button among buttons with login text (method 2)."""
         try:
-            all_buttons = await page.locator(Selectors.LOGIN_BUTTON_TEXT).all()
-            for btn in all_buttons:
-                role = await btn.get_attribute("role")
-                if role != "tab":
-                    try:
-                        tablist_parent = await btn.locator('xpath=ancestor::*[@role="tablist"]').count()
-                        if tablist_parent == 0:
-                            btn_text = await btn.text_content()
-                            logger.debug(f"Found login button: {btn_text}")
-                            return btn
-                    except Exception:
-                        btn_type = await btn.get_attribute("type")
-                        if btn_type == "submit":
-                            logger.debug(f"Found login button (submit type): {await btn.text_content()}")
-                            return btn
+            all_buttons = page.locator(Selectors.LOGIN_BUTTON_TEXT)
+            for index, info in enumerate(await self._describe_elements(all_buttons)):
+                if info["role"] != "tab" and not info["inTablist"]:
+                    logger.debug(f"Found login button: {info['text']}")
+                    return all_buttons.nth(index)
         except Exception as e:
             logger.debug(f"Method 2 (button search) failed: {e}")
+        return None
 
-        # Method 3: get_by_role
+    async def _login_button_via_role(self, page: Page) -> Optional[Locator]:
+        """Find the login button via get_by_role (method 3, slow path)."""
         try:
-            all_buttons = await page.get_by_role(**Selectors.LOGIN_BUTTON_ROLE).all()
-            for btn in all_buttons:
-                role = await btn.get_attribute("role")
-                if role != "tab":
+            all_buttons = page.get_by_role(**Selectors.LOGIN_BUTTON_ROLE)
+            for index, info in enumerate(await self._describe_elements(all_buttons)):
+                if info["role"] != "tab":
                     logger.debug("Found login button via get_by_role")
-                    return btn
+                    return all_buttons.nth(index)
         except Exception as e:
             logger.debug(f"Method 3 (get_by_role) failed: {e}")
+        return None
 
-        # Method 4: Form context
+    async def _login_button_via_form(self, page: Page) -> Optional[Locator]:
+        """Find the login button inside a form (method 4)."""
         try:
             forms = await page.locator("form").all()
             for form in forms:
@@ -365,76 +533,65 @@ class WebtopAuth:
                         return submit_btn
         except Exception as e:
             logger.debug(f"Method 4 (form search) failed: {e}")
-
-        raise Exception("Could not find login button (may have matched a tab instead)")
+        return None
 
     async def _verify_login_success(self, page: Page) -> bool:
         """Verify that login was successful."""
         logger.debug("Waiting for redirect to Webtop...")
         max_wait_time = Timeouts.LOGIN_REDIRECT / 1000  # Convert to seconds
-        start_time = asyncio.get_event_loop().time()
-        recaptcha_checked = False  # Only check reCAPTCHA once, after a delay
-
-        while True:
-            current_url = page.url
-            elapsed = asyncio.get_event_loop().time() - start_time
-
-            # Check if redirected to Webtop
-            if Selectors.WEBTOP_DOMAIN in current_url and Selectors.LOGIN_PAGE_INDICATOR not in current_url.lower():
-                logger.info(f"Redirected to Webtop after {elapsed:.1f}s")
-                break
-
-            # Check for errors (always check)
-            if Selectors.MOE_DOMAIN in current_url:
-                if await self._check_for_errors(page):
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        # Race the redirect against error detection and the reCAPTCHA check
+        redirect = asyncio.create_task(page.wait_for_url(self._is_webtop_url, timeout=Timeouts.LOGIN_REDIRECT))
+        errors = asyncio.create_task(self._watch_for_errors(page))
+        recaptcha = asyncio.create_task(self._watch_for_recaptcha(page))
+        pending = {redirect, errors, recaptcha}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if errors in done and errors.result():
                     return False
-
-                # Only check for reCAPTCHA after delay (to avoid false
-                # positives). reCAPTCHA iframe might be present but not
-                # blocking when using Ministry auth
-                if not recaptcha_checked and elapsed > Timeouts.RECAPTCHA_CHECK_DELAY:
-                    recaptcha_checked = True
-                    if await self._handle_recaptcha(page):
-                        break
-
-            # Timeout
-            if elapsed > max_wait_time:
-                logger.warning(f"Timeout waiting for redirect after {max_wait_time}s")
-                await self._debug_login_failure(page)
-                break
-
-            await asyncio.sleep(Delays.LONG)
-
-        # Wait for networkidle, but don't fail if it times out
-        # (some pages have continuous background requests)
-        # We've already verified the redirect was successful above
+                if redirect in done:
+                    if redirect.exception() is None:
+                        elapsed = loop.time() - start_time
+                        logger.info(f"Redirected to Webtop after {elapsed:.1f}s")
+                    else:
+                        logger.warning(f"Timeout waiting for redirect after {max_wait_time}s")
+                        await self._debug_login_failure(page)
+                    break
+                if recaptcha in done and recaptcha.result():
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Wait for the document to load, but don't fail if it times out.
+        # networkidle is avoided since some pages have continuous background
+        # requests; the dashboard checks below wait for concrete elements
         try:
-            await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
-            logger.debug("Page reached networkidle state")
+            await page.wait_for_load_state("domcontentloaded", timeout=Timeouts.NETWORK_IDLE)
+            logger.debug("Page reached domcontentloaded state")
         except Exception as e:
-            logger.debug(f"Networkidle timeout (this is OK if page has background requests): {e}")
+            logger.debug(f"Load state timeout: {e}")
             # Continue anyway - we've already verified the redirect was successful
 
-        await asyncio.sleep(Delays.EXTRA_LONG)
-
         # Final verification
         current_url = page.url
         logger.debug(f"Current URL after login: {current_url}")
 
         if Selectors.LOGIN_PAGE_INDICATOR not in current_url.lower() and Selectors.MOE_DOMAIN not in current_url.lower():
             logger.info("Login successful - redirected to dashboard")
-            await asyncio.sleep(Delays.AFTER_LOGIN)
             return True
 
-        # Check for dashboard elements
-        for indicator in Selectors.DASHBOARD_INDICATORS:
-            try:
-                await page.wait_for_selector(indicator, timeout=Timeouts.ELEMENT_VISIBLE)
-                logger.info(f"Login successful - found dashboard element: {indicator}")
-                await asyncio.sleep(Delays.AFTER_LOGIN)
-                return True
-            except Exception:
-                continue
+        # Check for dashboard elements, waiting on all indicators at once
+        try:
+            await page.wait_for_selector(Selectors.DASHBOARD_INDICATOR_SELECTOR, timeout=Timeouts.ELEMENT_WAIT)
+            logger.info("Login successful - found dashboard element")
+            return True
+        except Exception as e:
+            logger.debug(f"No dashboard element found: {e}")
 
         # Check for errors
         if Selectors.MOE_DOMAIN in current_url:
@@ -444,18 +601,42 @@ class WebtopAuth:
         logger.warning("Login status unclear")
         return False
 
+    @staticmethod
+    def _is_cloudflare_blocked(title: str) -> bool:
+        """Check whether a page title indicates Cloudflare blocked the request."""
+        return bool(_CLOUDFLARE_BLOCK_RE.search(title))
+
+    @staticmethod
+    def _is_webtop_url(url: str) -> bool:
+        """Check whether url is a Webtop page past the login screen."""
+        return Selectors.WEBTOP_DOMAIN in url and Selectors.LOGIN_PAGE_INDICATOR not in url.lower()
+
+    async def _watch_for_errors(self, page: Page) -> bool:
+        """Wait until a login error shows up on the Ministry of Education page."""
+        while True:
+            if Selectors.MOE_DOMAIN in page.url and await self._check_for_errors(page):
+                return True
+            await asyncio.sleep(Delays.LONG)
+
+    async def _watch_for_recaptcha(self, page: Page) -> bool:
+        """Check once for a blocking reCAPTCHA after a delay.
+
+        The delay avoids false positives: the reCAPTCHA iframe might be
+        present but not blocking when using Ministry auth.
+        """
+        await asyncio.sleep(Timeouts.RECAPTCHA_CHECK_DELAY)
+        if Selectors.MOE_DOMAIN in page.url:
+            return await self._handle_recaptcha(page)
+        return False
+
     async def _check_for_errors(self, page: Page) -> bool:
         """Check for error messages on the page."""
         try:
-            page_text = await page.locator("body").text_content()
-            if page_text:
-                for keyword in Selectors.ERROR_KEYWORDS:
-                    if keyword.lower() in page_text.lower():
-                        error_elem = page.locator(f"text=/{keyword}/i").first
-                        if await error_elem.count() > 0:
-                            error_text = await error_elem.text_content()
-                            logger.debug(f"Login error detected: {error_text}")
-                            return True
+            error_elem = page.locator(_ERROR_TEXT_SELECTOR).first
+            if await error_elem.count() > 0:
+                error_text = await error_elem.text_content()
+                logger.debug(f"Login error detected: {error_text}")
+                return True
         except Exception:
             pass
         return False
@@ -469,30 +650,27 @@ class WebtopAuth:
         """
         try:
             recaptcha = page.locator(Selectors.RECAPTCHA_IFRAME)
-            if await recaptcha.count() > 0:
-                # Check if reCAPTCHA is actually visible/blocking
-                is_visible = await recaptcha.first.is_visible()
-                if is_visible:
-                    logger.warning("reCAPTCHA detected and visible - waiting for it to be solved...")
-                    # Only wait a short time - if login is working, redirect
-                    # will happen quickly
-                    for _ in range(Timeouts.RECAPTCHA_WAIT):
-                        await asyncio.sleep(Delays.LONG)
-                        current_url = page.url
-                        if Selectors.WEBTOP_DOMAIN in current_url:
-                            logger.info("reCAPTCHA solved, redirect successful")
-                            return True
-                    logger.warning("reCAPTCHA may require manual intervention")
-                else:
-                    # reCAPTCHA iframe exists but is hidden - not blocking,
-                    # continue normally
-                    pass
+            # Check if reCAPTCHA is actually visible/blocking; a hidden
+            # iframe is not blocking, so continue normally
+            if await self._first_is_visible(recaptcha):
+                logger.warning("reCAPTCHA detected and visible - waiting for it to be solved...")
+                # Only wait a short time - if login is working, redirect
+                # will happen quickly
+                if await AsyncWait.after_navigation(page, self._is_webtop_url, timeout=Timeouts.RECAPTCHA_WAIT * 1000):
+                    logger.info("reCAPTCHA solved, redirect successful")
+                    return True
+                logger.warning("reCAPTCHA may require manual intervention")
         except Exception:
             pass
         return False
 
     async def _debug_login_failure(self, page: Page):
-        """Debug login failure by taking screenshot and logging info."""
+        """Debug login failure by taking screenshot and logging info.
+
+        The error text and screenshot are only collected when DEBUG logging is
+        enabled; otherwise just the Cloudflare check runs.
+        """
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         current_url = page.url
         logger.debug(f"Final URL: {current_url}")
         try:
@@ -500,30 +678,28 @@ class WebtopAuth:
             logger.debug(f"Page title: {page_title}")
 
             # Check for Cloudflare blocking
-            if "could not be satisfied" in page_title.lower() or "cloudflare" in page_title.lower():
+            if self._is_cloudflare_blocked(page_title):
                 logger.warning("Cloudflare is blocking the request")
                 logger.debug("This is likely due to bot detection. Possible solutions:")
                 logger.debug("  - Add delays between requests")
                 logger.debug("  - Use a different user agent")
                 logger.debug("  - Run in non-headless mode (if possible)")
 
-            body_text = await page.locator("body").text_content()
-            if body_text:
-                # Check for error keywords in text (not using CSS selector)
-                for keyword in Selectors.ERROR_KEYWORDS[:3]:
-                    if keyword.lower() in body_text.lower():
-                        logger.debug(f"Error keyword detected: {keyword}")
-                        # Try to find the error element using text locator
-                        try:
-                            error_elem = page.locator(f"text={keyword}").first
-                            if await error_elem.count() > 0:
-                                error_text = await error_elem.text_content()
-                                logger.debug(f"Error text: {error_text[:200]}")
-                        except Exception:
-                            pass
+            if debug_enabled:
+                # Let the browser find the error element instead of dumping the body text
+                error_elem = page.locator(_ERROR_TEXT_SELECTOR).first
+                if await error_elem.count() > 0:
+                    error_text = await error_elem.text_content()
+                    logger.debug(f"Error text: {error_text[:200]}")
         except Exception as e:
             logger.debug(f"Could not get page info: {e}")
 
+        if debug_enabled:
+            # Rendering a full-page screenshot is slow, keep it off the caller's path
+            self._run_in_background(self._save_debug_screenshot(page))
+
+    async def _save_debug_screenshot(self, page: Page):
+        """Save a full-page screenshot of the login failure."""
         try:
             await page.screenshot(path="login_debug.png", full_page=True)
             logger.debug("Screenshot saved to login_debug.png for debugging")
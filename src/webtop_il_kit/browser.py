@@ -4,15 +4,34 @@ Handles browser launching and configuration.
 """
 import asyncio
 import logging
-from typing import Optional
+import re
+from typing import Dict, List, Optional
 
-from playwright.async_api import Browser, BrowserContext, Page, Playwright
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route
 
 from .config import Config
-from .selectors import Delays
+from .selectors import Delays, Selectors
 
 logger = logging.getLogger(__name__)
 
+# Requests to tracker hosts, aborted from the first page on. Routes are matched
+# in the browser, so only requests matching a pattern reach Python
+_TRACKER_URL_RE = re.compile(r"^[a-z]+://[^/?#]*(?:" + "|".join(map(re.escape, Selectors.FILTERED_DOMAINS)) + r")(?:[:/?#]|$)", re.IGNORECASE)
+# Images and fonts the scraper never reads. They are only blocked once logged
+# in, since a visible reCAPTCHA challenge on the login page needs them
+_STATIC_ASSET_URL_RE = re.compile(
+    r"(?:" + "|".join(map(re.escape, Selectors.FILTERED_EXTENSIONS)) + r")(?:[?#]|$)",
+    re.IGNORECASE,
+)
+
+# Hides automation indicators from page scripts, minified to keep the payload small
+_STEALTH_JS = (
+    "Object.defineProperty(navigator,'webdriver',{get:()=>undefined});"
+    "window.chrome={runtime:{}};"
+    "Object.defineProperty(navigator,'plugins',{get:()=>[1,2,3,4,5]});"
+    "Object.defineProperty(navigator,'languages',{get:()=>['en-US','en','he']});"
+)
+
 
 class WebtopBrowser:
     """Handles browser lifecycle management."""
@@ -31,8 +50,9 @@ class WebtopBrowser:
         Raises:
             Exception: If no browser could be launched
         """
-        browser = None
         last_error = None
+        # slow_mo delays every action, so it is only useful when watching a debug run
+        slow_mo = Config.SLOW_MO if Config.DEBUG_MODE else 0
 
         browser_configs = [
             # Try system Chrome first (most stable on macOS)
@@ -41,7 +61,7 @@ class WebtopBrowser:
                 lambda: playwright.chromium.launch(
                     headless=Config.HEADLESS_MODE,
                     channel="chrome",
-                    slow_mo=Config.SLOW_MO,
+                    slow_mo=slow_mo,
                     args=[
                         "--disable-blink-features=AutomationControlled",
                         "--disable-dev-shm-usage",
@@ -56,7 +76,7 @@ class WebtopBrowser:
                 "Chromium",
                 lambda: playwright.chromium.launch(
                     headless=Config.HEADLESS_MODE,
-                    slow_mo=Config.SLOW_MO,
+                    slow_mo=slow_mo,
                     args=[
                         "--disable-blink-features=AutomationControlled",
                         "--disable-dev-shm-usage",
@@ -68,36 +88,40 @@ class WebtopBrowser:
             # Then WebKit (native macOS)
             (
                 "WebKit",
-                lambda: playwright.webkit.launch(headless=Config.HEADLESS_MODE, slow_mo=Config.SLOW_MO),
+                lambda: playwright.webkit.launch(headless=Config.HEADLESS_MODE, slow_mo=slow_mo),
             ),
             # Then Firefox
             (
                 "Firefox",
-                lambda: playwright.firefox.launch(headless=Config.HEADLESS_MODE, slow_mo=Config.SLOW_MO),
+                lambda: playwright.firefox.launch(headless=Config.HEADLESS_MODE, slow_mo=slow_mo),
             ),
         ]
 
-        for browser_name, launch_func in browser_configs:
-            browser: Optional[Browser] = None
-            try:
+        # Give the preferred browser a head start; only if it has not launched
+        # by then are the fallbacks started, all at once, instead of one by one
+        first_name, first_launch = browser_configs[0]
+        logger.debug(f"Trying {first_name}...")
+        launches = [(first_name, asyncio.ensure_future(first_launch()))]
+        done, _ = await asyncio.wait({launches[0][1]}, timeout=Delays.BROWSER_HEAD_START)
+        if not done or launches[0][1].exception() is not None:
+            for browser_name, launch_func in browser_configs[1:]:
                 logger.debug(f"Trying {browser_name}...")
-                browser = await launch_func()
+                launches.append((browser_name, asyncio.ensure_future(launch_func())))
+
+        # Take the first browser that launched, in priority order
+        browser: Optional[Browser] = None
+        for browser_name, launch_task in launches:
+            try:
+                browser = await launch_task
                 logger.info(f"{browser_name} launched successfully")
-                await asyncio.sleep(Delays.LONG)
-                contexts = browser.contexts
-                logger.debug(f"Browser is alive, contexts: {len(contexts)}")
-                return browser
             except Exception as e:
                 last_error = e
                 logger.debug(f"{browser_name} failed: {str(e)[:100]}")
-                if browser:
-                    try:
-                        await browser.close()
-                    except Exception as close_error:
-                        logger.debug(f"Error closing browser: {close_error}")
-                browser = None
                 continue
 
+            await WebtopBrowser._discard_launches([task for _, task in launches if task is not launch_task], keep=browser)
+            return browser
+
         error_msg = f"Failed to launch any browser. Last error: {last_error}\n"
         error_msg += "\nTroubleshooting steps:\n"
         error_msg += "1. Update Playwright: pip install --upgrade playwright\n"
@@ -107,17 +131,34 @@ class WebtopBrowser:
         raise Exception(error_msg)
 
     @staticmethod
-    async def create_context(browser: Browser) -> BrowserContext:
+    async def _discard_launches(tasks: List["asyncio.Future[Browser]"], keep: Browser):
+        """Wait for the other browser launches to finish and close every browser they started.
+
+        A launch cancelled mid-flight can leave its browser process running
+        with no handle to close it, so losing launches are awaited instead.
+        """
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException) or result is keep:
+                continue
+            try:
+                await result.close()
+            except Exception as close_error:
+                logger.debug(f"Error closing browser: {close_error}")
+
+    @staticmethod
+    async def create_context(browser: Browser, storage_state: Optional[Dict] = None) -> BrowserContext:
         """
         Create a new browser context.
 
         Args:
             browser: Browser instance
+            storage_state: Optional cookies and storage saved from a logged-in
+                context, so the new context starts logged in
 
         Returns:
             BrowserContext instance
         """
-        return await browser.new_context(
+        context = await browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent=("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
             # Add extra headers to appear more like a real browser
@@ -129,8 +170,32 @@ class WebtopBrowser:
                 "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1",
             },
+            storage_state=storage_state,
         )
 
+        # Context-wide defaults so calls without an explicit timeout fail fast
+        context.set_default_timeout(Config.DEFAULT_TIMEOUT)
+        context.set_default_navigation_timeout(Config.NAVIGATION_TIMEOUT)
+
+        # Hide automation indicators on every page opened in this context
+        await context.add_init_script(_STEALTH_JS)
+        await context.route(_TRACKER_URL_RE, WebtopBrowser._abort)
+        return context
+
+    @staticmethod
+    async def block_static_assets(context: BrowserContext):
+        """Stop loading images and fonts in a context that is already logged in.
+
+        Args:
+            context: Logged-in BrowserContext instance
+        """
+        await context.route(_STATIC_ASSET_URL_RE, WebtopBrowser._abort)
+
+    @staticmethod
+    async def _abort(route: Route):
+        """Abort a request that matched one of the blocking routes."""
+        await route.abort()
+
     @staticmethod
     async def create_page(context: BrowserContext) -> Page:
         """
@@ -143,24 +208,5 @@ class WebtopBrowser:
             Page instance
         """
         page = await context.new_page()
-
-        # Hide automation indicators
-        await page.add_init_script(
-            """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            window.chrome = {
-                runtime: {}
-            };
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en', 'he']
-            });
-            """
-        )
-
         logger.debug("Page created successfully")
         return page
@@ -1,13 +1,48 @@
 """Configuration constants for Webtop scraper."""
 import os
 
-from dotenv import load_dotenv
+# Settings read from the environment, resolved on first access so that
+# importing the package does not load .env until a setting is needed
+_ENV_SETTINGS = {
+    "HEADLESS_MODE": lambda: os.getenv("HEADLESS_MODE", "true").lower() == "true",
+    "DEBUG_MODE": lambda: os.getenv("DEBUG_MODE", "false").lower() == "true",
+    "USERNAME": lambda: os.getenv("MINISTRY_OF_EDUCATION_USERNAME"),
+    "PASSWORD": lambda: os.getenv("MINISTRY_OF_EDUCATION_PASSWORD"),
+    "SESSION_FILE": lambda: os.getenv("WEBTOP_SESSION_FILE"),
+}
 
-load_dotenv()
+_env_loaded = False
 
 
-class Config:
-    """Configuration class for Webtop scraper."""
+def _load_env():
+    """Load the .env file once."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+class _ConfigMeta(type):
+    """Metaclass that resolves environment-backed settings lazily."""
+
+    def __getattr__(cls, name):
+        """Read an environment-backed setting and cache it on the class."""
+        if name not in _ENV_SETTINGS:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        _load_env()
+        value = _ENV_SETTINGS[name]()
+        setattr(cls, name, value)
+        return value
+
+
+class Config(metaclass=_ConfigMeta):
+    """Configuration class for Webtop scraper.
+
+    HEADLESS_MODE, DEBUG_MODE, USERNAME, PASSWORD and SESSION_FILE are read
+    from the environment (and .env) the first time they are accessed.
+    """
 
     # URLs
     BASE_URL = "https://webtop.smartschool.co.il"
@@ -16,17 +51,15 @@ class Config:
     HOMEWORK_URL = f"{BASE_URL}/Student_Card/11"
 
     # Browser configuration
-    # Allow override via environment variable (useful for CI)
-    HEADLESS_MODE = os.getenv("HEADLESS_MODE", "true").lower() == "true"
-    SLOW_MO = 500  # Delay between actions in milliseconds
-
-    # Credentials from environment
-    USERNAME = os.getenv("MINISTRY_OF_EDUCATION_USERNAME")
-    PASSWORD = os.getenv("MINISTRY_OF_EDUCATION_PASSWORD")
+    # HEADLESS_MODE can be overridden via environment variable (useful for CI)
+    SLOW_MO = 500  # Delay between actions in milliseconds, applied only in debug mode
 
     # Pagination limits
     MAX_PAGINATION_PAGES = 100
 
+    # Concurrency limits
+    MAX_PARALLEL_CONTEXTS = 4  # Browser contexts scraping dates at the same time
+
     # Timeouts (in milliseconds)
     DEFAULT_TIMEOUT = 10000  # 10 seconds
     NAVIGATION_TIMEOUT = 30000  # 30 seconds
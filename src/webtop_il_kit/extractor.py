@@ -5,15 +5,102 @@ Handles extraction of homework data from DOM.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-from playwright.async_api import Locator, Page
+from playwright.async_api import Browser, ElementHandle, Locator, Page
 
+from .browser import WebtopBrowser
+from .config import Config
+from .navigator import WebtopNavigator
 from .pagination import WebtopPagination
-from .selectors import Delays, Selectors, TextPatterns, Timeouts
+from .selectors import Selectors, TextPatterns, Timeouts
 
 logger = logging.getLogger(__name__)
 
+# Collect homework rows from a table in one evaluate call, cleaning cell text
+# and combining lesson topic with homework in the browser.
+# Rows with fewer than 6 cells are returned as null so indexes match the DOM.
+_TABLE_ROWS_JS = """(table, opts) => {
+    const clean = (text) => {
+        let cleaned = (text || "").replace(/\\s+/g, " ");
+        for (const prefix of opts.prefixes) {
+            cleaned = cleaned.split(prefix).join("");
+        }
+        cleaned = cleaned.trim();
+        return opts.placeholders.includes(cleaned) ? "" : cleaned;
+    };
+    return Array.from(table.querySelectorAll(opts.rows)).map((row) => {
+        const cells = Array.from(row.querySelectorAll(opts.cells));
+        if (cells.length < 6) {
+            return null;
+        }
+        const subjectButton = cells[1].querySelector(opts.subject);
+        const subject = ((subjectButton && subjectButton.textContent.trim()) || cells[1].textContent || "").trim();
+        const lessonTopic = clean(cells[4].textContent);
+        const homework = clean(cells[5].textContent);
+        const combined = [];
+        if (lessonTopic && !opts.emptyLesson.includes(lessonTopic)) {
+            combined.push(lessonTopic);
+        }
+        if (homework && !opts.emptyHomework.includes(homework)) {
+            combined.push(homework);
+        }
+        const attachedFiles = [];
+        if (cells.length > 6) {
+            for (const link of cells[6].querySelectorAll(opts.links)) {
+                const href = link.getAttribute("href");
+                if (href) {
+                    attachedFiles.push({type: "link", href: href, text: (link.textContent || "").trim()});
+                }
+            }
+            for (const img of cells[6].querySelectorAll(opts.images)) {
+                const src = img.getAttribute("src");
+                if (src) {
+                    attachedFiles.push({type: "image", src: src, alt: (img.getAttribute("alt") || "").trim()});
+                }
+            }
+        }
+        return {
+            hour: clean(cells[0].textContent),
+            subject: subject,
+            teacher: clean(cells[2].textContent),
+            status: clean(cells[3].textContent),
+            lesson_topic: lessonTopic,
+            homework: homework,
+            combined: combined.join(" | "),
+            attached_files: attachedFiles,
+        };
+    });
+}"""
+# Scroll to the bottom and resolve on the next idle period (capped at 1s);
+# WebKit has no requestIdleCallback, so fall back to the next frame there
+_SCROLL_TO_BOTTOM_JS = """() => new Promise((resolve) => {
+    window.scrollTo(0, document.body.scrollHeight);
+    if (window.requestIdleCallback) {
+        window.requestIdleCallback(resolve, {timeout: 1000});
+    } else {
+        setTimeout(resolve, 16);
+    }
+})"""
+
+# aria-label of every matched element, "" where missing
+_ARIA_LABELS_JS = '(elements) => elements.map((el) => el.getAttribute("aria-label") || "")'
+
+# Selectors and cleaning rules handed to _TABLE_ROWS_JS
+_TABLE_ROWS_ARG = {
+    "rows": Selectors.TABLE_BODY_ROWS,
+    "cells": Selectors.TABLE_CELLS,
+    "subject": Selectors.SUBJECT_BUTTON,
+    "links": Selectors.FILE_LINKS,
+    "images": Selectors.FILE_IMAGES,
+    # Cell labels such as "נושא שיעור: " and "שיעורי בית: " are dropped
+    "prefixes": [TextPatterns.LESSON_TOPIC_PREFIX, TextPatterns.HOMEWORK_PREFIX],
+    # Edge cases like "-`" or other single-character placeholders become empty
+    "placeholders": ["-`", "-", "`", "--"],
+    "emptyLesson": [TextPatterns.EMPTY_LESSON_PLACEHOLDER],
+    "emptyHomework": ["--", TextPatterns.NO_HOMEWORK_PLACEHOLDER],
+}
+
 
 class WebtopExtractor:
     """Handles extraction of homework data from pages."""
@@ -21,6 +108,13 @@ class WebtopExtractor:
     def __init__(self):
         """Initialize extractor."""
         self.pagination = WebtopPagination()
+        self.navigator = WebtopNavigator()
+        # Date headings already found, keyed by (id(page), "DD/MM/YYYY")
+        self._heading_cache: Dict[Tuple[int, str], Locator] = {}
+        # Locator over all date headings, built once per page and keyed by id(page)
+        self._heading_locators: Dict[int, Locator] = {}
+        # Pages whose caches are dropped when they close
+        self._watched_pages: Set[int] = set()
 
     async def extract_homework(self, page: Page, target_date: Optional[datetime] = None) -> List[Dict]:
         """Extract homework data by scraping the DOM table.
@@ -38,10 +132,6 @@ class WebtopExtractor:
         homework_list = []
 
         try:
-            # Wait for content to load
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(Delays.AFTER_PAGE_LOAD)
-
             # Get the target date (default to today)
             if target_date is None:
                 target_date = datetime.now()
@@ -49,21 +139,16 @@ class WebtopExtractor:
             # Format date in the format used on the page
             target_date_str = target_date.strftime(Selectors.DATE_FORMAT_DISPLAY)
 
-            # Check if we need to navigate through pagination
-            if not await self.pagination.find_date_on_page(page, target_date_str):
-                logger.info(f"Date {target_date_str} not on current page, attempting pagination")
-                # Try to navigate to the date using pagination
-                if not await self.pagination.navigate_to_date_page(page, target_date):
-                    logger.warning(f"Could not find date {target_date_str} after pagination")
+            # Repeated calls for the same date on the same page skip re-discovery
+            cache_key = (id(page), target_date_str)
+            target_heading = await self._cached_heading(page, cache_key)
+            if target_heading is not None:
+                logger.debug(f"Reusing cached heading for date {target_date_str}")
+            else:
+                target_heading = await self._discover_date_heading(page, target_date, target_date_str)
+                if not target_heading:
                     return homework_list
-                logger.info(f"Successfully navigated to page containing {target_date_str}")
-
-            # Find the heading and table for the target date
-            target_heading = await self._find_date_heading(page, target_date_str)
-            if not target_heading:
-                logger.warning(f"Could not find heading for date {target_date_str}")
-                return homework_list
-            logger.info(f"Found heading for date {target_date_str}")
+                self._cache_heading(page, cache_key, target_heading)
 
             # Find the table for this date
             table = await self._find_date_table(page, target_date_str, target_heading)
@@ -85,6 +170,140 @@ class WebtopExtractor:
             )
             return homework_list
 
+    async def _discover_date_heading(self, page: Page, target_date: datetime, target_date_str: str) -> Optional[Locator]:
+        """Bring the target date onto the page and find its heading.
+
+        Args:
+            page: Playwright page object
+            target_date: Date to find
+            target_date_str: Target date string in format "DD/MM/YYYY"
+
+        Returns:
+            Heading locator if found, None otherwise
+        """
+        # Wait for the date headings to be attached instead of network idle
+        try:
+            await self._headings(page).first.wait_for(state="attached")
+        except Exception as e:
+            logger.debug(f"Date headings not attached yet: {e}")
+        await self.navigator.wait_settled(page)
+
+        # Check if we need to navigate through pagination
+        if not await self.pagination.find_date_on_page(page, target_date_str):
+            logger.info(f"Date {target_date_str} not on current page, attempting pagination")
+            # Headings cached for this page belong to the week we are leaving
+            self._clear_heading_cache(page)
+            # Try to navigate to the date using pagination
+            if not await self.pagination.navigate_to_date_page(page, target_date):
+                logger.warning(f"Could not find date {target_date_str} after pagination")
+                return None
+            logger.info(f"Successfully navigated to page containing {target_date_str}")
+
+        # Find the heading for the target date
+        target_heading = await self._find_date_heading(page, target_date_str)
+        if not target_heading:
+            logger.warning(f"Could not find heading for date {target_date_str}")
+            return None
+        logger.info(f"Found heading for date {target_date_str}")
+        return target_heading
+
+    async def _cached_heading(self, page: Page, cache_key: Tuple[int, str]) -> Optional[Locator]:
+        """Return the cached heading for a date if it still shows that date.
+
+        The heading is addressed by position, so it is read back once before
+        use; a page that changed week without a navigation event is caught
+        here and the page's cache is dropped.
+        """
+        heading = self._heading_cache.get(cache_key)
+        if heading is None:
+            return None
+        try:
+            heading_text = await heading.text_content(timeout=Timeouts.ELEMENT_VISIBLE)
+        except Exception as e:
+            logger.debug(f"Cached heading for {cache_key[1]} is gone: {e}")
+            heading_text = None
+        if heading_text and cache_key[1] in heading_text:
+            return heading
+        self._clear_heading_cache(page)
+        return None
+
+    def _cache_heading(self, page: Page, cache_key: Tuple[int, str], heading: Locator):
+        """Remember a date heading until the page navigates, paginates or closes."""
+        self._watch_page(page)
+        self._heading_cache[cache_key] = heading
+
+    def _clear_heading_cache(self, page: Page):
+        """Forget every cached heading for the page."""
+        page_id = id(page)
+        for key in [key for key in self._heading_cache if key[0] == page_id]:
+            del self._heading_cache[key]
+
+    def _headings(self, page: Page) -> Locator:
+        """Return the locator over all date headings, built once per page."""
+        headings = self._heading_locators.get(id(page))
+        if headings is None:
+            headings = page.locator(Selectors.DATE_HEADING)
+            self._heading_locators[id(page)] = headings
+            self._watch_page(page)
+        return headings
+
+    def _watch_page(self, page: Page):
+        """Drop cached headings when the page navigates, and everything once it closes."""
+        page_id = id(page)
+        if page_id in self._watched_pages:
+            return
+        self._watched_pages.add(page_id)
+
+        def navigated(frame):
+            # Any main-frame navigation, including in-app route changes, can load another week
+            if frame.parent_frame is None:
+                self._clear_heading_cache(page)
+
+        def forget(_):
+            # Page ids can be reused once a page is gone
+            page.remove_listener("framenavigated", navigated)
+            self._clear_heading_cache(page)
+            self._heading_locators.pop(page_id, None)
+            self._watched_pages.discard(page_id)
+
+        page.on("framenavigated", navigated)
+        page.once("close", forget)
+
+    async def extract_homework_parallel(
+        self, browser: Browser, dates: List[datetime], storage_state: Dict, max_parallel: int = Config.MAX_PARALLEL_CONTEXTS
+    ) -> List[List[Dict]]:
+        """Extract homework for several dates concurrently, one context per date.
+
+        Each context starts from storage_state, so no date pays for a new
+        login. At most max_parallel contexts are open at the same time.
+
+        Args:
+            browser: Browser instance to open contexts in
+            dates: Dates to extract, in the order results should be returned
+            storage_state: State saved from a logged-in context
+                (``await context.storage_state()``)
+            max_parallel: Maximum number of contexts open at once
+
+        Returns:
+            One list of homework items per date, in the same order as dates
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def extract_date(target_date: datetime) -> List[Dict]:
+            async with semaphore:
+                context = await WebtopBrowser.create_context(browser, storage_state=storage_state)
+                try:
+                    await WebtopBrowser.block_static_assets(context)
+                    page = await WebtopBrowser.create_page(context)
+                    if not await self.navigator.open_homework(page):
+                        logger.warning(f"Could not navigate to homework page for {target_date.strftime(Selectors.DATE_FORMAT_DISPLAY)}")
+                        return []
+                    return await self.extract_homework(page, target_date)
+                finally:
+                    await context.close()
+
+        return list(await asyncio.gather(*(extract_date(target_date) for target_date in dates)))
+
     async def _find_date_heading(self, page: Page, target_date_str: str) -> Optional[Locator]:
         """Find the heading element for the target date.
 
@@ -95,12 +314,12 @@ class WebtopExtractor:
         Returns:
             Heading locator if found, None otherwise
         """
-        # Wait for page to be fully loaded and scroll to ensure all content is visible
-        await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
-
-        # Scroll to bottom to ensure all content is loaded (lazy loading)
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await page.wait_for_timeout(1000)  # Wait for any lazy-loaded content
+        # Scroll to bottom to ensure all content is loaded (lazy loading), then
+        # return once the browser is idle rather than after a fixed delay
+        try:
+            await page.evaluate(_SCROLL_TO_BOTTOM_JS)
+        except Exception as e:
+            logger.debug(f"Scroll to bottom failed: {e}")
 
         # Wait for date headings to be visible
         try:
@@ -113,23 +332,19 @@ class WebtopExtractor:
             # If selector doesn't match, continue anyway
             pass
 
-        headings = await page.locator(Selectors.DATE_HEADING).all()
-        for heading in headings:
-            # Scroll element into view to ensure it's loaded
-            try:
-                await heading.scroll_into_view_if_needed()
-                await page.wait_for_timeout(200)  # Small delay after scrolling
-            except Exception:
-                pass
-
-            heading_text = await heading.text_content()
-            if heading_text and target_date_str in heading_text:
-                return heading
+        # Read every heading's text in one round-trip, then address the match by index
+        headings = self._headings(page)
+        for index, heading_text in enumerate(await headings.all_text_contents()):
+            if target_date_str in heading_text:
+                return headings.nth(index)
         return None
 
     async def _find_date_table(self, page: Page, target_date_str: str, target_heading: Locator) -> Optional[Locator]:
         """Find the table element for the target date.
 
+        The lookup methods are independent, so they run concurrently and the
+        first one to find the table wins.
+
         Args:
             page: Playwright page object
             target_date_str: Target date string in format "DD/MM/YYYY"
@@ -138,14 +353,42 @@ class WebtopExtractor:
         Returns:
             Table locator if found, None otherwise
         """
-        # Scroll the heading into view first to ensure the table below it is loaded
+        # Scroll the heading into view once to ensure the table below it is loaded
         try:
             await target_heading.scroll_into_view_if_needed()
-            await page.wait_for_timeout(500)  # Wait for content to load after scrolling
         except Exception as e:
             logger.debug(f"Could not scroll heading into view: {e}")
 
-        # Method 1: Find table by aria-label
+        # Resolve the heading once and share it with the lookups below
+        try:
+            heading_element = await target_heading.element_handle()
+        except Exception as e:
+            logger.debug(f"Could not resolve heading for {target_date_str}: {e}")
+            heading_element = None
+
+        tasks = [
+            asyncio.create_task(self._find_by_aria(page, target_date_str)),
+            asyncio.create_task(self._find_by_heading_sibling(page, target_date_str, heading_element)),
+            asyncio.create_task(self._find_by_parent_card(page, target_date_str)),
+        ]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    table = task.result()
+                    if table is not None:
+                        return table
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        logger.warning(f"Could not find table for date {target_date_str}")
+        return None
+
+    async def _find_by_aria(self, page: Page, target_date_str: str) -> Optional[Locator]:
+        """Find the table by its aria-label (method 1)."""
         try:
             table_selector = Selectors.TABLE_ARIA_LABEL_PATTERN.format(date=target_date_str)
             table = page.locator(table_selector).first
@@ -154,98 +397,36 @@ class WebtopExtractor:
             return table
         except Exception as e:
             logger.debug(f"Method 1 (aria-label) failed for {target_date_str}: {e}")
+            return None
 
-        # Method 2: Find table after the heading (scroll to heading first)
+    async def _find_by_heading_sibling(self, page: Page, target_date_str: str, heading_element: Optional[ElementHandle]) -> Optional[Locator]:
+        """Find the table among all tables on the page (method 2)."""
         try:
-            # Scroll heading into view to ensure table below is loaded
-            await target_heading.scroll_into_view_if_needed()
-            await page.wait_for_timeout(1000)  # Wait for lazy-loaded content
-
             # Find all tables with role="table"
-            all_tables = await page.locator(Selectors.TABLE_SELECTOR).all()
-            heading_element = await target_heading.element_handle()
+            all_tables = page.locator(Selectors.TABLE_SELECTOR)
 
             if heading_element:
-                for tab in all_tables:
-                    # Scroll table into view to ensure it's loaded
-                    try:
-                        await tab.scroll_into_view_if_needed()
-                        await page.wait_for_timeout(300)
-                    except Exception:
-                        pass
-
-                    tab_aria = await tab.get_attribute("aria-label")
-                    if tab_aria and target_date_str in tab_aria:
+                # Read every table's aria-label in one round-trip
+                for index, tab_aria in enumerate(await all_tables.evaluate_all(_ARIA_LABELS_JS)):
+                    if target_date_str in tab_aria:
                         logger.debug(f"Found table by aria-label search for {target_date_str}")
-                        return tab
+                        return all_tables.nth(index)
         except Exception as e:
             logger.debug(f"Method 2 (heading-based search) failed for {target_date_str}: {e}")
+        return None
 
-        # Method 3: Find table by finding the parent card and then the table within it
+    async def _find_by_parent_card(self, page: Page, target_date_str: str) -> Optional[Locator]:
+        """Find the table inside the mat-card that contains the heading (method 3)."""
         try:
-            # Scroll heading into view first
-            await target_heading.scroll_into_view_if_needed()
-            await page.wait_for_timeout(1000)  # Wait for lazy-loaded content
-
-            # The table is inside a mat-card-content, find the card that contains our heading
-            # Find all mat-card elements and check which one contains our heading
-            all_cards = page.locator("mat-card")
-            card_count = await all_cards.count()
-            logger.debug(f"Found {card_count} mat-card elements")
-
-            for i in range(card_count):
-                card = all_cards.nth(i)
-                try:
-                    # Check if this card contains our heading by looking for the heading text
-                    heading_text = await target_heading.text_content()
-                    if heading_text:
-                        # Check if card contains a heading with our date
-                        heading_in_card = card.locator(f'span[role="heading"]:has-text("{target_date_str}")')
-                        if await heading_in_card.count() > 0:
-                            # Found the card, now find the table within it
-                            # Scroll the card into view to ensure table is loaded
-                            await card.scroll_into_view_if_needed()
-                            await page.wait_for_timeout(500)
-
-                            # Find table within the card
-                            table = card.locator('div[role="table"]').first
-                            if await table.count() > 0:
-                                await table.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
-                                logger.debug(f"Found table by parent card (method 3) for {target_date_str}")
-                                return table
-                except Exception as e:
-                    logger.debug(f"Error checking card {i}: {e}")
-                    continue
+            # The table is inside a mat-card-content; select the card holding our heading directly
+            card = page.locator(f'mat-card:has(span[role="heading"]:has-text("{target_date_str}"))').first
+            table = card.locator('div[role="table"]').first
+            await table.wait_for(state="attached", timeout=Timeouts.ELEMENT_VISIBLE)
+            logger.debug(f"Found table by parent card (method 3) for {target_date_str}")
+            return table
         except Exception as e:
             logger.debug(f"Method 3 (parent card) failed for {target_date_str}: {e}")
-
-        # Method 4: Find table by searching for div[role="table"] near the heading
-        try:
-            # Scroll heading into view
-            await target_heading.scroll_into_view_if_needed()
-            await page.wait_for_timeout(1000)
-
-            # Find all divs with role="table" and check their aria-label
-            all_tables = page.locator('div[role="table"]')
-            count = await all_tables.count()
-            logger.debug(f"Found {count} div[role='table'] elements")
-
-            for i in range(count):
-                table = all_tables.nth(i)
-                try:
-                    await table.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(300)
-                    aria_label = await table.get_attribute("aria-label")
-                    if aria_label and target_date_str in aria_label:
-                        logger.debug(f"Found table by div[role='table'] aria-label for {target_date_str}")
-                        return table
-                except Exception:
-                    continue
-        except Exception as e:
-            logger.debug(f"Method 4 (div role=table) failed for {target_date_str}: {e}")
-
-        logger.warning(f"Could not find table for date {target_date_str}")
-        return None
+            return None
 
     async def _extract_table_data(self, page: Page, table: Locator, target_date_str: str) -> List[Dict[str, any]]:
         """Extract homework data from the table."""
@@ -253,167 +434,54 @@ class WebtopExtractor:
 
         # Wait for table to be visible
         try:
-            await table.wait_for(state="visible", timeout=Timeouts.ELEMENT_WAIT)
+            await table.wait_for(state="visible")
         except Exception as e:
             logger.warning(f"Table found but not visible: {e}")
 
-        # Get all data rows (skip header)
-        rows = await table.locator(Selectors.TABLE_BODY_ROWS).all()
+        # Read every data row in a single round-trip instead of one call per cell
+        rows = await table.evaluate(_TABLE_ROWS_JS, _TABLE_ROWS_ARG)
         logger.debug(f"Found {len(rows)} data rows in table")
 
+        # Per-row debug messages are only formatted when they will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for row_idx, row in enumerate(rows):
-            cells = await row.locator(Selectors.TABLE_CELLS).all()
-            logger.debug(f"Row {row_idx} has {len(cells)} cells")
-
-            if len(cells) >= 6:
-                # Extract data from cells
-                hour = await self._extract_cell_text(cells[0])
-
-                # Subject is in a button/link within the second cell
-                subject = await self._extract_subject(cells[1])
-
-                teacher = await self._extract_cell_text(cells[2])
-                status = await self._extract_cell_text(cells[3])
-                lesson_topic = await self._extract_cell_text(cells[4])  # נושא שיעור
-                homework = await self._extract_cell_text(cells[5])  # שיעורי בית
-
-                # Check for attached files
-                attached_files = []
-                if len(cells) > 6:
-                    attached_files = await self._extract_attached_files(cells[6])
-
-                # Combine lesson topic and homework
-                combined = self._combine_content(lesson_topic, homework)
-
-                # Include row if it has a subject (even if lesson/homework are empty)
-                # This ensures we capture all lessons, including those with "טרם הוזנו נתונים"
-                if subject:
-                    homework_item = {
-                        "hour": hour,
-                        "subject": subject,
-                        "teacher": teacher,
-                        "lesson_topic": lesson_topic,
-                        "homework": homework,
-                        "combined": combined,
-                        "status": status,
-                        "attached_files": attached_files,
-                        "date": target_date_str,
-                    }
-                    homework_list.append(homework_item)
+            if row is None:
+                if debug_enabled:
+                    logger.debug(f"Skipping row {row_idx} - fewer than 6 cells")
+                continue
+
+            hour = row["hour"]
+            subject = row["subject"]
+            teacher = row["teacher"]
+            status = row["status"]
+            lesson_topic = row["lesson_topic"]  # נושא שיעור
+            homework = row["homework"]  # שיעורי בית
+            combined = row["combined"]
+            attached_files = row["attached_files"]
+
+            # Include row if it has a subject (even if lesson/homework are empty)
+            # This ensures we capture all lessons, including those with "טרם הוזנו נתונים"
+            if subject:
+                homework_item = {
+                    "hour": hour,
+                    "subject": subject,
+                    "teacher": teacher,
+                    "lesson_topic": lesson_topic,
+                    "homework": homework,
+                    "combined": combined,
+                    "status": status,
+                    "attached_files": attached_files,
+                    "date": target_date_str,
+                }
+                homework_list.append(homework_item)
+                if debug_enabled:
                     logger.debug(
                         f"Added homework item: {subject} - "
                         f"lesson: {lesson_topic[:50] if lesson_topic else '(empty)'}, "
                         f"homework: {homework[:50] if homework else '(empty)'}, "
                         f"status: {status}"
                     )
-                else:
-                    logger.debug(f"Skipping row {row_idx} - no subject found")
+            elif debug_enabled:
+                logger.debug(f"Skipping row {row_idx} - no subject found")
 
         return homework_list
-
-    async def _extract_cell_text(self, cell: Locator) -> str:
-        """Extract text content from a cell.
-
-        Args:
-            cell: Playwright locator for the cell
-
-        Returns:
-            Extracted text content, empty string on error
-        """
-        try:
-            # Get all text, including nested elements
-            text = await cell.text_content()
-            if text:
-                # Clean up the text - remove extra whitespace and newlines
-                text = " ".join(text.split())
-                # Remove common prefixes like "נושא שיעור: " and "שיעורי בית: "
-                text = text.replace("נושא שיעור:", "").replace("שיעורי בית:", "").strip()
-                # Handle edge cases like "-`" or other single-character placeholders
-                if text in ["-`", "-", "`", "--"]:
-                    text = ""
-            return text if text else ""
-        except Exception as e:
-            logger.debug(f"Error extracting cell text: {e}")
-            return ""
-
-    async def _extract_subject(self, subject_cell: Locator) -> str:
-        """Extract subject name from cell (may be in a button or link).
-
-        Args:
-            subject_cell: Playwright locator for the subject cell
-
-        Returns:
-            Subject name, empty string on error
-        """
-        try:
-            # Try to find button or link first
-            subject_btn = subject_cell.locator(Selectors.SUBJECT_BUTTON).first
-            if await subject_btn.count() > 0:
-                subject_text = await subject_btn.text_content()
-                if subject_text:
-                    return subject_text.strip()
-
-            # Fallback to cell text content
-            subject_text = await subject_cell.text_content()
-            if subject_text:
-                return subject_text.strip()
-            return ""
-        except Exception as e:
-            logger.debug(f"Error extracting subject: {e}")
-            return ""
-
-    async def _extract_attached_files(self, file_cell: Locator) -> List[Dict[str, str]]:
-        """Extract attached files (links and images) from cell.
-
-        Args:
-            file_cell: Playwright locator for the file attachment cell
-
-        Returns:
-            List of file dictionaries with type, href/src, and text/alt
-        """
-        attached_files: List[Dict[str, str]] = []
-
-        try:
-            # Check for links
-            file_links = await file_cell.locator(Selectors.FILE_LINKS).all()
-            for link in file_links:
-                try:
-                    href = await link.get_attribute("href")
-                    text_content = await link.text_content()
-                    text = text_content.strip() if text_content else ""
-                    if href:
-                        attached_files.append({"type": "link", "href": href, "text": text})
-                except Exception as e:
-                    logger.debug(f"Error extracting link: {e}")
-
-            # Check for images
-            file_imgs = await file_cell.locator(Selectors.FILE_IMAGES).all()
-            for img in file_imgs:
-                try:
-                    src = await img.get_attribute("src")
-                    alt_attr = await img.get_attribute("alt")
-                    alt = alt_attr.strip() if alt_attr else ""
-                    if src:
-                        attached_files.append({"type": "image", "src": src, "alt": alt})
-                except Exception as e:
-                    logger.debug(f"Error extracting image: {e}")
-        except Exception as e:
-            logger.debug(f"Error extracting attached files: {e}")
-
-        return attached_files
-
-    def _combine_content(self, lesson_topic: str, homework: str) -> str:
-        """Combine lesson topic and homework into a single string."""
-        combined_content = []
-        if lesson_topic and lesson_topic not in [
-            TextPatterns.EMPTY_LESSON_PLACEHOLDER,
-            "",
-        ]:
-            combined_content.append(lesson_topic)
-        if homework and homework not in [
-            "--",
-            TextPatterns.NO_HOMEWORK_PLACEHOLDER,
-            "",
-        ]:
-            combined_content.append(homework)
-        return " | ".join(combined_content) if combined_content else ""
@@ -2,16 +2,32 @@
 
 Handles navigation to homework pages.
 """
-import asyncio
 import logging
 
 from playwright.async_api import Page
 
 from .config import Config
-from .selectors import Delays, Selectors, Timeouts
+from .selectors import Selectors, Timeouts
+from .utils import first_match
 
 logger = logging.getLogger(__name__)
 
+# True once the document is complete and no new first-party resource has
+# finished since the previous poll; tracker requests are ignored. Entries are
+# cleared on every poll, so the resource timing buffer (250 entries by
+# default) never fills up and stops recording new requests.
+_PAGE_SETTLED_JS = """(domains) => {
+    if (document.readyState !== "complete") {
+        return false;
+    }
+    const finished = performance.getEntriesByType("resource").some((entry) => !domains.some((domain) => entry.name.includes(domain)));
+    performance.clearResourceTimings();
+    const settled = window.__webtopSettlePolled === true && !finished;
+    window.__webtopSettlePolled = true;
+    return settled;
+}"""
+_RESET_SETTLED_JS = "() => { delete window.__webtopSettlePolled; }"
+
 
 class WebtopNavigator:
     """Handles navigation within Webtop."""
@@ -38,9 +54,8 @@ class WebtopNavigator:
             True if navigation successful, False otherwise
         """
         try:
-            # Wait for page to load and ensure we're logged in
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(Delays.AFTER_PAGE_LOAD)
+            # Wait for the dashboard link we are about to click instead of network idle
+            await self._wait_for_element(page, Selectors.STUDENT_CARD_UNION)
 
             # Check if we're still logged in
             current_url = page.url
@@ -54,8 +69,8 @@ class WebtopNavigator:
             if not student_card_clicked:
                 # Try direct navigation
                 logger.debug("Direct navigation to Student Card...")
-                await page.goto(self.student_card_url, wait_until="networkidle")
-                await asyncio.sleep(Delays.EXTRA_LONG)
+                await page.goto(self.student_card_url, wait_until="domcontentloaded")
+                await self.wait_settled(page)
 
                 # Check if we were redirected to login
                 current_url = page.url
@@ -69,8 +84,8 @@ class WebtopNavigator:
             if not homework_clicked:
                 # Try direct navigation
                 logger.debug("Direct navigation to homework page...")
-                await page.goto(self.homework_url, wait_until="networkidle")
-                await asyncio.sleep(Delays.EXTRA_LONG)
+                await page.goto(self.homework_url, wait_until="domcontentloaded")
+                await self.wait_settled(page)
 
             # Verify we're on the homework page
             return await self._verify_homework_page(page)
@@ -79,6 +94,28 @@ class WebtopNavigator:
             logger.error(f"Navigation error: {e}", exc_info=True)
             return False
 
+    async def open_homework(self, page: Page) -> bool:
+        """
+        Open the homework section by URL.
+
+        Meant for a fresh page of an already logged-in context, which has no
+        dashboard to click through. Falls back to navigate_to_homework if the
+        URL does not land on the homework page.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            True if navigation successful, False otherwise
+        """
+        try:
+            await page.goto(self.homework_url, wait_until="domcontentloaded")
+            if await self._verify_homework_page(page):
+                return True
+        except Exception as e:
+            logger.debug(f"Direct navigation to homework page failed: {e}")
+        return await self.navigate_to_homework(page)
+
     async def _click_student_card(self, page: Page) -> bool:
         """Click on Student Card link.
 
@@ -89,28 +126,28 @@ class WebtopNavigator:
             True if clicked successfully, False otherwise
         """
         logger.info("Clicking on Student Card...")
-        for selector in Selectors.STUDENT_CARD_SELECTORS:
+        try:
+            # The preceding step already waited for this link, so an empty match fails fast
+            element = await first_match(page, Selectors.STUDENT_CARD_SELECTORS)
+            if element is None:
+                logger.debug("No Student Card link on the page")
+                return False
+            await element.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
+            await element.click()
             try:
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    await element.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
-                    await element.click()
-                    try:
-                        await page.wait_for_url(
-                            Selectors.STUDENT_CARD_URL_PATTERN,
-                            timeout=Timeouts.URL_WAIT,
-                        )
-                    except Exception as e:
-                        logger.debug(f"URL wait timeout: {e}")
-                    await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
-                    await asyncio.sleep(Delays.AFTER_PAGE_LOAD)
-                    logger.info("Successfully clicked Student Card")
-                    return True
+                await page.wait_for_url(
+                    Selectors.STUDENT_CARD_URL_PATTERN,
+                    timeout=Timeouts.URL_WAIT,
+                )
             except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
-        logger.debug("Could not click Student Card with any selector")
-        return False
+                logger.debug(f"URL wait timeout: {e}")
+            await self._wait_for_element(page, Selectors.HOMEWORK_UNION)
+            await self.wait_settled(page, reset=True)
+            logger.info("Successfully clicked Student Card")
+            return True
+        except Exception as e:
+            logger.debug(f"Could not click Student Card: {e}")
+            return False
 
     async def _click_homework_link(self, page: Page) -> bool:
         """Click on homework link.
@@ -122,28 +159,77 @@ class WebtopNavigator:
             True if clicked successfully, False otherwise
         """
         logger.info("Clicking on Lesson topics and homework...")
-        for selector in Selectors.HOMEWORK_SELECTORS:
+        try:
+            # The preceding step already waited for this link, so an empty match fails fast
+            element = await first_match(page, Selectors.HOMEWORK_SELECTORS)
+            if element is None:
+                logger.debug("No homework link on the page")
+                return False
+            await element.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
+            await element.click()
             try:
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    await element.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
-                    await element.click()
-                    try:
-                        await page.wait_for_url(
-                            Selectors.HOMEWORK_URL_PATTERN,
-                            timeout=Timeouts.URL_WAIT,
-                        )
-                    except Exception as e:
-                        logger.debug(f"URL wait timeout: {e}")
-                    await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
-                    await asyncio.sleep(Delays.AFTER_PAGE_LOAD)
-                    logger.info("Successfully clicked homework link")
-                    return True
+                await page.wait_for_url(
+                    Selectors.HOMEWORK_URL_PATTERN,
+                    timeout=Timeouts.URL_WAIT,
+                )
             except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
-        logger.debug("Could not click homework link with any selector")
-        return False
+                logger.debug(f"URL wait timeout: {e}")
+            await self._wait_for_element(page, Selectors.DATE_HEADING, state="attached")
+            await self.wait_settled(page, reset=True)
+            logger.info("Successfully clicked homework link")
+            return True
+        except Exception as e:
+            logger.debug(f"Could not click homework link: {e}")
+            return False
+
+    @staticmethod
+    async def wait_settled(page: Page, timeout: int = Timeouts.PAGE_SETTLE, reset: bool = False) -> bool:
+        """Wait until the page has loaded and its network activity has settled.
+
+        Replaces fixed post-load sleeps: returns as soon as the document is
+        complete and no new first-party resource finished within one poll
+        interval, and gives up quietly after timeout milliseconds.
+
+        Args:
+            page: Playwright page object
+            timeout: Maximum time to wait in milliseconds
+            reset: Forget earlier polls, so an in-page update
+                whose requests have not started yet cannot look settled
+
+        Returns:
+            True if the page settled, False if the wait timed out
+        """
+        try:
+            if reset:
+                await page.evaluate(_RESET_SETTLED_JS)
+            await page.wait_for_function(
+                _PAGE_SETTLED_JS,
+                arg=list(Selectors.FILTERED_DOMAINS),
+                polling=Timeouts.PAGE_SETTLE_POLL,
+                timeout=timeout,
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Page did not settle within {timeout}ms: {e}")
+            return False
+
+    async def _wait_for_element(self, page: Page, selector: str, state: str = "visible") -> bool:
+        """Wait for the first element the next navigation step depends on.
+
+        Args:
+            page: Playwright page object
+            selector: Selector of the element to wait for
+            state: Element state to wait for
+
+        Returns:
+            True if the element reached the state, False on timeout
+        """
+        try:
+            await page.locator(selector).first.wait_for(state=state, timeout=Timeouts.ELEMENT_VISIBLE)
+            return True
+        except Exception as e:
+            logger.debug(f"Element {selector} not {state}: {e}")
+            return False
 
     async def _verify_homework_page(self, page: Page) -> bool:
         """Verify we're on the homework page.
@@ -167,9 +253,11 @@ class WebtopNavigator:
         else:
             logger.warning(f"Expected Student_Card/11, but got: {current_url}")
             try:
-                await page.wait_for_selector("h2, table", timeout=Timeouts.ELEMENT_VISIBLE)
-                logger.debug("Found page content, assuming navigation successful")
-                return True
+                # A presence check is enough here, so skip the selector wait subscription
+                present = await page.evaluate("() => !!document.querySelector('h2, table')")
             except Exception as e:
                 logger.debug(f"Could not verify page content: {e}")
                 return False
+            if present:
+                logger.debug("Found page content, assuming navigation successful")
+            return present
@@ -2,7 +2,6 @@
 
 Handles navigation through paginated homework pages.
 """
-import asyncio
 import logging
 import re
 from datetime import datetime
@@ -11,10 +10,114 @@ from typing import List, Optional, Tuple
 from playwright.async_api import Locator, Page
 
 from .config import Config
-from .selectors import Delays, Selectors, Timeouts
+from .navigator import WebtopNavigator
+from .selectors import Selectors, Timeouts
 
 logger = logging.getLogger(__name__)
 
+# Return every heading's text. Unless a rendered heading already contains the
+# target text, first scroll to the bottom so lazily rendered days load, wait
+# until the DOM has gone quiet (no mutation for quietMs, at most maxMs; a fully
+# loaded page returns after one quiet period) and scroll back to the top
+_COLLECT_HEADING_TEXTS_JS = """async ({ selector, target, quietMs, maxMs }) => {
+    const readTexts = () => Array.from(document.querySelectorAll(selector), (heading) => heading.textContent || "");
+    const rendered = readTexts();
+    if (target && rendered.some((text) => text.includes(target))) {
+        return rendered;
+    }
+    window.scrollTo(0, document.body.scrollHeight);
+    await new Promise((resolve) => {
+        let quiet = null;
+        let cap = null;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(done, quietMs);
+        });
+        function done() {
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(cap);
+            resolve();
+        }
+        observer.observe(document.body, { childList: true, subtree: true });
+        quiet = setTimeout(done, quietMs);
+        cap = setTimeout(done, maxMs);
+    });
+    window.scrollTo(0, 0);
+    return readTexts();
+}"""
+
+
+_FORWARD_BUTTON_SELECTORS = (
+    # Webtop-specific: Next week button in toolbar (most specific, highest priority)
+    "#main app-multi-cards-view app-lesson-homework app-lesson-homework-view app-tool-bar span:nth-child(3) > a",
+    "app-tool-bar span:nth-child(3) > a",
+    "app-tool-bar div > div > span:nth-child(3) > a",
+    "#main app-tool-bar span:nth-child(3) > a",
+    # Webtop-specific: Next week button with mat-icon
+    'a[role="button"]:has-text("שבוע הבא")',
+    'a[role="button"]:has(mat-icon[svgicon="navigate_next"])',
+    'a:has(mat-icon[svgicon="navigate_next"])',
+    'a.link-text:has(mat-icon[svgicon="navigate_next"])',
+    # Generic selectors (fallback)
+    *Selectors.NEXT_BUTTON_SELECTORS,
+)
+_BACKWARD_BUTTON_SELECTORS = (
+    # Webtop-specific: Previous week button in toolbar (most specific, highest priority)
+    "#main app-multi-cards-view app-lesson-homework app-lesson-homework-view app-tool-bar span:nth-child(1) > a",
+    "app-tool-bar span:nth-child(1) > a",
+    "app-tool-bar div > div > span:nth-child(1) > a",
+    "#main app-tool-bar span:nth-child(1) > a",
+    # Webtop-specific: Previous week button with mat-icon
+    'a[role="button"]:has-text("שבוע קודם")',
+    'a[role="button"]:has(mat-icon[svgicon="navigate_before"])',
+    'a:has(mat-icon[svgicon="navigate_before"])',
+    'a.link-text:has(mat-icon[svgicon="navigate_before"])',
+    # Generic selectors (fallback)
+    *Selectors.PREV_BUTTON_SELECTORS,
+)
+
+# Playwright's :has-text() is not CSS, so it is split off and matched as text in the page
+_HAS_TEXT_RE = re.compile(r'^(.*):has-text\("(.*)"\)$')
+
+
+def _to_dom_query(selector: str) -> List[str]:
+    """Split a selector into a plain CSS selector and the text it must contain.
+
+    Args:
+        selector: Playwright selector, optionally ending in :has-text("...")
+
+    Returns:
+        [css, text] pair; text is empty when the selector has no text filter
+    """
+    match = _HAS_TEXT_RE.match(selector)
+    return [match.group(1), match.group(2)] if match else [selector, ""]
+
+
+_FORWARD_BUTTON_QUERIES = [_to_dom_query(selector) for selector in _FORWARD_BUTTON_SELECTORS]
+_BACKWARD_BUTTON_QUERIES = [_to_dom_query(selector) for selector in _BACKWARD_BUTTON_SELECTORS]
+
+# Index of the first selector whose first match is visible and not disabled
+# (disabled attribute, aria-disabled or Webtop's "empty" class), or -1
+_FIRST_USABLE_BUTTON_JS = """(queries) => {
+    for (let i = 0; i < queries.length; i++) {
+        const [css, text] = queries[i];
+        let candidates;
+        try {
+            candidates = Array.from(document.querySelectorAll(css));
+        } catch (e) {
+            continue;
+        }
+        const el = candidates.find((candidate) => !text || (candidate.textContent || "").includes(text));
+        if (!el) continue;
+        if (el.getClientRects().length === 0 || getComputedStyle(el).visibility === "hidden") continue;
+        if (el.hasAttribute("disabled") || el.getAttribute("aria-disabled") === "true") continue;
+        if (el.classList.contains("empty")) continue;
+        return i;
+    }
+    return -1;
+}"""
+
 
 class WebtopPagination:
     """Handles pagination to find specific dates."""
@@ -30,47 +133,8 @@ class WebtopPagination:
         Returns:
             True if date is found on page, False otherwise
         """
-        try:
-            # Wait for page to be fully loaded and scroll to ensure all content is visible
-            await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
-
-            # Scroll to bottom to ensure all content is loaded (lazy loading)
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(1000)  # Wait for any lazy-loaded content
-
-            # Scroll back to top
-            await page.evaluate("window.scrollTo(0, 0)")
-            await page.wait_for_timeout(500)
-
-            # Wait for date headings to be visible
-            try:
-                await page.wait_for_selector(
-                    Selectors.DATE_HEADING,
-                    state="visible",
-                    timeout=Timeouts.ELEMENT_VISIBLE,
-                )
-            except Exception:
-                # If selector doesn't match, continue anyway
-                pass
-
-            headings = await page.locator(Selectors.DATE_HEADING).all()
-            for heading in headings:
-                # Scroll element into view to ensure it's loaded
-                try:
-                    await heading.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(200)  # Small delay after scrolling
-                except Exception:
-                    pass
-
-                heading_text = await heading.text_content()
-                if heading_text and target_date_str in heading_text:
-                    logger.info(f"Found date {target_date_str} on page")
-                    return True
-            logger.debug(f"Date {target_date_str} not found on current page")
-            return False
-        except Exception as e:
-            logger.debug(f"Error finding date on page: {e}")
-            return False
+        found, _ = await self._scan_page(page, target_date_str)
+        return found
 
     async def get_dates_on_page(self, page: Page) -> List[datetime]:
         """
@@ -82,51 +146,99 @@ class WebtopPagination:
         Returns:
             List of datetime objects for dates found on page
         """
+        _, dates = await self._scan_page(page)
+        return sorted(dates)
+
+    async def _scan_page(self, page: Page, target_date_str: Optional[str] = None) -> Tuple[bool, List[datetime]]:
+        """Look for the target date and collect the page's dates in one pass.
+
+        Args:
+            page: Playwright page object
+            target_date_str: Date string in format "DD/MM/YYYY", or None to
+                only collect dates
+
+        Returns:
+            Tuple of (whether the target date is on the page, dates on the
+            page in heading order)
+        """
+        found = False
         dates = []
         try:
-            # Wait for page to be fully loaded and scroll to ensure all content is visible
-            await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
+            # Wait for page to be fully loaded
+            await self._wait_settled(page)
+
+            search_date = Selectors.DATE_REGEX.search  # Bound once for the whole heading loop
+            for heading_text in await self._collect_heading_texts(page, target_date_str):
+                if target_date_str and target_date_str in heading_text:
+                    found = True
+                # Extract date from heading format:
+                # "יום רביעי | 21/01/2026 | ג׳ שְׁבָט תשפ״ו"
+                date_match = search_date(heading_text)
+                if date_match:
+                    day, month, year = date_match.groups()
+                    try:
+                        date_obj = datetime(int(year), int(month), int(day))
+                        dates.append(date_obj)
+                    except (ValueError, TypeError) as e:
+                        logger.debug(f"Error parsing date from heading '{heading_text}': {e}")
+        except Exception as e:
+            logger.debug(f"Error scanning dates on page: {e}")
+        if target_date_str:
+            if found:
+                logger.info(f"Found date {target_date_str} on page")
+            else:
+                logger.debug(f"Date {target_date_str} not found on current page")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(dates)} dates on page: {[d.strftime('%d/%m/%Y') for d in sorted(dates)]}")
+        return found, dates
 
-            # Scroll to bottom to ensure all content is loaded (lazy loading)
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(1000)  # Wait for any lazy-loaded content
+    async def _collect_heading_texts(self, page: Page, target_date_str: Optional[str] = None) -> List[str]:
+        """Load every date heading on the page and return their texts.
 
-            # Wait for date headings to be visible
-            try:
-                await page.wait_for_selector(
-                    Selectors.DATE_HEADING,
-                    state="visible",
-                    timeout=Timeouts.ELEMENT_VISIBLE,
-                )
-            except Exception:
-                # If selector doesn't match, continue anyway
-                pass
-
-            headings = await page.locator(Selectors.DATE_HEADING).all()
-            for heading in headings:
-                # Scroll element into view to ensure it's loaded
-                try:
-                    await heading.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(200)  # Small delay after scrolling
-                except Exception:
-                    pass
-
-                heading_text = await heading.text_content()
-                if heading_text:
-                    # Extract date from heading format:
-                    # "יום רביעי | 21/01/2026 | ג׳ שְׁבָט תשפ״ו"
-                    date_match = re.search(Selectors.DATE_REGEX_PATTERN, heading_text)
-                    if date_match:
-                        day, month, year = date_match.groups()
-                        try:
-                            date_obj = datetime(int(year), int(month), int(day))
-                            dates.append(date_obj)
-                        except (ValueError, TypeError) as e:
-                            logger.debug(f"Error parsing date from heading '{heading_text}': {e}")
+        Args:
+            page: Playwright page object
+            target_date_str: Skip the lazy-load scroll when an already rendered
+                heading contains this text
+
+        Returns:
+            Text content of each date heading, in document order
+        """
+        # Wait for date headings to be visible
+        try:
+            await page.wait_for_selector(
+                Selectors.DATE_HEADING,
+                state="visible",
+                timeout=Timeouts.ELEMENT_VISIBLE,
+            )
+        except Exception:
+            # If selector doesn't match, continue anyway
+            pass
+
+        # Scroll, settle and read all headings in a single round-trip
+        return await page.evaluate(
+            _COLLECT_HEADING_TEXTS_JS,
+            {
+                "selector": Selectors.DATE_HEADING,
+                "target": target_date_str,
+                "quietMs": Timeouts.LAZY_LOAD_QUIET,
+                "maxMs": Timeouts.LAZY_LOAD_MAX,
+            },
+        )
+
+    async def _wait_settled(self, page: Page, after_action: bool = False) -> None:
+        """Wait for the page to settle, with networkidle as a short fallback.
+
+        Args:
+            page: Playwright page object
+            after_action: True right after a click, so the settle poll starts
+                fresh instead of trusting counts from before the click
+        """
+        if await WebtopNavigator.wait_settled(page, reset=after_action):
+            return
+        try:
+            await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE_FALLBACK)
         except Exception as e:
-            logger.debug(f"Error getting dates from page: {e}")
-        logger.debug(f"Found {len(dates)} dates on page: {[d.strftime('%d/%m/%Y') for d in sorted(dates)]}")
-        return sorted(dates)
+            logger.debug(f"Network did not go idle: {e}")
 
     async def navigate_to_date_page(self, page: Page, target_date: datetime) -> bool:
         """Navigate through pagination to find the target date page.
@@ -144,22 +256,27 @@ class WebtopPagination:
         target_date_str = target_date.strftime(Selectors.DATE_FORMAT_DISPLAY)
         max_pages = Config.MAX_PAGINATION_PAGES
         pages_checked = 0
-        visited_pages = set()
-
-        # First check if date is already on current page
-        if await self.find_date_on_page(page, target_date_str):
+        # Pages are identified by their date range: the SPA keeps one URL
+        # while paging through weeks. Each direction keeps its own set, so a
+        # flip never forgets what was already seen
+        visited_pages = {"forward": set(), "backward": set()}
+
+        # First check if date is already on current page, collecting its
+        # dates in the same pass to determine navigation direction
+        found, current_dates = await self._scan_page(page, target_date_str)
+        if found:
             logger.info(f"Target date {target_date_str} found on current page")
             return True
 
         logger.info(f"Target date {target_date_str} not on current page, searching through pagination...")
+        current_range = self._date_range(current_dates)
+        page_key = self._page_key(page, current_range)
 
-        # Get dates on current page to determine navigation direction
-        current_dates = await self.get_dates_on_page(page)
-        if current_dates:
-            if target_date < current_dates[0]:
+        if current_range:
+            if target_date < current_range[0]:
                 logger.info("Target date is older than current page, navigating backwards...")
                 direction = "backward"
-            elif target_date > current_dates[-1]:
+            elif target_date > current_range[1]:
                 logger.info("Target date is newer than current page, navigating forwards...")
                 direction = "forward"
             else:
@@ -173,44 +290,53 @@ class WebtopPagination:
         while pages_checked < max_pages:
             pages_checked += 1
 
-            current_url = page.url
-            if current_url in visited_pages:
+            visited = visited_pages[direction]
+            if page_key in visited:
                 logger.debug("Already visited this page, trying opposite direction or stopping")
                 if direction == "forward":
                     direction = "backward"
-                    visited_pages.clear()
                     continue
                 else:
                     logger.debug("Already visited page in both directions, stopping")
                     break
-            visited_pages.add(current_url)
+            visited.add(page_key)
+            if len(visited) > max_pages // 2:
+                logger.debug(f"Visited {len(visited)} pages {direction}, stopping")
+                break
 
-            # Get navigation button based on direction
+            # Get navigation button based on direction. The current page was
+            # already scanned, before the loop or right after the last click
             nav_button = await self._find_navigation_button(page, direction)
 
-            # Check current page again
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(Delays.LONG)
-
-            if await self.find_date_on_page(page, target_date_str):
-                logger.info(f"Target date {target_date_str} found after navigating")
-                return True
-
             # Click navigation button if found
             if nav_button:
-                found, new_direction = await self._click_navigation_button(page, nav_button, direction, pages_checked, target_date)
+                found, new_direction, new_page_key = await self._click_navigation_button(
+                    page, nav_button, direction, pages_checked, target_date, target_date_str
+                )
                 if found:
                     return True
+                previous_page_key, page_key = page_key, new_page_key
                 if new_direction != direction:
                     direction = new_direction
-                    visited_pages.clear()
                     continue
+
+                # The step just taken shows how many days a page spans, so the
+                # pages short of the target are clicked through without scanning
+                skip = self._pages_to_skip(previous_page_key, page_key, target_date, direction)
+                skip = min(skip, max_pages - pages_checked)
+                if skip > 0:
+                    logger.info(f"Skipping {skip} pages {direction} towards {target_date_str}")
+                    pages_checked += await self._advance_pages(page, direction, skip)
+                    found, dates = await self._scan_page(page, target_date_str)
+                    if found:
+                        logger.info(f"Target date {target_date_str} found after {pages_checked} navigation steps")
+                        return True
+                    page_key = self._page_key(page, self._date_range(dates))
             else:
                 # Try switching direction or stop
                 if direction == "forward":
                     logger.debug("No forward button found, trying backward navigation...")
                     direction = "backward"
-                    visited_pages.clear()
                     continue
                 else:
                     logger.debug("No navigation button found, reached end of pagination")
@@ -233,7 +359,6 @@ class WebtopPagination:
         # The buttons are in the toolbar at the top of the page
         try:
             await page.evaluate("window.scrollTo(0, 0)")
-            await page.wait_for_timeout(500)  # Wait for scroll to complete
             logger.debug("Scrolled to top to find navigation buttons")
 
             # Wait for toolbar to be visible
@@ -245,99 +370,18 @@ class WebtopPagination:
         except Exception as e:
             logger.debug(f"Error scrolling to top: {e}")
 
-        if direction == "forward":
-            button_selectors = [
-                # Webtop-specific: Next week button in toolbar (most specific, highest priority)
-                "#main app-multi-cards-view app-lesson-homework app-lesson-homework-view app-tool-bar span:nth-child(3) > a",
-                "app-tool-bar span:nth-child(3) > a",
-                "app-tool-bar div > div > span:nth-child(3) > a",
-                "#main app-tool-bar span:nth-child(3) > a",
-                # Webtop-specific: Next week button with mat-icon
-                'a[role="button"]:has-text("שבוע הבא")',
-                'a[role="button"]:has(mat-icon[svgicon="navigate_next"])',
-                'a:has(mat-icon[svgicon="navigate_next"])',
-                'a.link-text:has(mat-icon[svgicon="navigate_next"])',
-                # Generic selectors (fallback)
-                'button:has-text("הבא")',
-                'button:has-text("Next")',
-                'a:has-text("הבא")',
-                'a:has-text("Next")',
-                '[aria-label*="הבא"]',
-                '[aria-label*="Next"]',
-                'button[aria-label*="הבא"]',
-                ".pagination button:last-child",
-                ".pagination a:last-child",
-                '[class*="next"]',
-                '[class*="Next"]',
-            ]
-        else:  # backward
-            button_selectors = [
-                # Webtop-specific: Previous week button in toolbar (most specific, highest priority)
-                "#main app-multi-cards-view app-lesson-homework app-lesson-homework-view app-tool-bar span:nth-child(1) > a",
-                "app-tool-bar span:nth-child(1) > a",
-                "app-tool-bar div > div > span:nth-child(1) > a",
-                "#main app-tool-bar span:nth-child(1) > a",
-                # Webtop-specific: Previous week button with mat-icon
-                'a[role="button"]:has-text("שבוע קודם")',
-                'a[role="button"]:has(mat-icon[svgicon="navigate_before"])',
-                'a:has(mat-icon[svgicon="navigate_before"])',
-                'a.link-text:has(mat-icon[svgicon="navigate_before"])',
-                # Generic selectors (fallback)
-                'button:has-text("הקודם")',
-                'button:has-text("Previous")',
-                'button:has-text("קודם")',
-                'a:has-text("הקודם")',
-                'a:has-text("Previous")',
-                'a:has-text("קודם")',
-                '[aria-label*="הקודם"]',
-                '[aria-label*="Previous"]',
-                '[aria-label*="קודם"]',
-                'button[aria-label*="הקודם"]',
-                ".pagination button:first-child",
-                ".pagination a:first-child",
-                '[class*="prev"]',
-                '[class*="Prev"]',
-                '[class*="previous"]',
-            ]
-
-        for selector in button_selectors:
-            try:
-                btn = page.locator(selector).first
-                count = await btn.count()
-                logger.debug(f"Trying selector '{selector}': found {count} elements")
-
-                if count > 0:
-                    is_visible = await btn.is_visible()
-                    logger.debug(f"  Element visible: {is_visible}")
-
-                    # For <a role="button">, check if it's disabled by checking for 'empty' class or disabled attribute
-                    is_disabled = await btn.get_attribute("disabled")
-                    aria_disabled = await btn.get_attribute("aria-disabled")
+        button_selectors = _FORWARD_BUTTON_SELECTORS if direction == "forward" else _BACKWARD_BUTTON_SELECTORS
+        queries = _FORWARD_BUTTON_QUERIES if direction == "forward" else _BACKWARD_BUTTON_QUERIES
+        try:
+            index = await page.evaluate(_FIRST_USABLE_BUTTON_JS, queries)
+        except Exception as e:
+            logger.debug(f"Navigation button lookup failed: {e}")
+            index = -1
 
-                    # Check if the link has the 'empty' class (which indicates it's disabled in Webtop)
-                    has_empty_class = False
-                    try:
-                        class_attr = await btn.get_attribute("class")
-                        if class_attr:
-                            logger.debug(f"  Element class: {class_attr}")
-                            if "empty" in class_attr:
-                                has_empty_class = True
-                                logger.debug("  Element has 'empty' class - disabled")
-                    except Exception as e:
-                        logger.debug(f"  Could not get class attribute: {e}")
-
-                    if is_visible and not is_disabled and aria_disabled != "true" and not has_empty_class:
-                        logger.info(f"Found {direction} navigation button with selector: {selector}")
-                        return btn
-                    else:
-                        logger.debug(
-                            f"  Button not usable: visible={is_visible}, "
-                            f"disabled={is_disabled}, aria_disabled={aria_disabled}, "
-                            f"has_empty_class={has_empty_class}"
-                        )
-            except Exception as e:
-                logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+        if index >= 0:
+            selector = button_selectors[index]
+            logger.info(f"Found {direction} navigation button with selector: {selector}")
+            return page.locator(selector).first
         logger.warning(f"No {direction} navigation button found after trying {len(button_selectors)} selectors")
         return None
 
@@ -348,16 +392,20 @@ class WebtopPagination:
         direction: str,
         pages_checked: int,
         target_date: datetime,
-    ) -> Tuple[bool, str]:
-        """Click navigation button and check if target date is found."""
-        target_date_str = target_date.strftime(Selectors.DATE_FORMAT_DISPLAY)
+        target_date_str: str,
+    ) -> Tuple[bool, str, Tuple]:
+        """Click navigation button and check if target date is found.
+
+        Returns:
+            Tuple of (found, direction to continue in, key of the page landed on)
+        """
+        new_range = None
         try:
             direction_text = "forward" if direction == "forward" else "backward"
             logger.info(f"Clicking {direction_text} button (attempt {pages_checked})...")
 
             # Scroll button into view and wait for it to be ready
             await nav_button.scroll_into_view_if_needed()
-            await page.wait_for_timeout(300)  # Small delay after scrolling
 
             # Wait for button to be visible and enabled
             await nav_button.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
@@ -370,21 +418,21 @@ class WebtopPagination:
                 await nav_button.click(force=True, timeout=Timeouts.ELEMENT_VISIBLE)
 
             # Wait for page to update after click
-            await page.wait_for_load_state("networkidle", timeout=Timeouts.NETWORK_IDLE)
-            await asyncio.sleep(Delays.AFTER_PAGE_LOAD)
+            await self._wait_settled(page, after_action=True)
 
-            # Check if date is now on page
-            if await self.find_date_on_page(page, target_date_str):
+            # Check if date is now on page, collecting the new dates in the same pass
+            found, new_dates = await self._scan_page(page, target_date_str)
+            new_range = self._date_range(new_dates)
+            if found:
                 logger.info(f"Target date {target_date_str} found after {pages_checked} navigation steps")
-                return True, direction
+                return True, direction, self._page_key(page, new_range)
 
             # Update direction if needed based on new dates on page
-            new_dates = await self.get_dates_on_page(page)
-            if new_dates:
-                if target_date < new_dates[0] and direction == "forward":
+            if new_range:
+                if target_date < new_range[0] and direction == "forward":
                     logger.debug("Switching to backward navigation")
                     direction = "backward"
-                elif target_date > new_dates[-1] and direction == "backward":
+                elif target_date > new_range[1] and direction == "backward":
                     logger.debug("Switching to forward navigation")
                     direction = "forward"
         except Exception as e:
@@ -393,4 +441,78 @@ class WebtopPagination:
                 direction = "backward"
             else:
                 direction = "forward"
-        return False, direction
+        return False, direction, self._page_key(page, new_range)
+
+    @staticmethod
+    def _pages_to_skip(previous_page_key: Tuple, page_key: Tuple, target_date: datetime, direction: str) -> int:
+        """Estimate how many pages can be passed without scanning them.
+
+        Args:
+            previous_page_key: Key of the page before the last step
+            page_key: Key of the current page
+            target_date: Date being searched for
+            direction: "forward" or "backward"
+
+        Returns:
+            Number of pages to click through before the page expected to hold
+            the target date; 0 when the stride is unknown
+        """
+        if len(previous_page_key) != 2 or len(page_key) != 2:
+            return 0
+        # The larger of the two deltas, so that a week with a missing first or
+        # last day never overshoots the target
+        stride = max(abs((page_key[0] - previous_page_key[0]).days), abs((page_key[1] - previous_page_key[1]).days))
+        gap = (target_date - page_key[1]).days if direction == "forward" else (page_key[0] - target_date).days
+        if stride == 0 or gap <= 0:
+            return 0
+        return -(-gap // stride) - 1
+
+    async def _advance_pages(self, page: Page, direction: str, count: int) -> int:
+        """Click the navigation button count times, waiting only for the page to settle.
+
+        Args:
+            page: Playwright page object
+            direction: "forward" or "backward"
+            count: Number of pages to advance
+
+        Returns:
+            Number of pages actually advanced
+        """
+        advanced = 0
+        for _ in range(count):
+            nav_button = await self._find_navigation_button(page, direction)
+            if nav_button is None:
+                break
+            try:
+                await nav_button.click(timeout=Timeouts.ELEMENT_VISIBLE)
+            except Exception as e:
+                logger.debug(f"Could not advance {direction}: {e}")
+                break
+            await self._wait_settled(page, after_action=True)
+            advanced += 1
+        return advanced
+
+    @staticmethod
+    def _date_range(dates: List[datetime]) -> Optional[Tuple[datetime, datetime]]:
+        """Return the earliest and latest of dates without sorting them.
+
+        Args:
+            dates: Dates found on a page, in any order
+
+        Returns:
+            (earliest, latest), or None when there are no dates
+        """
+        return (min(dates), max(dates)) if dates else None
+
+    @staticmethod
+    def _page_key(page: Page, date_range: Optional[Tuple[datetime, datetime]]) -> Tuple:
+        """Identify a pagination page by its date range.
+
+        Args:
+            page: Playwright page object
+            date_range: (earliest, latest) date on the page, or None
+
+        Returns:
+            (first date, last date), or (page URL,) when the page shows no dates
+        """
+        return date_range if date_range else (page.url,)
@@ -2,11 +2,19 @@
 
 Coordinates authentication, navigation, and extraction.
 """
+
 import logging
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from playwright.async_api import async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
 
 from .auth import WebtopAuth
 from .browser import WebtopBrowser
@@ -14,38 +22,111 @@ from .config import Config
 from .extractor import WebtopExtractor
 from .navigator import WebtopNavigator
 from .selectors import Selectors
+from .session_cache import WebtopSessionCache
 from .utils import parse_date
 
 logger = logging.getLogger(__name__)
 
 
 class WebtopScraper:
-    """Main scraper class for Webtop homework system."""
+    """Main scraper class for Webtop homework system.
+
+    Each get_today_homework call launches a browser and logs in on its own.
+    To look up several dates with a single login, use the scraper as an
+    async context manager:
+
+        async with WebtopScraper() as scraper:
+            for date in ["20-01-2026", "21-01-2026"]:
+                homework = await scraper.get_today_homework(date=date)
+
+    When WEBTOP_SESSION_FILE is set, the logged-in session is saved there
+    and later runs start from it, logging in again only once it expires.
+    """
 
-    def __init__(self):
+    def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
         """Initialize the scraper.
 
         Sets up authentication, navigation, and extraction components.
+
+        Args:
+            username: Ministry of Education username; defaults to Config.USERNAME
+            password: Ministry of Education password; defaults to Config.PASSWORD
         """
-        self.username = Config.USERNAME
-        self.password = Config.PASSWORD
+        self.username = username if username is not None else Config.USERNAME
+        self.password = password if password is not None else Config.PASSWORD
         self.auth = WebtopAuth(self.username, self.password)
         self.navigator = WebtopNavigator()
         self.extractor = WebtopExtractor()
+        self.session_cache = WebtopSessionCache(Config.SESSION_FILE) if Config.SESSION_FILE else None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._page: Optional[Page] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+    async def __aenter__(self) -> "WebtopScraper":
+        """Launch the browser and log in once for the whole session.
+
+        Returns:
+            The scraper, with a logged-in page ready for lookups
+        """
+        self._check_credentials()
+        # Everything opened so far is released in reverse order if login fails
+        async with AsyncExitStack() as stack:
+            playwright = await stack.enter_async_context(async_playwright())
+            self._browser, self._context, self._page = await self._open_session(stack, playwright)
+            self._exit_stack = stack.pop_all()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the browser session and stop Playwright."""
+        stack, self._exit_stack = self._exit_stack, None
+        self._page = None
+        self._context = None
+        self._browser = None
+        if stack is not None:
+            await self._close(stack)
+
+    @staticmethod
+    async def _close(stack: AsyncExitStack) -> None:
+        """Release a session's page, context, browser and Playwright."""
+        try:
+            await stack.aclose()
+        except Exception as cleanup_error:
+            logger.debug(f"Error during cleanup: {cleanup_error}")
+
+    @asynccontextmanager
+    async def _one_shot_session(self) -> AsyncIterator[Tuple[Browser, BrowserContext, Page]]:
+        """Open a logged-in session for a single call outside ``async with``.
+
+        The session lives only in this call's locals, so concurrent calls on
+        one scraper each get and close their own browser.
+
+        Yields:
+            Tuple of (browser, context, logged-in page)
+        """
+        stack = AsyncExitStack()
+        try:
+            playwright = await stack.enter_async_context(async_playwright())
+            yield await self._open_session(stack, playwright)
+        finally:
+            await self._close(stack)
 
-    async def get_today_homework(self, date: Optional[str] = None) -> List[Dict]:
+    async def get_today_homework(self, date: Optional[Union[str, datetime]] = None) -> List[Dict]:
         """
         Get homework for a specific date or today.
 
+        Reuses the logged-in page when called inside ``async with``;
+        otherwise launches a browser and logs in just for this call.
+
         Args:
             date: Optional date string in format "DD-MM-YYYY"
-                (e.g., "21-01-2026"). If None, uses today's date.
+                (e.g., "21-01-2026") or a datetime, which is used without
+                parsing. If None, uses today's date.
 
         Returns:
             List of homework items for the specified date
         """
-        if not self.username or not self.password:
-            raise ValueError("MINISTRY_OF_EDUCATION_USERNAME and MINISTRY_OF_EDUCATION_PASSWORD must be set in environment variables")
+        self._check_credentials()
 
         # Parse the date if provided
         target_date: Optional[datetime] = None
@@ -56,63 +137,163 @@ class WebtopScraper:
             target_date = datetime.now()
             logger.info(f"Fetching homework for today: {target_date.strftime(Selectors.DATE_FORMAT_DISPLAY)}")
 
-        # Use async context manager for Playwright
-        async with async_playwright() as playwright:
-            browser = None
-            context = None
-            try:
-                logger.info("Launching browser...")
-                browser = await WebtopBrowser.launch_browser(playwright)
-
-                context = await WebtopBrowser.create_context(browser)
-                page = await WebtopBrowser.create_page(context)
-
-                # Login
-                logger.info("Attempting login...")
-                logger.debug(f"Username configured: {bool(self.username)}")
-                if not self.username or not self.password:
-                    raise ValueError(
-                        "Credentials not configured. "
-                        "Set MINISTRY_OF_EDUCATION_USERNAME and "
-                        "MINISTRY_OF_EDUCATION_PASSWORD environment variables."
-                    )
-                login_success = await self.auth.login(page)
-                if not login_success:
-                    error_msg = (
-                        "Failed to login to Webtop. "
-                        "Check login_debug.png screenshot for details. "
-                        "Possible reasons: invalid credentials, "
-                        "reCAPTCHA challenge, network timeout, or "
-                        "browser automation detection."
-                    )
-                    raise Exception(error_msg)
-                logger.info("Login successful")
-
-                # Navigate to homework page
-                logger.info("Navigating to homework page...")
-                nav_success = await self.navigator.navigate_to_homework(page)
-                if not nav_success:
-                    raise Exception("Failed to navigate to homework page")
-
-                # Extract homework
-                logger.info("Extracting homework...")
-                homework = await self.extractor.extract_homework(page, target_date=target_date)
-                logger.info(f"Found {len(homework)} homework items")
-
-                if context:
-                    await context.close()
-                if browser:
-                    await browser.close()
-                return homework
-
-            except Exception as e:
-                logger.error(f"Error in get_today_homework: {e}", exc_info=True)
-                # Clean up resources
-                try:
-                    if context:
-                        await context.close()
-                    if browser:
-                        await browser.close()
-                except Exception as cleanup_error:
-                    logger.debug(f"Error during cleanup: {cleanup_error}")
-                raise
+        try:
+            if self._page is not None:
+                return await self._fetch_homework(self._page, target_date)
+            async with self._one_shot_session() as (_, _, page):
+                return await self._fetch_homework(page, target_date)
+        except Exception as e:
+            logger.error(f"Error in get_today_homework: {e}", exc_info=True)
+            raise
+
+    async def get_homework_for_dates(
+        self, dates: List[Union[str, datetime]], max_parallel: int = Config.MAX_PARALLEL_CONTEXTS
+    ) -> Dict[Union[str, datetime], List[Dict]]:
+        """
+        Get homework for several dates concurrently with a single login.
+
+        Each date is scraped in its own browser context that starts from the
+        logged-in session's storage state, with at most max_parallel contexts
+        open at once.
+
+        Args:
+            dates: Date strings in format "DD-MM-YYYY" or datetimes
+            max_parallel: Maximum number of dates scraped at the same time
+
+        Returns:
+            Mapping of each requested date to its homework items
+        """
+        self._check_credentials()
+        target_dates = [parse_date(date) for date in dates]
+        logger.info(f"Fetching homework for {len(target_dates)} dates")
+
+        try:
+            if self._context is not None:
+                return await self._fetch_homework_for_dates(self._browser, self._context, dates, target_dates, max_parallel)
+            async with self._one_shot_session() as (browser, context, _):
+                return await self._fetch_homework_for_dates(browser, context, dates, target_dates, max_parallel)
+        except Exception as e:
+            logger.error(f"Error in get_homework_for_dates: {e}", exc_info=True)
+            raise
+
+    def _check_credentials(self) -> None:
+        """Raise ValueError when the Ministry of Education credentials are missing."""
+        if not self.username or not self.password:
+            raise ValueError("MINISTRY_OF_EDUCATION_USERNAME and MINISTRY_OF_EDUCATION_PASSWORD must be set in environment variables")
+
+    async def _open_session(self, stack: AsyncExitStack, playwright: Playwright) -> Tuple[Browser, BrowserContext, Page]:
+        """Launch the browser, open a page and log in.
+
+        Args:
+            stack: Exit stack that takes ownership of the browser and context
+            playwright: Running Playwright instance
+
+        Returns:
+            Tuple of (browser, context, logged-in page)
+        """
+        logger.info("Launching browser...")
+        browser = await WebtopBrowser.launch_browser(playwright)
+        stack.push_async_callback(browser.close)
+        storage_state = self.session_cache.load() if self.session_cache else None
+        context, page = await self._open_page(stack, browser, storage_state)
+
+        if storage_state:
+            if await self.auth.resume_session(page):
+                logger.info("Resumed saved session, skipping login")
+                await WebtopBrowser.block_static_assets(context)
+                return browser, context, page
+            logger.info("Saved session expired, logging in again")
+            # Drop the stale file so a failed login does not leave it to be
+            # retried on every run, and log in from a clean context: the
+            # expired state includes local storage, not just cookies
+            self.session_cache.clear()
+            await context.close()
+            context, page = await self._open_page(stack, browser)
+
+        # Login
+        logger.info("Attempting login...")
+        logger.debug(f"Username configured: {bool(self.username)}")
+        login_success = await self.auth.login(page)
+        if not login_success:
+            error_msg = (
+                "Failed to login to Webtop. "
+                "Check login_debug.png screenshot for details. "
+                "Possible reasons: invalid credentials, "
+                "reCAPTCHA challenge, network timeout, or "
+                "browser automation detection."
+            )
+            raise Exception(error_msg)
+        logger.info("Login successful")
+        if self.session_cache:
+            self.session_cache.save(await context.storage_state())
+        await WebtopBrowser.block_static_assets(context)
+        return browser, context, page
+
+    async def _open_page(self, stack: AsyncExitStack, browser: Browser, storage_state: Optional[Dict] = None) -> Tuple[BrowserContext, Page]:
+        """Open a context and its page, handing both to the exit stack.
+
+        Args:
+            stack: Exit stack that takes ownership of the context
+            browser: Browser to open the context in
+            storage_state: Optional saved session to start the context from
+
+        Returns:
+            Tuple of (context, page)
+        """
+        context = await WebtopBrowser.create_context(browser, storage_state)
+        stack.push_async_callback(context.close)
+        # Let the login debug screenshot finish before the page goes away
+        stack.push_async_callback(self.auth.wait_for_background_tasks)
+        page = await WebtopBrowser.create_page(context)
+        return context, page
+
+    async def _fetch_homework(self, page: Page, target_date: datetime) -> List[Dict]:
+        """Navigate the logged-in page to the homework view and extract one date.
+
+        Args:
+            page: Logged-in Playwright page
+            target_date: Date to extract homework for
+
+        Returns:
+            List of homework items for the date
+        """
+        # A session page left on the homework view by an earlier lookup stays
+        # there, so pagination moves from the week it shows and date headings
+        # found last time are still valid
+        if page.url.startswith(self.navigator.homework_url):
+            logger.info("Already on homework page")
+        else:
+            logger.info("Navigating to homework page...")
+            nav_success = await self.navigator.navigate_to_homework(page)
+            if not nav_success:
+                raise Exception("Failed to navigate to homework page")
+
+        # Extract homework
+        logger.info("Extracting homework...")
+        homework = await self.extractor.extract_homework(page, target_date=target_date)
+        logger.info(f"Found {len(homework)} homework items")
+        return homework
+
+    async def _fetch_homework_for_dates(
+        self,
+        browser: Browser,
+        context: BrowserContext,
+        dates: List[Union[str, datetime]],
+        target_dates: List[datetime],
+        max_parallel: int,
+    ) -> Dict[Union[str, datetime], List[Dict]]:
+        """Scrape several dates in parallel contexts cloned from the logged-in session.
+
+        Args:
+            browser: Browser of the logged-in session
+            context: Logged-in context whose storage state is cloned
+            dates: Dates as requested, used as result keys
+            target_dates: Parsed dates, in the same order as dates
+            max_parallel: Maximum number of contexts open at once
+
+        Returns:
+            Mapping of each requested date to its homework items
+        """
+        storage_state = await context.storage_state()
+        results = await self.extractor.extract_homework_parallel(browser, target_dates, storage_state, max_parallel=max_parallel)
+        return dict(zip(dates, results))
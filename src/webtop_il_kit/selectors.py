@@ -13,10 +13,14 @@ All hardcoded values have been extracted here to make the codebase more
 maintainable and easier to adapt if the Webtop interface changes.
 """
 import os
+import re
 
 
 class Selectors:
-    """CSS selectors and text patterns for Webtop scraper."""
+    """CSS selectors and text patterns for Webtop scraper.
+
+    Selector groups are tuples so they cannot be changed by accident.
+    """
 
     # ==================== Authentication Selectors ====================
 
@@ -26,20 +30,31 @@ class Selectors:
     # Ministry of Education button
     MOE_BUTTON = 'button:has-text("הזדהות משרד החינוך")'
 
+    # Username input of the MOE login form, rendered together with the tabs
+    USERNAME_FORM_CONTROL = 'input[type="text"][formcontrolname*="username"]'
+
     # Username field selectors (ordered by priority)
-    USERNAME_SELECTORS = [
-        'textbox[aria-label*="קוד המשתמש"]',
-        'input[type="text"][formcontrolname*="username"]',
+    # Plain CSS is tried before the slower role-based lookup; the *_ROLE
+    # dicts below are last-resort get_by_role fallbacks, since computing
+    # accessible names walks the whole DOM
+    USERNAME_SELECTORS = (
+        'input[aria-label*="קוד המשתמש"]',
+        USERNAME_FORM_CONTROL,
         'input[type="text"]',
-    ]
+    )
+    # Specific username selectors as one CSS group, for waits and visibility
+    # checks. The generic text input is left out: a group matches in document
+    # order, so it could report some other text field.
+    USERNAME_UNION = ", ".join(USERNAME_SELECTORS[:-1])
     USERNAME_ROLE = {"role": "textbox", "name": "קוד המשתמש שלך"}
 
     # Password field selectors (ordered by priority)
-    PASSWORD_SELECTORS = [
-        'textbox[type="password"]',
+    PASSWORD_SELECTORS = (
         'input[type="password"]',
-        'textbox[aria-label*="סיסמה"]',
-    ]
+        'input[aria-label*="סיסמה"]',
+    )
+    # All password selectors as one CSS group, for waits and visibility checks
+    PASSWORD_UNION = ", ".join(PASSWORD_SELECTORS)
     PASSWORD_ROLE = {"role": "textbox", "name": "סיסמה"}
 
     # Tab selection
@@ -57,32 +72,38 @@ class Selectors:
     # ==================== Navigation Selectors ====================
 
     # Student Card link selectors
-    STUDENT_CARD_SELECTORS = [
+    STUDENT_CARD_SELECTORS = (
         'a[href*="Student_Card"]:has-text("כרטיס תלמיד")',
         'link:has-text("כרטיס תלמיד")',
         'a:has-text("כרטיס תלמיד")',
-    ]
+    )
+    # All Student Card selectors as one CSS group, for waits
+    STUDENT_CARD_UNION = ", ".join(STUDENT_CARD_SELECTORS)
     STUDENT_CARD_TEXT = "כרטיס תלמיד"
     STUDENT_CARD_URL_PATTERN = "**/Student_Card**"
 
     # Homework link selectors
-    HOMEWORK_SELECTORS = [
+    HOMEWORK_SELECTORS = (
         'a[href*="Student_Card/11"]:has-text("נושאי שיעור ושיעורי-בית")',
         'a[href*="Student_Card/11"]',
         'link:has-text("נושאי שיעור ושיעורי-בית")',
         'a:has-text("נושאי שיעור ושיעורי-בית")',
         'nav a[href*="Student_Card/11"]',
-    ]
+    )
+    # All homework link selectors as one CSS group, for waits
+    HOMEWORK_UNION = ", ".join(HOMEWORK_SELECTORS)
     HOMEWORK_TEXT = "נושאי שיעור ושיעורי-בית"
     HOMEWORK_URL_PATTERN = "**/Student_Card/11**"
 
     # Dashboard indicators
-    DASHBOARD_INDICATORS = [
+    DASHBOARD_INDICATORS = (
         "text=ריכוז מידע",
         "text=כרטיס תלמיד",
         "text=תיבת הודעות",
         'heading:has-text("ריכוז מידע")',
-    ]
+    )
+    # All dashboard texts as one Playwright text regex, resolved in a single wait
+    DASHBOARD_INDICATOR_SELECTOR = "text=/ריכוז מידע|כרטיס תלמיד|תיבת הודעות/"
 
     # ==================== Extraction Selectors ====================
 
@@ -90,6 +111,7 @@ class Selectors:
     # The page uses span[role="heading"] with class "card-title", not h2
     DATE_HEADING = 'span[role="heading"].card-title, span[role="heading"], h2'
     DATE_REGEX_PATTERN = r"(\d{2})/(\d{2})/(\d{4})"
+    DATE_REGEX = re.compile(DATE_REGEX_PATTERN)  # Compiled once for every heading on every page
 
     # Table selectors
     # Support both regular HTML tables and ARIA div-based tables
@@ -113,7 +135,7 @@ class Selectors:
     # ==================== Pagination Selectors ====================
 
     # Forward navigation
-    NEXT_BUTTON_SELECTORS = [
+    NEXT_BUTTON_SELECTORS = (
         'button:has-text("הבא")',
         'button:has-text("Next")',
         'a:has-text("הבא")',
@@ -125,11 +147,11 @@ class Selectors:
         ".pagination a:last-child",
         '[class*="next"]',
         '[class*="Next"]',
-    ]
-    NEXT_BUTTON_TEXT_PATTERNS = ["הבא", "Next"]
+    )
+    NEXT_BUTTON_TEXT_PATTERNS = ("הבא", "Next")
 
     # Backward navigation
-    PREV_BUTTON_SELECTORS = [
+    PREV_BUTTON_SELECTORS = (
         'button:has-text("הקודם")',
         'button:has-text("Previous")',
         'button:has-text("קודם")',
@@ -145,14 +167,18 @@ class Selectors:
         '[class*="prev"]',
         '[class*="Prev"]',
         '[class*="previous"]',
-    ]
-    PREV_BUTTON_TEXT_PATTERNS = ["הקודם", "Previous", "קודם"]
+    )
+    PREV_BUTTON_TEXT_PATTERNS = ("הקודם", "Previous", "קודם")
 
     # ==================== Error Detection ====================
 
     # Error keywords (Hebrew and English)
-    ERROR_KEYWORDS = ["שגיאה", "error", "לא נכון", "לא תקין", "נכשל", "כושל"]
-    ERROR_REGEX_PATTERN = r"/שגיאה|לא נכון|נכשל/i"
+    ERROR_KEYWORDS = ("שגיאה", "error", "לא נכון", "לא תקין", "נכשל", "כושל")
+    # All error keywords as one alternation, so text is scanned once
+    ERROR_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in ERROR_KEYWORDS), re.IGNORECASE)
+    ERROR_REGEX = re.compile(r"שגיאה|לא נכון|נכשל", re.IGNORECASE)
+    # Same pattern as a Playwright text= regex literal; not a Python pattern
+    ERROR_REGEX_PATTERN = f"/{ERROR_REGEX.pattern}/i"
 
     # reCAPTCHA detection
     RECAPTCHA_IFRAME = 'iframe[src*="recaptcha"], iframe[title*="reCAPTCHA"]'
@@ -164,6 +190,39 @@ class Selectors:
     MOE_DOMAIN = "lgn.edu.gov.il"
     LOGIN_PAGE_INDICATOR = "login"
 
+    # Analytics and tracking hosts that keep the network busy after the page is usable.
+    # Google's reCAPTCHA hosts are deliberately absent since the MOE login needs them.
+    FILTERED_DOMAINS = (
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "hotjar.com",
+        "fullstory.com",
+        "connect.facebook.net",
+        "clarity.ms",
+        "mixpanel.com",
+        "segment.io",
+        "newrelic.com",
+        "nr-data.net",
+    )
+    # Image and font files, blocked by URL once logged in
+    FILTERED_EXTENSIONS = (
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".svg",
+        ".ico",
+        ".cur",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".eot",
+    )
+
     # ==================== Date Formats ====================
 
     DATE_FORMAT_DISPLAY = "%d/%m/%Y"  # Format used on the page
@@ -202,9 +261,37 @@ class TextPatterns:
     NO_HOMEWORK_PLACEHOLDER = "אין"
     EMPTY_LESSON_PLACEHOLDER = "---"
 
+    # Cell labels
+    LESSON_TOPIC_PREFIX = "נושא שיעור:"
+    HOMEWORK_PREFIX = "שיעורי בית:"
+
+
+# Timeouts that depend on the environment, resolved on first access so that
+# importing the package does not read the environment
+_ENV_TIMEOUTS = {
+    # Increase timeout in CI environments (60s) vs local (30s)
+    "LOGIN_REDIRECT": lambda: 60000 if os.getenv("CI", "").lower() == "true" else 30000,
+}
+
 
-class Timeouts:
-    """Timeout values in milliseconds."""
+class _TimeoutsMeta(type):
+    """Metaclass that resolves environment-dependent timeouts lazily."""
+
+    def __getattr__(cls, name):
+        """Compute an environment-dependent timeout and cache it on the class."""
+        if name not in _ENV_TIMEOUTS:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        value = _ENV_TIMEOUTS[name]()
+        setattr(cls, name, value)
+        return value
+
+
+class Timeouts(metaclass=_TimeoutsMeta):
+    """Timeout values in milliseconds.
+
+    LOGIN_REDIRECT depends on the CI environment variable and is read the
+    first time it is accessed.
+    """
 
     # Element visibility
     ELEMENT_VISIBLE = 5000
@@ -214,21 +301,20 @@ class Timeouts:
     PAGE_LOAD = 15000
     URL_WAIT = 10000
     NETWORK_IDLE = 10000
+    PAGE_SETTLE = 3000  # Upper bound for the page-settled poll
+    PAGE_SETTLE_POLL = 250  # Resource count must hold steady for one poll interval
+    NETWORK_IDLE_FALLBACK = 2000  # Short networkidle wait when the settle poll times out
+    LAZY_LOAD_QUIET = 150  # DOM must stay unchanged this long after a scroll
+    LAZY_LOAD_MAX = 1000  # Upper bound for lazily loaded content after a scroll
 
-    # Login flow
-    # Increase timeout in CI environments (60s) vs local (30s)
-    _is_ci = os.getenv("CI", "").lower() == "true"
-    LOGIN_REDIRECT = 60000 if _is_ci else 30000
+    # Login flow (LOGIN_REDIRECT is resolved lazily, see _ENV_TIMEOUTS)
     RECAPTCHA_CHECK_DELAY = 5  # seconds before checking reCAPTCHA
     RECAPTCHA_WAIT = 10  # seconds to wait for reCAPTCHA
 
     # Button enablement
-    BUTTON_ENABLE_MAX_WAIT = 10  # iterations
+    BUTTON_ENABLE_MAX_WAIT = 10  # multiples of BUTTON_ENABLE_DELAY
     BUTTON_ENABLE_DELAY = 0.5  # seconds
 
-    # Tab selection
-    TAB_CLICK_DELAY = 2  # seconds
-
 
 class Delays:
     """Delay values in seconds for various operations."""
@@ -240,11 +326,5 @@ class Delays:
     VERY_LONG = 2
     EXTRA_LONG = 3
 
-    # Specific operation delays
-    AFTER_CLICK = 1
-    AFTER_FILL = 0.5
-    AFTER_TAB_SWITCH = 2
-    AFTER_PAGE_LOAD = 2
-    AFTER_NAVIGATION = 3
-    AFTER_LOGIN = 2
-    RECAPTCHA_CHECK = 2
+    # Waits after UI actions are event-driven, see utils.AsyncWait
+    BROWSER_HEAD_START = 2  # Preferred browser launch time before fallbacks start
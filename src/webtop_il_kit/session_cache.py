@@ -0,0 +1,68 @@
+"""Saved login session for Webtop scraper.
+
+Stores the cookies and local storage of a logged-in browser context on
+disk, so later runs can start logged in and skip the login flow.
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WebtopSessionCache:
+    """Reads and writes a Playwright storage state file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the session cache.
+
+        Args:
+            path: File the storage state is kept in
+        """
+        self.path = os.path.expanduser(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the saved storage state.
+
+        Returns:
+            Storage state dict, or None if there is no usable saved session
+        """
+        try:
+            with open(self.path, encoding="utf-8") as state_file:
+                state = json.load(state_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Could not read saved session: {e}")
+            return None
+        return state if isinstance(state, dict) else None
+
+    def save(self, state: Dict[str, Any]):
+        """
+        Save storage state, readable only by the current user.
+
+        Args:
+            state: Storage state returned by BrowserContext.storage_state()
+        """
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # The file holds session cookies, so never create it world-readable
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as state_file:
+                json.dump(state, state_file)
+        except Exception as e:
+            logger.debug(f"Could not save session: {e}")
+
+    def clear(self):
+        """Delete the saved storage state, if any."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Could not delete saved session: {e}")
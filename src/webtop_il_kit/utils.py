@@ -1,15 +1,31 @@
 """Utility functions for Webtop scraper."""
+import logging
+import re
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
 
+from .selectors import Timeouts
 
-def parse_date(date_str: Optional[str]) -> Optional[datetime]:
+if TYPE_CHECKING:
+    from playwright.async_api import Locator, Page
+
+logger = logging.getLogger(__name__)
+
+# Supported date formats in one pattern: DD-MM-YYYY, DD/MM/YYYY and DD.MM.YYYY
+# (groups 1, 3, 4), or YYYY-MM-DD and YYYY/MM/DD (groups 5, 7, 8). The
+# backreference keeps both separators the same. ASCII mode keeps \d to 0-9,
+# like strptime, so digits from other scripts are rejected.
+_DATE_RE = re.compile(r"(\d{1,2})([-/.])(\d{1,2})\2(\d{4})|(\d{4})([-/])(\d{1,2})\6(\d{1,2})", re.ASCII)
+
+
+def parse_date(date_str: Optional[Union[str, datetime]]) -> Optional[datetime]:
     """
     Parse date string in various formats to datetime object.
 
     Args:
         date_str: Date string in formats like "21-01-2026", "21/01/2026",
-            "2026-01-21", etc.
+            "2026-01-21", etc. A datetime is returned as is.
 
     Returns:
         datetime object or None if parsing fails
@@ -19,20 +35,114 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """
     if date_str is None:
         return None
+    if isinstance(date_str, datetime):
+        return date_str
 
-    # Try different date formats
-    date_formats = [
-        "%d-%m-%Y",  # 21-01-2026
-        "%d/%m/%Y",  # 21/01/2026
-        "%Y-%m-%d",  # 2026-01-21
-        "%Y/%m/%d",  # 2026/01/21
-        "%d.%m.%Y",  # 21.01.2026
-    ]
+    return _parse_date_string(date_str.strip())
 
-    for fmt in date_formats:
+
+@lru_cache(maxsize=1024)
+def _parse_date_string(date_str: str) -> datetime:
+    """Parse a stripped date string by building the datetime from its matched fields.
+
+    This skips strptime, which re-parses the format string in Python on every call.
+    """
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            if match[1]:
+                return datetime(int(match[4]), int(match[3]), int(match[1]))
+            return datetime(int(match[5]), int(match[7]), int(match[8]))
         except ValueError:
-            continue
+            pass
 
     raise ValueError(f"Could not parse date '{date_str}'. Supported formats: DD-MM-YYYY, DD/MM/YYYY, YYYY-MM-DD")
+
+
+async def first_match(page: "Page", selectors: Iterable[str]) -> Optional["Locator"]:
+    """
+    Return the first element of the highest-priority selector that matches.
+
+    A comma-joined CSS group resolves in document order, so a generic
+    selector listed last could win over a specific one listed first.
+
+    Args:
+        page: Playwright page object
+        selectors: Selectors ordered by priority
+
+    Returns:
+        Locator of the first matching element, or None if no selector matches
+    """
+    for selector in selectors:
+        locator = page.locator(selector).first
+        if await locator.count():
+            return locator
+    return None
+
+
+class AsyncWait:
+    """Event-driven waits that finish as soon as the page is ready.
+
+    Each wait is bounded by a timeout and never raises, so it can stand in
+    for a fixed sleep: fast pages move on immediately and slow pages get at
+    least as long as before.
+    """
+
+    @staticmethod
+    async def after_click(page: "Page", selector: Optional[str] = None) -> bool:
+        """
+        Wait for the document to load after a click.
+
+        Args:
+            page: Playwright page object
+            selector: Optional selector that must also become visible
+
+        Returns:
+            True if the page became ready, False on timeout
+        """
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=Timeouts.ELEMENT_WAIT)
+            if selector:
+                await page.wait_for_selector(selector, state="visible", timeout=Timeouts.ELEMENT_WAIT)
+            return True
+        except Exception as e:
+            logger.debug(f"Wait after click timed out: {e}")
+            return False
+
+    @staticmethod
+    async def after_navigation(page: "Page", url_pattern: Union[str, Callable[[str], bool]], timeout: int = Timeouts.URL_WAIT) -> bool:
+        """
+        Wait until the page URL matches url_pattern.
+
+        Args:
+            page: Playwright page object
+            url_pattern: Glob pattern or predicate accepted by page.wait_for_url
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            True if the URL matched, False on timeout
+        """
+        try:
+            await page.wait_for_url(url_pattern, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.debug(f"Wait for navigation timed out: {e}")
+            return False
+
+    @staticmethod
+    async def after_fill(locator: "Locator") -> bool:
+        """
+        Wait until a filled field is still attached and visible.
+
+        Args:
+            locator: Locator of the field that was filled
+
+        Returns:
+            True if the field is visible, False on timeout
+        """
+        try:
+            await locator.wait_for(state="visible", timeout=Timeouts.ELEMENT_VISIBLE)
+            return True
+        except Exception as e:
+            logger.debug(f"Wait after fill timed out: {e}")
+            return False
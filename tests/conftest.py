@@ -1,13 +1,15 @@
 """Pytest configuration and shared fixtures."""
-import os
-import sys
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from webtop_il_kit.selectors import Delays
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+@pytest.fixture
+def fast_delays(monkeypatch):
+    """Shorten fixed delays so tests do not wait on real sleeps."""
+    monkeypatch.setattr(Delays, "BROWSER_HEAD_START", 0.01)
 
 
 @pytest.fixture
@@ -1,13 +1,8 @@
 """Shared fixtures for E2E tests."""
-import os
-import sys
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 
 @pytest.fixture
 def mock_e2e_browser_stack():
@@ -18,7 +18,6 @@ import pytest
 from webtop_il_kit.scraper import WebtopScraper
 
 
-@pytest.mark.asyncio
 @pytest.mark.e2e
 class TestFullFlowE2E:
     """End-to-end tests for complete scraper workflow."""
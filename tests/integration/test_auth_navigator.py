@@ -4,9 +4,9 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from webtop_il_kit.auth import WebtopAuth
 from webtop_il_kit.navigator import WebtopNavigator
+from webtop_il_kit.selectors import Selectors
 
 
-@pytest.mark.asyncio
 class TestAuthNavigatorIntegration:
     """Integration tests for auth and navigator interaction."""
 
@@ -75,6 +75,10 @@ class TestAuthNavigatorIntegration:
         # For MOE button, we need to return the AsyncMock directly
         # (not wrapped in MagicMock)
         def locator_side_effect(selector):
+            # The MOE button is located by both the cookie check and the click
+            if selector == Selectors.MOE_BUTTON:
+                return moe_button_locator
+
             # Track call order
             if not hasattr(locator_side_effect, "call_count"):
                 locator_side_effect.call_count = 0
@@ -83,15 +87,12 @@ class TestAuthNavigatorIntegration:
             if locator_side_effect.call_count == 1:
                 return MagicMock(return_value=cookie_button)
             elif locator_side_effect.call_count == 2:
-                # MOE button locator - return AsyncMock directly
-                return moe_button_locator
-            elif locator_side_effect.call_count == 3:
                 return MagicMock(return_value=username_field)
-            elif locator_side_effect.call_count == 4:
+            elif locator_side_effect.call_count == 3:
                 return MagicMock(return_value=password_field)
-            elif locator_side_effect.call_count == 5:
+            elif locator_side_effect.call_count == 4:
                 return MagicMock(return_value=login_button)
-            elif locator_side_effect.call_count == 6:
+            elif locator_side_effect.call_count == 5:
                 return MagicMock(return_value=student_card)
             else:
                 return MagicMock(return_value=homework_link)
@@ -104,6 +105,8 @@ class TestAuthNavigatorIntegration:
 
         # Update URL to dashboard after login (simulating successful login)
         mock_page.url = "https://webtop.smartschool.co.il/dashboard"
+        # Homework page content is present for the final verification
+        mock_page.evaluate = AsyncMock(return_value=True)
 
         # Verify navigation can work after login
         result = await navigator.navigate_to_homework(mock_page)
@@ -2,42 +2,22 @@
 
 Tests the orchestrator coordinating multiple modules.
 """
+import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from webtop_il_kit.browser import _STATIC_ASSET_URL_RE, WebtopBrowser
 from webtop_il_kit.scraper import WebtopScraper
 
 
-@pytest.mark.asyncio
 class TestWebtopScraperIntegration:
     """Integration tests for WebtopScraper orchestrator."""
 
     @pytest.fixture
     def scraper(self):
         """Create WebtopScraper instance."""
-        with patch("webtop_il_kit.config.Config.USERNAME", "test_user"), patch("webtop_il_kit.config.Config.PASSWORD", "test_pass"):
-            return WebtopScraper()
-
-    @pytest.fixture
-    def mock_playwright(self):
-        """Create mock Playwright instance."""
-        playwright = MagicMock()
-        browser = AsyncMock()
-        browser.contexts = []
-        browser.new_context = AsyncMock()
-        browser.close = AsyncMock()
-
-        context = AsyncMock()
-        context.new_page = AsyncMock()
-        context.close = AsyncMock()
-        browser.new_context.return_value = context
-
-        page = AsyncMock()
-        page.url = "https://webtop.smartschool.co.il/dashboard"
-        context.new_page.return_value = page
-
-        playwright.chromium.launch = AsyncMock(return_value=browser)
-        return playwright, browser, context, page
+        return WebtopScraper(username="test_user", password="test_pass")
 
     async def test_init_integration(self, scraper):
         """Integration test: scraper initialization with all modules."""
@@ -47,13 +27,15 @@ class TestWebtopScraperIntegration:
         assert scraper.navigator is not None
         assert scraper.extractor is not None
 
-    async def test_get_today_homework_full_flow(self, scraper, mock_playwright):
-        """Integration test: full flow from login to extraction."""
-        playwright, browser, context, page = mock_playwright
-
-        # Mock successful login and navigation
-        scraper.auth.login = AsyncMock(return_value=True)
-        scraper.navigator.navigate_to_homework = AsyncMock(return_value=True)
+    @pytest.mark.parametrize(
+        "login_ok, nav_ok, error",
+        [(True, True, None), (False, True, "Failed to login"), (True, False, "Failed to navigate")],
+        ids=["full_flow", "login_fails", "navigation_fails"],
+    )
+    async def test_get_today_homework_flow(self, scraper, patched_session, login_ok, nav_ok, error):
+        """Integration test: full flow from login to extraction, and where it stops on failure."""
+        scraper.auth.login = AsyncMock(return_value=login_ok)
+        scraper.navigator.navigate_to_homework = AsyncMock(return_value=nav_ok)
         scraper.extractor.extract_homework = AsyncMock(
             return_value=[
                 {
@@ -64,8 +46,13 @@ class TestWebtopScraperIntegration:
             ]
         )
 
-        with patch("playwright.async_api.async_playwright", return_value=playwright):
-            result = await scraper.get_today_homework(date="21-01-2026")
+        if error:
+            with pytest.raises(Exception, match=error):
+                await scraper.get_today_homework(date="21-01-2026")
+            scraper.extractor.extract_homework.assert_not_called()
+            return
+
+        result = await scraper.get_today_homework(date="21-01-2026")
 
         assert len(result) == 1
         assert result[0]["subject"] == "מתמטיקה"
@@ -73,6 +60,15 @@ class TestWebtopScraperIntegration:
         scraper.navigator.navigate_to_homework.assert_called_once()
         scraper.extractor.extract_homework.assert_called_once()
 
+    async def test_explicit_credentials_override_config(self):
+        """Integration test: constructor credentials take precedence over Config."""
+        with patch("webtop_il_kit.config.Config.USERNAME", "env_user"), patch("webtop_il_kit.config.Config.PASSWORD", "env_pass"):
+            scraper = WebtopScraper(username="arg_user", password="arg_pass")
+            fallback = WebtopScraper()
+
+        assert (scraper.auth.username, scraper.auth.password) == ("arg_user", "arg_pass")
+        assert (fallback.auth.username, fallback.auth.password) == ("env_user", "env_pass")
+
     async def test_get_today_homework_no_credentials(self):
         """Integration test: error handling when credentials are missing."""
         with patch("webtop_il_kit.config.Config.USERNAME", None), patch("webtop_il_kit.config.Config.PASSWORD", None):
@@ -80,26 +76,169 @@ class TestWebtopScraperIntegration:
             with pytest.raises(ValueError, match="MINISTRY_OF_EDUCATION_USERNAME"):
                 await scraper.get_today_homework()
 
-    async def test_get_today_homework_login_fails(self, scraper, mock_playwright):
-        """Integration test: error handling when login fails."""
-        playwright, browser, context, page = mock_playwright
+    @pytest.fixture
+    def patched_session(self, mock_playwright, mock_browser, mock_context, mock_page):
+        """Patch Playwright startup and browser creation used by a session."""
+        playwright, browser, context, page = mock_playwright, mock_browser, mock_context, mock_page
+        context.new_page.return_value = page
+        starter = MagicMock()
+        starter.__aenter__ = AsyncMock(return_value=playwright)
+        starter.__aexit__ = AsyncMock(return_value=False)
+        playwright.stop = starter.__aexit__
+        with patch("webtop_il_kit.scraper.async_playwright", return_value=starter), patch(
+            "webtop_il_kit.scraper.WebtopBrowser.launch_browser", AsyncMock(return_value=browser)
+        ), patch("webtop_il_kit.scraper.WebtopBrowser.create_context", AsyncMock(return_value=context)), patch(
+            "webtop_il_kit.scraper.WebtopBrowser.create_page", AsyncMock(return_value=page)
+        ):
+            yield playwright, browser, context, page
+
+    async def test_session_reuses_login_across_dates(self, scraper, patched_session):
+        """Integration test: one login serves several lookups inside async with."""
+        playwright, browser, context, page = patched_session
+        scraper.auth.login = AsyncMock(return_value=True)
+        scraper.navigator.navigate_to_homework = AsyncMock(return_value=True)
+        scraper.extractor.extract_homework = AsyncMock(return_value=[])
+
+        async with scraper:
+            await scraper.get_today_homework(date="20-01-2026")
+            await scraper.get_today_homework(date="21-01-2026")
+
+        scraper.auth.login.assert_awaited_once()
+        assert scraper.extractor.extract_homework.await_count == 2
+        # Images and fonts are only blocked once the login page is behind us
+        context.route.assert_awaited_once_with(_STATIC_ASSET_URL_RE, WebtopBrowser._abort)
+        context.close.assert_awaited_once()
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+
+    async def test_session_stays_on_homework_page_between_dates(self, scraper, patched_session):
+        """Integration test: a page already on the homework view is not navigated again."""
+        playwright, browser, context, page = patched_session
+        scraper.auth.login = AsyncMock(return_value=True)
 
+        async def navigate(page):
+            page.url = "https://webtop.smartschool.co.il/Student_Card/11"
+            return True
+
+        scraper.navigator.navigate_to_homework = AsyncMock(side_effect=navigate)
+        scraper.extractor.extract_homework = AsyncMock(return_value=[])
+
+        async with scraper:
+            await scraper.get_today_homework(date="21-01-2026")
+            await scraper.get_today_homework(date="21-01-2026")
+
+        scraper.navigator.navigate_to_homework.assert_awaited_once()
+        assert scraper.extractor.extract_homework.await_count == 2
+
+    async def test_session_login_failure_cleans_up(self, scraper, patched_session):
+        """Integration test: a failed login closes the browser and stops Playwright."""
+        playwright, browser, context, page = patched_session
         scraper.auth.login = AsyncMock(return_value=False)
 
-        with patch("playwright.async_api.async_playwright", return_value=playwright):
-            with pytest.raises(Exception, match="Failed to login"):
-                await scraper.get_today_homework()
+        with pytest.raises(Exception, match="Failed to login"):
+            async with scraper:
+                pass
 
-    async def test_get_today_homework_navigation_fails(self, scraper, mock_playwright):
-        """Integration test: error handling when navigation fails."""
-        playwright, browser, context, page = mock_playwright
+        context.route.assert_not_called()
+        context.close.assert_awaited_once()
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+        assert scraper._page is None and scraper._context is None and scraper._browser is None
 
+    async def test_get_today_homework_accepts_datetime(self, scraper, patched_session):
+        """Integration test: a datetime is passed through to extraction unchanged."""
         scraper.auth.login = AsyncMock(return_value=True)
-        scraper.navigator.navigate_to_homework = AsyncMock(return_value=False)
+        scraper.navigator.navigate_to_homework = AsyncMock(return_value=True)
+        scraper.extractor.extract_homework = AsyncMock(return_value=[])
+        target_date = datetime(2026, 1, 21)
 
-        with patch("playwright.async_api.async_playwright", return_value=playwright):
-            with pytest.raises(Exception, match="Failed to navigate"):
-                await scraper.get_today_homework()
+        await scraper.get_today_homework(date=target_date)
+
+        assert scraper.extractor.extract_homework.await_args.kwargs["target_date"] is target_date
+
+    async def test_concurrent_one_shot_calls_keep_separate_sessions(self, scraper, patched_session):
+        """Integration test: concurrent calls outside async with each open and close their own session."""
+        playwright, browser, context, page = patched_session
+
+        async def interleave(*args, **kwargs):
+            # Yield so each call's login and extraction overlap the other's
+            await asyncio.sleep(0)
+            return True
+
+        scraper.auth.login = AsyncMock(side_effect=interleave)
+        scraper.navigator.navigate_to_homework = AsyncMock(side_effect=interleave)
+        scraper.extractor.extract_homework = AsyncMock(return_value=[])
+
+        await asyncio.gather(scraper.get_today_homework("20-01-2026"), scraper.get_today_homework("21-01-2026"))
+
+        assert scraper.auth.login.await_count == 2
+        assert browser.close.await_count == 2
+        assert playwright.stop.await_count == 2
+        assert scraper._exit_stack is None and scraper._page is None
+
+    async def test_get_homework_for_dates_shares_login(self, scraper, patched_session):
+        """Integration test: several dates are scraped in parallel after one login."""
+        playwright, browser, context, page = patched_session
+        context.storage_state = AsyncMock(return_value={"cookies": []})
+        scraper.auth.login = AsyncMock(return_value=True)
+        scraper.extractor.extract_homework_parallel = AsyncMock(return_value=[[{"date": "20/01/2026"}], []])
+
+        result = await scraper.get_homework_for_dates(["20-01-2026", "21-01-2026"], max_parallel=2)
+
+        assert result == {"20-01-2026": [{"date": "20/01/2026"}], "21-01-2026": []}
+        scraper.auth.login.assert_awaited_once()
+        args = scraper.extractor.extract_homework_parallel.await_args
+        assert args.args == (browser, [datetime(2026, 1, 20), datetime(2026, 1, 21)], {"cookies": []})
+        assert args.kwargs == {"max_parallel": 2}
+        playwright.stop.assert_awaited_once()
+
+    async def test_session_resumed_from_saved_state(self, scraper, patched_session):
+        """Integration test: a valid saved session skips the login flow."""
+        playwright, browser, context, page = patched_session
+        scraper.session_cache = MagicMock()
+        scraper.session_cache.load.return_value = {"cookies": [{"name": "session"}]}
+        scraper.auth.resume_session = AsyncMock(return_value=True)
+        scraper.auth.login = AsyncMock(return_value=True)
+
+        async with scraper:
+            assert scraper._page is page
+
+        scraper.auth.login.assert_not_called()
+        scraper.session_cache.save.assert_not_called()
+        context.route.assert_awaited_once_with(_STATIC_ASSET_URL_RE, WebtopBrowser._abort)
+
+    async def test_expired_saved_session_logs_in_and_saves(self, scraper, patched_session):
+        """Integration test: an expired saved session falls back to login and is replaced."""
+        playwright, browser, context, page = patched_session
+        context.storage_state = AsyncMock(return_value={"cookies": []})
+        scraper.session_cache = MagicMock()
+        scraper.session_cache.load.return_value = {"cookies": [{"name": "old"}]}
+        scraper.auth.resume_session = AsyncMock(return_value=False)
+        scraper.auth.login = AsyncMock(return_value=True)
+
+        async with scraper:
+            pass
+
+        scraper.session_cache.clear.assert_called_once()
+        # The login runs in a second context opened without the stale state
+        create_context = WebtopBrowser.create_context
+        assert [c.args for c in create_context.await_args_list] == [(browser, {"cookies": [{"name": "old"}]}), (browser, None)]
+        scraper.auth.login.assert_awaited_once()
+        scraper.session_cache.save.assert_called_once_with({"cookies": []})
+
+    async def test_expired_saved_session_cleared_when_login_fails(self, scraper, patched_session):
+        """Integration test: a failed login after an expired session leaves no stale file behind."""
+        scraper.session_cache = MagicMock()
+        scraper.session_cache.load.return_value = {"cookies": [{"name": "old"}]}
+        scraper.auth.resume_session = AsyncMock(return_value=False)
+        scraper.auth.login = AsyncMock(return_value=False)
+
+        with pytest.raises(Exception, match="Failed to login"):
+            async with scraper:
+                pass
+
+        scraper.session_cache.clear.assert_called_once()
+        scraper.session_cache.save.assert_not_called()
 
     async def test_get_today_homework_invalid_date(self, scraper):
         """Integration test: error handling for invalid date format."""
@@ -1,16 +1,32 @@
 """Fixtures for recorded tests."""
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
-from playwright.async_api import async_playwright
+import pytest_asyncio
+from playwright.async_api import Error, async_playwright
 from webtop_il_kit.extractor import WebtopExtractor
 from webtop_il_kit.pagination import WebtopPagination
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def requires_fixture(filename):
+    """Skip a test whose HTML fixture has not been captured.
+
+    The check runs at collection, before any fixture is set up, so a
+    missing file never costs a browser launch.
+    """
+    return pytest.mark.skipif(
+        not (FIXTURES_DIR / filename).exists(),
+        reason=f"Fixture file not found: {filename}. Run: python scripts/capture_fixtures.py to create fixtures",
+    )
+
 
 @pytest.fixture
 def fixtures_dir():
     """Return the path to the fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_DIR
 
 
 @pytest.fixture
@@ -25,18 +41,39 @@ def pagination():
     return WebtopPagination()
 
 
-@pytest.fixture
-async def mock_page_with_html(fixtures_dir):
-    """Create a Playwright page loaded with HTML from a fixture file."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def recorded_browser():
+    """Launch one headless browser shared by every recorded test."""
     async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Error as e:
+            pytest.skip(f"Playwright browser not available: {e.message.splitlines()[0]}")
+        yield browser
+        await browser.close()
 
-        yield page, fixtures_dir
 
-        await context.close()
-        await browser.close()
+@pytest_asyncio.fixture(loop_scope="session")
+async def mock_page_with_html(recorded_browser, fixtures_dir):
+    """Create a Playwright page loaded with HTML from a fixture file.
+
+    Each test gets a fresh context on the shared browser, so no state
+    leaks between tests.
+    """
+    context = await recorded_browser.new_context()
+    # Recorded pages are static; their scripts, styles and widgets are never fetched
+    await context.route("**/*", lambda route: route.abort())
+    page = await context.new_page()
+
+    yield page, fixtures_dir
+
+    await context.close()
+
+
+@lru_cache(maxsize=None)
+def read_html_fixture(fixture_path: Path) -> str:
+    """Read a fixture file, once per test session."""
+    return fixture_path.read_text(encoding="utf-8")
 
 
 async def load_html_fixture(page, fixtures_dir, filename):
@@ -45,6 +82,6 @@ async def load_html_fixture(page, fixtures_dir, filename):
     if not fixture_path.exists():
         raise FileNotFoundError(f"Fixture file not found: {fixture_path}")
 
-    html_content = fixture_path.read_text(encoding="utf-8")
-    await page.set_content(html_content, wait_until="networkidle")
+    html_content = read_html_fixture(fixture_path)
+    await page.set_content(html_content, wait_until="domcontentloaded")
     return page
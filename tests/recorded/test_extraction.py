@@ -1,25 +1,24 @@
 """Test extraction logic using recorded HTML fixtures."""
+
 from datetime import datetime
 
 import pytest
 
-from .conftest import load_html_fixture
+from .conftest import load_html_fixture, requires_fixture
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.recorded
 class TestExtractionFromRecordedHTML:
     """Test extraction logic using pre-recorded HTML."""
 
+    @requires_fixture("homework_page_2026_01_22.html")
     async def test_extract_homework_from_fixture(self, mock_page_with_html, extractor, fixtures_dir):
         """Test homework extraction from recorded HTML."""
         page, _ = mock_page_with_html
 
         # Load a recorded homework page (using the committed fixture)
-        try:
-            await load_html_fixture(page, fixtures_dir, "homework_page_2026_01_22.html")
-        except FileNotFoundError:
-            pytest.skip("Fixture file not found. Run: python scripts/capture_fixtures.py to create fixtures")
+        await load_html_fixture(page, fixtures_dir, "homework_page_2026_01_22.html")
 
         # Test extraction for a date that exists in the fixture (22/01/2026)
         target_date = datetime(2026, 1, 22)
@@ -48,14 +47,12 @@ class TestExtractionFromRecordedHTML:
             # Verify date format
             assert first_item["date"] == "22/01/2026"
 
+    @requires_fixture("homework_page_empty.html")
     async def test_extract_empty_homework(self, mock_page_with_html, extractor, fixtures_dir):
         """Test extraction when no homework exists for a date."""
         page, _ = mock_page_with_html
 
-        try:
-            await load_html_fixture(page, fixtures_dir, "homework_page_empty.html")
-        except FileNotFoundError:
-            pytest.skip("Fixture file not found")
+        await load_html_fixture(page, fixtures_dir, "homework_page_empty.html")
 
         target_date = datetime(2026, 1, 22)
         homework = await extractor.extract_homework(page, target_date)
@@ -63,3 +60,27 @@ class TestExtractionFromRecordedHTML:
         # Should return empty list, not error
         assert isinstance(homework, list)
         # Empty list is acceptable if no homework for that date
+
+    @pytest.mark.parametrize(
+        "lesson_topic, homework, expected",
+        [
+            ("פרק 5", "עמוד 45", "פרק 5 | עמוד 45"),
+            ("פרק 5", "", "פרק 5"),
+            ("", "עמוד 45", "עמוד 45"),
+            ("---", "אין", ""),
+            ("", "", ""),
+            ("נושא שיעור: פרק 5", "שיעורי בית: עמוד 45", "פרק 5 | עמוד 45"),
+        ],
+        ids=["both", "empty_homework", "empty_lesson_topic", "placeholder_values", "both_empty", "cell_prefixes"],
+    )
+    async def test_row_cleaning_and_combining(self, mock_page_with_html, extractor, lesson_topic, homework, expected):
+        """Test that the in-browser row reader cleans cells and combines lesson topic with homework."""
+        page, _ = mock_page_with_html
+        cells = ["1", "<button>מתמטיקה</button>", "המורה", "נוכח", lesson_topic, homework]
+        row = "".join(f'<span role="cell">{cell}</span>' for cell in cells)
+        await page.set_content(f'<div role="table"><div role="rowgroup"><div role="row" class="lesson-homework">{row}</div></div></div>')
+
+        rows = await extractor._extract_table_data(page, page.locator('div[role="table"]'), "22/01/2026")
+
+        assert [item["combined"] for item in rows] == [expected]
+        assert rows[0]["subject"] == "מתמטיקה"
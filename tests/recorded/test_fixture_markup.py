@@ -0,0 +1,41 @@
+"""Check the selectors against recorded HTML without starting a browser.
+
+The markup is parsed with BeautifulSoup, so these tests run in
+milliseconds and catch selector drift even where Playwright browsers are
+not installed.
+"""
+import pytest
+from bs4 import BeautifulSoup
+from webtop_il_kit.selectors import Selectors
+
+from .conftest import FIXTURES_DIR, read_html_fixture, requires_fixture
+
+_FIXTURE_NAME = "homework_page_2026_01_22.html"
+
+
+@pytest.fixture(scope="module")
+def recorded_soup():
+    """Parse the recorded homework page once for the whole module."""
+    return BeautifulSoup(read_html_fixture(FIXTURES_DIR / _FIXTURE_NAME), "lxml")
+
+
+@requires_fixture(_FIXTURE_NAME)
+@pytest.mark.recorded
+class TestRecordedMarkup:
+    """Selectors used by extraction and pagination, checked against recorded markup."""
+
+    def test_date_headings_parse(self, recorded_soup):
+        """Test that every date on the recorded page is found through DATE_HEADING."""
+        texts = [heading.get_text() for heading in recorded_soup.select(Selectors.DATE_HEADING)]
+        dates = [match.group(0) for match in map(Selectors.DATE_REGEX.search, texts) if match]
+        assert dates == ["18/01/2026", "19/01/2026", "20/01/2026", "21/01/2026", "22/01/2026", "23/01/2026"]
+
+    def test_table_rows_and_cells(self, recorded_soup):
+        """Test that the table for a date is found by aria-label and yields full rows."""
+        tables = recorded_soup.select(Selectors.TABLE_ARIA_LABEL_PATTERN.format(date="22/01/2026"))
+        assert len(tables) == 1
+
+        rows = tables[0].select(Selectors.TABLE_BODY_ROWS)
+        assert rows
+        # The extractor skips rows with fewer than 6 cells
+        assert all(len(row.select(Selectors.TABLE_CELLS)) >= 6 for row in rows)
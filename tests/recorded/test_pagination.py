@@ -3,22 +3,20 @@ from datetime import datetime
 
 import pytest
 
-from .conftest import load_html_fixture
+from .conftest import load_html_fixture, requires_fixture
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.recorded
 class TestPaginationFromRecordedHTML:
     """Test pagination logic using pre-recorded HTML."""
 
+    @requires_fixture("homework_page_2026_01_22.html")
     async def test_find_date_on_page(self, mock_page_with_html, pagination, fixtures_dir):
         """Test finding a date on a recorded page."""
         page, _ = mock_page_with_html
 
-        try:
-            await load_html_fixture(page, fixtures_dir, "homework_page_2026_01_22.html")
-        except FileNotFoundError:
-            pytest.skip("Fixture file not found")
+        await load_html_fixture(page, fixtures_dir, "homework_page_2026_01_22.html")
 
         # The fixture contains dates from 18/01/2026 to 23/01/2026
         # Note: This test verifies the method works without crashing
@@ -34,14 +32,12 @@ class TestPaginationFromRecordedHTML:
         found = await pagination.find_date_on_page(page, "25/01/2026")
         assert found is False
 
+    @requires_fixture("homework_page_2026_01_22.html")
     async def test_get_dates_from_page(self, mock_page_with_html, pagination, fixtures_dir):
         """Test extracting available dates from a recorded page."""
         page, _ = mock_page_with_html
 
-        try:
-            await load_html_fixture(page, fixtures_dir, "homework_page_2026_01_22.html")
-        except FileNotFoundError:
-            pytest.skip("Fixture file not found")
+        await load_html_fixture(page, fixtures_dir, "homework_page_2026_01_22.html")
 
         dates = await pagination.get_dates_on_page(page)
         assert isinstance(dates, list)
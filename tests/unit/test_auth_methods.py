@@ -2,13 +2,18 @@
 
 Tests individual methods in isolation with heavy mocking.
 """
+
+import logging
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from webtop_il_kit.auth import WebtopAuth
+from webtop_il_kit.selectors import Selectors
+
+TAB_USERNAME = "כניסה עם קוד משתמש וסיסמה"
+TAB_MOBILE = "כניסה עם קוד חד פעמי לנייד"
 
 
-@pytest.mark.asyncio
 class TestWebtopAuthMethods:
     """Unit tests for individual WebtopAuth methods."""
 
@@ -29,31 +34,50 @@ class TestWebtopAuthMethods:
     async def test_accept_cookies(self, auth, mock_page):
         """Unit test: cookie acceptance."""
         cookie_button = AsyncMock()
-        cookie_button.count = AsyncMock(return_value=1)
+        cookie_button.or_ = MagicMock()
+        cookie_button.or_.return_value.first.wait_for = AsyncMock()
         mock_page.locator.return_value = cookie_button
+        mock_page.evaluate = AsyncMock(return_value={"cookie": True, "moeReady": True})
 
-        await auth._accept_cookies(mock_page)
+        state = await auth._accept_cookies(mock_page)
 
+        cookie_button.or_.return_value.first.wait_for.assert_called_once()
         cookie_button.click.assert_called_once()
+        assert state["moeReady"] is False
 
     async def test_accept_cookies_not_present(self, auth, mock_page):
         """Unit test: when cookie button is not present."""
         cookie_button = AsyncMock()
-        cookie_button.count = AsyncMock(return_value=0)
+        cookie_button.or_ = MagicMock()
+        cookie_button.or_.return_value.first.wait_for = AsyncMock()
         mock_page.locator.return_value = cookie_button
+        mock_page.evaluate = AsyncMock(return_value={"cookie": False, "moeReady": True})
 
         # Should not raise exception
-        await auth._accept_cookies(mock_page)
+        state = await auth._accept_cookies(mock_page)
+        cookie_button.click.assert_not_called()
+        assert state["moeReady"] is True
 
     async def test_click_moe_button(self, auth, mock_page):
         """Unit test: clicking Ministry of Education button."""
         moe_button = AsyncMock()
-        moe_button.get_attribute = AsyncMock(return_value=None)
         moe_button.wait_for = AsyncMock()
         mock_page.locator.return_value = moe_button
 
         await auth._click_moe_button(mock_page)
 
+        mock_page.wait_for_function.assert_called_once()
+        moe_button.click.assert_called_once()
+
+    async def test_click_moe_button_ready_skips_waits(self, auth, mock_page):
+        """Unit test: a button known to be ready is clicked without waiting."""
+        moe_button = AsyncMock()
+        mock_page.locator.return_value = moe_button
+
+        await auth._click_moe_button(mock_page, ready=True)
+
+        moe_button.wait_for.assert_not_called()
+        mock_page.wait_for_function.assert_not_called()
         moe_button.click.assert_called_once()
 
     async def test_find_username_field(self, auth, mock_page):
@@ -66,6 +90,25 @@ class TestWebtopAuthMethods:
         result = await auth._find_username_field(mock_page)
         assert result is not None
 
+    async def test_find_username_field_prefers_specific_selector(self, auth, mock_page):
+        """Unit test: a specific username selector wins over the generic text input."""
+        fields = {}
+        for selector in Selectors.USERNAME_SELECTORS:
+            field = AsyncMock()
+            field.count = AsyncMock(return_value=1 if selector != Selectors.USERNAME_SELECTORS[0] else 0)
+            fields[selector] = MagicMock(first=field)
+        mock_page.locator = MagicMock(side_effect=fields.get)
+
+        result = await auth._find_username_field(mock_page)
+
+        assert result is fields[Selectors.USERNAME_SELECTORS[1]].first
+        assert [c.args[0] for c in mock_page.locator.call_args_list] == list(Selectors.USERNAME_SELECTORS[:2])
+        mock_page.get_by_role.assert_not_called()
+
+    def test_username_union_leaves_out_generic_input(self):
+        """Unit test: the grouped username selector cannot match an arbitrary text field."""
+        assert 'input[type="text"]' not in Selectors.USERNAME_UNION.split(", ")
+
     async def test_find_username_field_not_found(self, auth, mock_page):
         """Unit test: when username field is not found."""
         mock_page.locator.return_value.first.count = AsyncMock(return_value=0)
@@ -84,22 +127,38 @@ class TestWebtopAuthMethods:
         result = await auth._find_password_field(mock_page)
         assert result is not None
 
+    async def test_fill_credentials_looks_up_fields_together(self, auth, mock_page):
+        """Unit test: both fields are looked up once and filled with the credentials."""
+        username_field = AsyncMock()
+        password_field = AsyncMock()
+        auth._find_username_field = AsyncMock(return_value=username_field)
+        auth._find_password_field = AsyncMock(return_value=password_field)
+        mock_page.locator.return_value.count = AsyncMock(return_value=0)
+
+        await auth._fill_credentials(mock_page)
+
+        username_field.fill.assert_awaited_once_with("test_user")
+        password_field.fill.assert_awaited_once_with("test_pass")
+        auth._find_username_field.assert_awaited_once_with(mock_page)
+        auth._find_password_field.assert_awaited_once_with(mock_page)
+
     async def test_is_tab_already_selected_username_visible(self, auth, mock_page):
         """Unit test: tab selection check when username field is visible."""
-        username_field = AsyncMock()
-        username_field.count = AsyncMock(return_value=1)
-        username_field.is_visible = AsyncMock(return_value=True)
-        mock_page.locator.return_value.first = username_field
+        username_fields = MagicMock()
+        username_fields.evaluate_all = AsyncMock(return_value=True)
+        mock_page.locator.return_value = username_fields
 
         result = await auth._is_tab_already_selected(mock_page)
         assert result is True
 
     async def test_is_tab_already_selected_aria_selected(self, auth, mock_page):
         """Unit test: tab selection check when tab has aria-selected."""
-        tab = AsyncMock()
-        tab.text_content = AsyncMock(return_value="כניסה עם קוד משתמש וסיסמה")
-        tab.get_attribute = AsyncMock(side_effect=lambda attr: ("true" if attr == "aria-selected" else None))
-        mock_page.locator.return_value.all = AsyncMock(return_value=[tab])
+        tab = {"text": TAB_USERNAME, "ariaSelected": "true", "className": None}
+        tabs = MagicMock()
+        tabs.evaluate_all = AsyncMock(return_value=[tab])
+        hidden_fields = MagicMock()
+        hidden_fields.evaluate_all = AsyncMock(return_value=False)
+        mock_page.locator.side_effect = lambda selector: tabs if selector == Selectors.TAB_ROLE else hidden_fields
 
         result = await auth._is_tab_already_selected(mock_page)
         assert result is True
@@ -107,10 +166,10 @@ class TestWebtopAuthMethods:
     async def test_click_correct_tab(self, auth, mock_page):
         """Unit test: clicking the correct tab."""
         tab = AsyncMock()
-        tab.text_content = AsyncMock(return_value="כניסה עם קוד משתמש וסיסמה")
         tab.wait_for = AsyncMock()
         tab.click = AsyncMock()
-        mock_page.locator.return_value.all = AsyncMock(return_value=[tab])
+        mock_page.locator.return_value.evaluate_all = AsyncMock(return_value=[{"text": TAB_USERNAME}])
+        mock_page.locator.return_value.nth.return_value = tab
 
         result = await auth._click_correct_tab(mock_page)
         assert result is True
@@ -119,14 +178,88 @@ class TestWebtopAuthMethods:
     async def test_click_correct_tab_excludes_mobile(self, auth, mock_page):
         """Unit test: that mobile tab is excluded."""
         mobile_tab = AsyncMock()
-        mobile_tab.text_content = AsyncMock(return_value="כניסה עם קוד חד פעמי לנייד")
         username_tab = AsyncMock()
-        username_tab.text_content = AsyncMock(return_value="כניסה עם קוד משתמש וסיסמה")
         username_tab.wait_for = AsyncMock()
         username_tab.click = AsyncMock()
-        mock_page.locator.return_value.all = AsyncMock(return_value=[mobile_tab, username_tab])
+        mock_page.locator.return_value.evaluate_all = AsyncMock(return_value=[{"text": TAB_MOBILE}, {"text": TAB_USERNAME}])
+        mock_page.locator.return_value.nth.side_effect = lambda index: [mobile_tab, username_tab][index]
 
         result = await auth._click_correct_tab(mock_page)
         assert result is True
         username_tab.click.assert_called_once()
         mobile_tab.click.assert_not_called()
+
+    async def test_login_button_via_role_skips_tabs(self, auth, mock_page):
+        """Unit test: role lookup reads all candidates at once and skips tabs."""
+        buttons = MagicMock()
+        buttons.evaluate_all = AsyncMock(return_value=[{"role": "tab"}, {"role": None}])
+        mock_page.get_by_role = MagicMock(return_value=buttons)
+
+        result = await auth._login_button_via_role(mock_page)
+
+        assert result is buttons.nth.return_value
+        buttons.nth.assert_called_once_with(1)
+
+    async def test_find_login_button_skips_tabs(self, auth, mock_page):
+        """Unit test: login button lookup ignores buttons inside a tablist."""
+        login_button = AsyncMock()
+        mock_page.locator.return_value.evaluate_all = AsyncMock(
+            return_value=[
+                {"text": TAB_USERNAME, "role": "tab", "parentRole": "tablist", "inTablist": True},
+                {"text": "כניסה", "role": None, "parentRole": "form", "inTablist": False},
+            ]
+        )
+        mock_page.locator.return_value.nth.side_effect = lambda index: login_button if index == 1 else AsyncMock()
+
+        result = await auth._find_login_button(mock_page)
+        assert result is login_button
+        mock_page.get_by_role.assert_not_called()
+
+    async def test_verify_login_success_waits_for_dashboard_once(self, auth, mock_page):
+        """Unit test: all dashboard indicators are awaited with a single selector."""
+        result = await auth._verify_login_success(mock_page)
+
+        assert result is True
+        mock_page.wait_for_selector.assert_called_once()
+        assert mock_page.wait_for_selector.call_args.args == (Selectors.DASHBOARD_INDICATOR_SELECTOR,)
+
+    async def test_check_for_errors(self, auth, mock_page):
+        """Unit test: error check uses one browser-side text selector."""
+        error_elem = AsyncMock()
+        error_elem.count = AsyncMock(return_value=1)
+        error_elem.text_content = AsyncMock(return_value="Login ERROR")
+        mock_page.locator.return_value.first = error_elem
+
+        assert await auth._check_for_errors(mock_page) is True
+        mock_page.locator.assert_called_once()
+        selector = mock_page.locator.call_args.args[0]
+        assert selector.startswith("text=/") and selector.endswith("/i")
+        assert "error" in selector and "שגיאה" in selector
+
+    async def test_debug_login_failure_skips_dumps_without_debug_logging(self, auth, mock_page, caplog):
+        """Unit test: no screenshot or body dump unless DEBUG logging is on."""
+        mock_page.title = AsyncMock(return_value="Webtop")
+
+        with caplog.at_level(logging.INFO, logger="webtop_il_kit.auth"):
+            await auth._debug_login_failure(mock_page)
+
+        mock_page.screenshot.assert_not_called()
+        mock_page.locator.assert_not_called()
+
+    async def test_is_cloudflare_blocked(self, auth):
+        """Unit test: Cloudflare block page titles are recognized."""
+        assert auth._is_cloudflare_blocked("ERROR: The request could not be satisfied")
+        assert auth._is_cloudflare_blocked("Just a moment... | Cloudflare")
+        assert not auth._is_cloudflare_blocked("Webtop")
+
+    async def test_debug_login_failure_screenshot_in_background(self, auth, mock_page, caplog):
+        """Unit test: the debug screenshot runs as a background task."""
+        mock_page.title = AsyncMock(return_value="Webtop")
+        mock_page.locator.return_value.first.count = AsyncMock(return_value=0)
+
+        with caplog.at_level(logging.DEBUG, logger="webtop_il_kit.auth"):
+            await auth._debug_login_failure(mock_page)
+            await auth.wait_for_background_tasks()
+
+        mock_page.screenshot.assert_called_once_with(path="login_debug.png", full_page=True)
+        assert not auth._background_tasks
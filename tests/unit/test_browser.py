@@ -2,34 +2,18 @@
 
 Tests individual methods in isolation with heavy mocking.
 """
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from webtop_il_kit.browser import WebtopBrowser
+from webtop_il_kit.browser import _STATIC_ASSET_URL_RE, _TRACKER_URL_RE, WebtopBrowser
+from webtop_il_kit.config import Config
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("fast_delays")
 class TestWebtopBrowser:
     """Unit tests for WebtopBrowser class methods."""
 
-    @pytest.fixture
-    def mock_browser(self):
-        """Create mock browser."""
-        browser = AsyncMock()
-        browser.contexts = []
-        browser.new_context = AsyncMock()
-        browser.close = AsyncMock()
-        return browser
-
-    @pytest.fixture
-    def mock_playwright(self, mock_browser):
-        """Create mock Playwright instance."""
-        playwright = MagicMock()
-        playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        playwright.webkit.launch = AsyncMock(return_value=mock_browser)
-        playwright.firefox.launch = AsyncMock(return_value=mock_browser)
-        return playwright
-
     async def test_launch_browser_success_chrome(self, mock_playwright, mock_browser):
         """Unit test: successful browser launch with Chrome."""
         result = await WebtopBrowser.launch_browser(mock_playwright)
@@ -47,6 +31,45 @@ class TestWebtopBrowser:
         assert result == mock_browser
         assert mock_playwright.chromium.launch.call_count == 2
 
+    async def test_launch_browser_fallbacks_race(self, mock_playwright):
+        """Unit test: fallbacks launch together and extra browsers are closed."""
+        webkit_browser = AsyncMock()
+        firefox_browser = AsyncMock()
+        mock_playwright.chromium.launch.side_effect = Exception("Failed")
+        mock_playwright.webkit.launch = AsyncMock(return_value=webkit_browser)
+        mock_playwright.firefox.launch = AsyncMock(return_value=firefox_browser)
+
+        result = await WebtopBrowser.launch_browser(mock_playwright)
+        assert result == webkit_browser
+        mock_playwright.firefox.launch.assert_called_once()
+        firefox_browser.close.assert_called_once()
+        webkit_browser.close.assert_not_called()
+
+    async def test_launch_browser_awaits_losing_launches(self, mock_playwright):
+        """Unit test: a fallback still launching when another wins is awaited and closed, not cancelled."""
+        webkit_browser = AsyncMock()
+        firefox_browser = AsyncMock()
+        firefox_finished = asyncio.Event()
+        real_sleep = asyncio.sleep
+
+        async def slow_firefox_launch(**kwargs):
+            await real_sleep(0.05)
+            firefox_finished.set()
+            return firefox_browser
+
+        mock_playwright.chromium.launch.side_effect = Exception("Failed")
+        mock_playwright.webkit.launch = AsyncMock(return_value=webkit_browser)
+        mock_playwright.firefox.launch = AsyncMock(side_effect=slow_firefox_launch)
+
+        with patch("webtop_il_kit.browser.asyncio.sleep") as sleep:
+            result = await WebtopBrowser.launch_browser(mock_playwright)
+
+        assert result is webkit_browser
+        assert firefox_finished.is_set()
+        firefox_browser.close.assert_awaited_once()
+        # No fixed delay after a successful launch
+        sleep.assert_not_called()
+
     async def test_launch_browser_all_fail(self, mock_playwright):
         """Unit test: when all browsers fail to launch."""
         mock_playwright.chromium.launch.side_effect = Exception("Failed")
@@ -58,9 +81,50 @@ class TestWebtopBrowser:
 
     async def test_create_context(self, mock_browser):
         """Unit test: creating browser context."""
+        new_context = AsyncMock()
+        new_context.set_default_timeout = MagicMock()
+        new_context.set_default_navigation_timeout = MagicMock()
+        mock_browser.new_context = AsyncMock(return_value=new_context)
+
         context = await WebtopBrowser.create_context(mock_browser)
-        assert context is not None
+        assert context is new_context
         mock_browser.new_context.assert_called_once()
+        context.set_default_timeout.assert_called_once_with(Config.DEFAULT_TIMEOUT)
+        context.set_default_navigation_timeout.assert_called_once_with(Config.NAVIGATION_TIMEOUT)
+        context.add_init_script.assert_called_once()
+
+        # Only tracker hosts are intercepted, not every request
+        context.route.assert_called_once()
+        pattern = context.route.await_args.args[0]
+        assert pattern is _TRACKER_URL_RE
+        assert pattern.search("https://www.googletagmanager.com/gtag/js?id=G-1")
+        assert pattern.search("https://region1.google-analytics.com/g/collect")
+        assert not pattern.search("https://www.google.com/recaptcha/api.js")
+        assert not pattern.search("https://webtop.smartschool.co.il/logo.png")
+        assert not pattern.search("https://webtop.smartschool.co.il/?ref=hotjar.com")
+
+    async def test_block_static_assets(self):
+        """Unit test: images and fonts are blocked by URL once logged in."""
+        context = AsyncMock()
+
+        await WebtopBrowser.block_static_assets(context)
+
+        pattern = context.route.await_args.args[0]
+        assert pattern is _STATIC_ASSET_URL_RE
+        assert pattern.search("https://webtop.smartschool.co.il/favicon.ico?v=2")
+        assert pattern.search("https://webtop.smartschool.co.il/assets/logo.PNG")
+        assert pattern.search("https://fonts.gstatic.com/s/heebo.woff2")
+        assert not pattern.search("https://webtop.smartschool.co.il/Student_Card/11")
+        assert not pattern.search("https://webtop.smartschool.co.il/main.js")
+
+    async def test_abort(self):
+        """Unit test: a matched request is aborted."""
+        route = AsyncMock()
+
+        await WebtopBrowser._abort(route)
+
+        route.abort.assert_awaited_once()
+        route.continue_.assert_not_called()
 
     async def test_create_page(self):
         """Unit test: creating page in context."""
@@ -2,95 +2,296 @@
 
 Tests individual methods in isolation with heavy mocking.
 """
-from unittest.mock import AsyncMock, MagicMock
+
+import asyncio
+import re
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from webtop_il_kit.extractor import WebtopExtractor
+from webtop_il_kit.extractor import _TABLE_ROWS_ARG, _TABLE_ROWS_JS, WebtopExtractor
+from webtop_il_kit.selectors import TextPatterns
+
+
+@pytest.fixture
+def extractor():
+    """Create WebtopExtractor instance."""
+    return WebtopExtractor()
 
 
-@pytest.mark.asyncio
 class TestWebtopExtractorMethods:
     """Unit tests for individual WebtopExtractor methods."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create WebtopExtractor instance."""
-        return WebtopExtractor()
-
     @pytest.fixture
     def mock_page(self):
         """Create mock page with table structure."""
         page = AsyncMock()
         page.locator = MagicMock()
+        page.on = MagicMock()
+        page.once = MagicMock()
+        page.remove_listener = MagicMock()
         return page
 
-    async def test_extract_subject_from_button(self, extractor, mock_page):
-        """Unit test: extracting subject from button in cell."""
-        subject_cell = AsyncMock()
-        subject_btn = AsyncMock()
-        subject_btn.count = AsyncMock(return_value=1)
-        subject_btn.text_content = AsyncMock(return_value="מתמטיקה")
-
-        # Mock the locator chain: locator('button').first
-        locator_mock = MagicMock()
-        locator_mock.first = subject_btn
-        subject_cell.locator = MagicMock(return_value=locator_mock)
-
-        result = await extractor._extract_subject(subject_cell)
-        assert result == "מתמטיקה"
-
-    async def test_extract_attached_files(self, extractor, mock_page):
-        """Unit test: extracting attached files."""
-        file_cell = AsyncMock()
-
-        # Mock link
-        link = AsyncMock()
-        link.get_attribute = AsyncMock(side_effect=lambda attr: "https://example.com/file.pdf" if attr == "href" else None)
-        link.text_content = AsyncMock(return_value="קובץ PDF")
-
-        # Mock image
-        img = AsyncMock()
-        img.get_attribute = AsyncMock(side_effect=lambda attr: "https://example.com/image.png" if attr == "src" else ("" if attr == "alt" else None))
-
-        # Mock locator calls: locator('a').all() and locator('img').all()
-        def locator_side_effect(selector):
-            locator_mock = AsyncMock()
-            if selector == "a":
-                locator_mock.all = AsyncMock(return_value=[link])
-            elif selector == "img":
-                locator_mock.all = AsyncMock(return_value=[img])
-            else:
-                locator_mock.all = AsyncMock(return_value=[])
-            return locator_mock
-
-        file_cell.locator = MagicMock(side_effect=locator_side_effect)
-
-        result = await extractor._extract_attached_files(file_cell)
-        assert len(result) == 2
-        assert result[0]["type"] == "link"
-        assert result[1]["type"] == "image"
-
-    def test_combine_content(self, extractor):
-        """Unit test: combining lesson topic and homework."""
-        result = extractor._combine_content("פרק 5", "עמוד 45")
-        assert result == "פרק 5 | עמוד 45"
-
-    def test_combine_content_empty_homework(self, extractor):
-        """Unit test: combining when homework is empty."""
-        result = extractor._combine_content("פרק 5", "")
-        assert result == "פרק 5"
-
-    def test_combine_content_empty_lesson_topic(self, extractor):
-        """Unit test: combining when lesson topic is empty."""
-        result = extractor._combine_content("", "עמוד 45")
-        assert result == "עמוד 45"
-
-    def test_combine_content_placeholder_values(self, extractor):
-        """Unit test: combining with placeholder values."""
-        result = extractor._combine_content("---", "אין")
-        assert result == ""
-
-    def test_combine_content_both_empty(self, extractor):
-        """Unit test: combining when both are empty."""
-        result = extractor._combine_content("", "")
-        assert result == ""
+    async def test_extract_homework_reuses_cached_heading(self, extractor, mock_page):
+        """Unit test: a second extraction of the same date on the same page skips heading discovery."""
+        heading = AsyncMock()
+        heading.text_content = AsyncMock(return_value="יום חמישי | 22/01/2026")
+        extractor.pagination.find_date_on_page = AsyncMock(return_value=True)
+        extractor._find_date_heading = AsyncMock(return_value=heading)
+        extractor._find_date_table = AsyncMock(return_value=AsyncMock())
+        extractor._extract_table_data = AsyncMock(return_value=[])
+
+        await extractor.extract_homework(mock_page, datetime(2026, 1, 22))
+        await extractor.extract_homework(mock_page, datetime(2026, 1, 22))
+
+        extractor.pagination.find_date_on_page.assert_awaited_once()
+        extractor._find_date_heading.assert_awaited_once()
+        heading.text_content.assert_awaited_once()
+        assert extractor._find_date_table.await_count == 2
+        assert extractor._find_date_table.await_args.args[2] is heading
+        mock_page.once.assert_called_once()
+
+    async def test_heading_cache_cleared_on_navigation(self, extractor, mock_page):
+        """Unit test: navigating the page between lookups forces heading discovery again."""
+        heading = AsyncMock()
+        heading.text_content = AsyncMock(return_value="יום חמישי | 15/01/2026")
+        extractor.pagination.find_date_on_page = AsyncMock(return_value=True)
+        extractor._find_date_heading = AsyncMock(return_value=heading)
+        extractor._find_date_table = AsyncMock(return_value=AsyncMock())
+        extractor._extract_table_data = AsyncMock(return_value=[])
+
+        await extractor.extract_homework(mock_page, datetime(2026, 1, 15))
+        on_navigated = mock_page.on.call_args.args[1]
+        on_navigated(MagicMock(parent_frame=MagicMock()))  # Iframe navigations keep the cache
+        assert list(extractor._heading_cache) == [(id(mock_page), "15/01/2026")]
+        on_navigated(MagicMock(parent_frame=None))
+        await extractor.extract_homework(mock_page, datetime(2026, 1, 15))
+
+        assert extractor._find_date_heading.await_count == 2
+        assert extractor.pagination.find_date_on_page.await_count == 2
+        heading.text_content.assert_not_awaited()
+
+    async def test_stale_cached_heading_is_rediscovered(self, extractor, mock_page):
+        """Unit test: a cached heading that now shows another week's date is not used."""
+        stale = AsyncMock()
+        stale.text_content = AsyncMock(return_value="יום חמישי | 22/01/2026")
+        fresh = AsyncMock()
+        extractor._heading_cache[(id(mock_page), "15/01/2026")] = stale
+        extractor.pagination.find_date_on_page = AsyncMock(return_value=True)
+        extractor._find_date_heading = AsyncMock(return_value=fresh)
+        extractor._find_date_table = AsyncMock(return_value=AsyncMock())
+        extractor._extract_table_data = AsyncMock(return_value=[])
+
+        await extractor.extract_homework(mock_page, datetime(2026, 1, 15))
+
+        extractor._find_date_heading.assert_awaited_once()
+        assert extractor._find_date_table.await_args.args[2] is fresh
+        assert extractor._heading_cache == {(id(mock_page), "15/01/2026"): fresh}
+
+    async def test_heading_cache_cleared_on_pagination(self, extractor, mock_page):
+        """Unit test: paginating away drops the page's cached headings."""
+        extractor._heading_cache[(id(mock_page), "15/01/2026")] = AsyncMock()
+        extractor.pagination.find_date_on_page = AsyncMock(return_value=False)
+        extractor.pagination.navigate_to_date_page = AsyncMock(return_value=True)
+        extractor._find_date_heading = AsyncMock(return_value=AsyncMock())
+        extractor._find_date_table = AsyncMock(return_value=None)
+
+        await extractor.extract_homework(mock_page, datetime(2026, 1, 22))
+
+        assert list(extractor._heading_cache) == [(id(mock_page), "22/01/2026")]
+
+    async def test_heading_locator_built_once_per_page(self, extractor, mock_page):
+        """Unit test: the date heading locator is reused until the page closes."""
+        first = extractor._headings(mock_page)
+        assert extractor._headings(mock_page) is first
+        mock_page.locator.assert_called_once()
+
+        on_close = mock_page.once.call_args.args[1]
+        on_close(mock_page)
+        mock_page.remove_listener.assert_called_once_with("framenavigated", mock_page.on.call_args.args[1])
+        extractor._headings(mock_page)
+        assert mock_page.locator.call_count == 2
+
+    async def test_extract_homework_parallel_limits_contexts(self, extractor):
+        """Unit test: dates run concurrently in their own contexts, bounded by max_parallel."""
+        browser = AsyncMock()
+        contexts = []
+        open_contexts = 0
+        peak_open = 0
+
+        async def create_context(browser, storage_state=None):
+            nonlocal open_contexts, peak_open
+            assert storage_state == {"cookies": []}
+            open_contexts += 1
+            peak_open = max(peak_open, open_contexts)
+            context = AsyncMock()
+
+            async def close():
+                nonlocal open_contexts
+                open_contexts -= 1
+
+            context.close = AsyncMock(side_effect=close)
+            contexts.append(context)
+            return context
+
+        async def extract_homework(page, target_date):
+            await asyncio.sleep(0.01)
+            return [{"date": target_date.strftime("%d/%m/%Y")}]
+
+        extractor.navigator.open_homework = AsyncMock(return_value=True)
+        extractor.extract_homework = AsyncMock(side_effect=extract_homework)
+        dates = [datetime(2026, 1, day) for day in range(18, 23)]
+
+        with patch("webtop_il_kit.extractor.WebtopBrowser.create_context", side_effect=create_context), patch(
+            "webtop_il_kit.extractor.WebtopBrowser.create_page", AsyncMock()
+        ):
+            result = await extractor.extract_homework_parallel(browser, dates, {"cookies": []}, max_parallel=2)
+
+        assert result == [[{"date": d.strftime("%d/%m/%Y")}] for d in dates]
+        assert len(contexts) == len(dates)
+        assert peak_open == 2
+        assert all(context.close.await_count == 1 for context in contexts)
+
+    async def test_find_date_heading_skips_per_heading_scroll(self, extractor, mock_page):
+        """Unit test: headings are matched without scrolling each one into view."""
+        headings = mock_page.locator.return_value
+        headings.all_text_contents = AsyncMock(return_value=["יום רביעי | 21/01/2026", "יום חמישי | 22/01/2026"])
+
+        result = await extractor._find_date_heading(mock_page, "22/01/2026")
+
+        assert result is headings.nth.return_value
+        headings.nth.assert_called_once_with(1)
+        headings.all.assert_not_called()
+        mock_page.wait_for_timeout.assert_not_called()
+        mock_page.evaluate.assert_awaited_once()
+        assert "requestIdleCallback" in mock_page.evaluate.await_args.args[0]
+
+    async def test_find_by_heading_sibling_reads_labels_once(self, extractor, mock_page):
+        """Unit test: table aria-labels are read in one call and matched by index."""
+        tables = mock_page.locator.return_value
+        tables.evaluate_all = AsyncMock(return_value=["", "טבלה 21/01/2026", "טבלה 22/01/2026"])
+
+        result = await extractor._find_by_heading_sibling(mock_page, "22/01/2026", "handle")
+
+        assert result is tables.nth.return_value
+        tables.nth.assert_called_once_with(2)
+        tables.get_attribute.assert_not_called()
+
+    async def test_find_date_table_races_methods(self, extractor, mock_page):
+        """Unit test: first method to find the table wins and slower ones are cancelled."""
+        table = MagicMock()
+        cancelled = asyncio.Event()
+
+        async def slow_method(*args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        extractor._find_by_aria = AsyncMock(side_effect=slow_method)
+        extractor._find_by_heading_sibling = AsyncMock(return_value=None)
+        extractor._find_by_parent_card = AsyncMock(return_value=table)
+
+        result = await extractor._find_date_table(mock_page, "22/01/2026", AsyncMock())
+
+        assert result is table
+        assert cancelled.is_set()
+
+    async def test_find_date_table_not_found(self, extractor, mock_page):
+        """Unit test: None is returned when every method misses."""
+        extractor._find_by_aria = AsyncMock(return_value=None)
+        extractor._find_by_heading_sibling = AsyncMock(return_value=None)
+        extractor._find_by_parent_card = AsyncMock(return_value=None)
+
+        result = await extractor._find_date_table(mock_page, "22/01/2026", AsyncMock())
+
+        assert result is None
+
+    async def test_find_date_table_reads_heading_once(self, extractor, mock_page):
+        """Unit test: heading handle is fetched once and shared with the lookups."""
+        heading = AsyncMock()
+        heading.element_handle = AsyncMock(return_value="handle")
+        extractor._find_by_aria = AsyncMock(return_value=None)
+        extractor._find_by_heading_sibling = AsyncMock(return_value=None)
+        extractor._find_by_parent_card = AsyncMock(return_value=None)
+
+        await extractor._find_date_table(mock_page, "22/01/2026", heading)
+
+        heading.element_handle.assert_awaited_once()
+        extractor._find_by_heading_sibling.assert_awaited_once_with(mock_page, "22/01/2026", "handle")
+
+    async def test_find_by_parent_card_uses_has_selector(self, extractor, mock_page):
+        """Unit test: the heading's card is selected with one :has() selector."""
+        table = AsyncMock()
+        mock_page.locator.return_value.first.locator.return_value.first = table
+
+        result = await extractor._find_by_parent_card(mock_page, "22/01/2026")
+
+        assert result is table
+        mock_page.locator.assert_called_once_with('mat-card:has(span[role="heading"]:has-text("22/01/2026"))')
+        table.wait_for.assert_awaited_once()
+
+    async def test_extract_table_data_single_evaluate(self, extractor, mock_page):
+        """Unit test: cleaned rows from one evaluate call become homework items."""
+        table = AsyncMock()
+        table.evaluate = AsyncMock(
+            return_value=[
+                {
+                    "hour": "1",
+                    "subject": "מתמטיקה",
+                    "teacher": "המורה",
+                    "status": "",
+                    "lesson_topic": "פרק 5",
+                    "homework": "עמוד 45",
+                    "combined": "פרק 5 | עמוד 45",
+                    "attached_files": [{"type": "link", "href": "https://example.com/file.pdf", "text": "קובץ"}],
+                },
+                None,
+                {
+                    "hour": "2",
+                    "subject": "",
+                    "teacher": "",
+                    "status": "",
+                    "lesson_topic": "",
+                    "homework": "",
+                    "combined": "",
+                    "attached_files": [],
+                },
+            ]
+        )
+
+        result = await extractor._extract_table_data(mock_page, table, "22/01/2026")
+
+        table.evaluate.assert_awaited_once()
+        table.locator.assert_not_called()
+        text_rules = table.evaluate.await_args.args[1]
+        assert text_rules["prefixes"] == ["נושא שיעור:", "שיעורי בית:"]
+        assert text_rules["emptyHomework"] == ["--", "אין"]
+        assert result == [
+            {
+                "hour": "1",
+                "subject": "מתמטיקה",
+                "teacher": "המורה",
+                "lesson_topic": "פרק 5",
+                "homework": "עמוד 45",
+                "combined": "פרק 5 | עמוד 45",
+                "status": "",
+                "attached_files": [{"type": "link", "href": "https://example.com/file.pdf", "text": "קובץ"}],
+                "date": "22/01/2026",
+            }
+        ]
+
+
+class TestTableRowRules:
+    """Unit tests for the cleaning rules handed to the in-browser row reader."""
+
+    def test_rules_use_text_patterns(self):
+        """Unit test: placeholders and cell prefixes come from TextPatterns."""
+        assert _TABLE_ROWS_ARG["prefixes"] == [TextPatterns.LESSON_TOPIC_PREFIX, TextPatterns.HOMEWORK_PREFIX]
+        assert TextPatterns.EMPTY_LESSON_PLACEHOLDER in _TABLE_ROWS_ARG["emptyLesson"]
+        assert TextPatterns.NO_HOMEWORK_PLACEHOLDER in _TABLE_ROWS_ARG["emptyHomework"]
+
+    def test_every_rule_is_read_by_the_script(self):
+        """Unit test: the row script reads every rule it is given, and no others."""
+        assert set(re.findall(r"opts\.(\w+)", _TABLE_ROWS_JS)) == set(_TABLE_ROWS_ARG)
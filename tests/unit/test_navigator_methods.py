@@ -5,10 +5,10 @@ Tests individual methods in isolation with heavy mocking.
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from webtop_il_kit.navigator import WebtopNavigator
+from webtop_il_kit.navigator import _RESET_SETTLED_JS, WebtopNavigator
+from webtop_il_kit.selectors import Selectors, Timeouts
 
 
-@pytest.mark.asyncio
 class TestWebtopNavigatorMethods:
     """Unit tests for individual WebtopNavigator methods."""
 
@@ -49,6 +49,104 @@ class TestWebtopNavigatorMethods:
         result = await navigator._click_homework_link(mock_page)
         assert result is True
         homework_link.click.assert_called_once()
+        # The settle poll starts fresh after the click
+        mock_page.evaluate.assert_any_await(_RESET_SETTLED_JS)
+
+    async def test_click_student_card_prefers_first_selector(self, navigator, mock_page):
+        """Unit test: the Student Card link is picked by selector priority, not document order."""
+        student_card = AsyncMock()
+        mock_page.locator.return_value.first = student_card
+
+        result = await navigator._click_student_card(mock_page)
+        assert result is True
+        assert mock_page.locator.call_args_list[0].args == (Selectors.STUDENT_CARD_SELECTORS[0],)
+        student_card.click.assert_awaited_once()
+        mock_page.evaluate.assert_any_await(_RESET_SETTLED_JS)
+
+    async def test_click_student_card_not_found(self, navigator, mock_page):
+        """Unit test: a missing Student Card link fails without waiting for visibility."""
+        student_card = AsyncMock()
+        student_card.count = AsyncMock(return_value=0)
+        mock_page.locator.return_value.first = student_card
+
+        result = await navigator._click_student_card(mock_page)
+        assert result is False
+        student_card.wait_for.assert_not_called()
+        student_card.click.assert_not_called()
+
+    async def test_click_student_card_not_visible(self, navigator, mock_page):
+        """Unit test: a hidden Student Card link fails after a single wait."""
+        student_card = AsyncMock()
+        student_card.count = AsyncMock(return_value=1)
+        student_card.wait_for = AsyncMock(side_effect=Exception("Timeout"))
+        mock_page.locator.return_value.first = student_card
+
+        result = await navigator._click_student_card(mock_page)
+        assert result is False
+        student_card.wait_for.assert_awaited_once()
+        student_card.click.assert_not_called()
+
+    async def test_click_homework_link_waits_for_date_heading(self, navigator, mock_page):
+        """Unit test: after clicking, wait for the date headings instead of network idle."""
+        homework_link = AsyncMock()
+        homework_link.count = AsyncMock(return_value=1)
+        homework_link.wait_for = AsyncMock()
+        homework_link.click = AsyncMock()
+        mock_page.locator.return_value.first = homework_link
+
+        result = await navigator._click_homework_link(mock_page)
+        assert result is True
+        mock_page.wait_for_load_state.assert_not_called()
+        mock_page.locator.assert_any_call(Selectors.DATE_HEADING)
+        homework_link.wait_for.assert_any_call(state="attached", timeout=Timeouts.ELEMENT_VISIBLE)
+
+    async def test_wait_settled_polls_page(self, navigator, mock_page):
+        """Unit test: settling polls the page with tracker domains filtered out."""
+        mock_page.wait_for_function = AsyncMock()
+
+        assert await navigator.wait_settled(mock_page) is True
+
+        mock_page.evaluate.assert_not_called()
+        kwargs = mock_page.wait_for_function.await_args.kwargs
+        assert kwargs["arg"] == list(Selectors.FILTERED_DOMAINS)
+        assert kwargs["polling"] == Timeouts.PAGE_SETTLE_POLL
+        assert kwargs["timeout"] == Timeouts.PAGE_SETTLE
+
+    async def test_wait_settled_timeout_is_ignored(self, navigator, mock_page):
+        """Unit test: a page that never settles does not fail navigation."""
+        mock_page.wait_for_function = AsyncMock(side_effect=Exception("Timeout"))
+
+        assert await navigator.wait_settled(mock_page) is False
+
+    async def test_wait_settled_reset_forgets_previous_count(self, navigator, mock_page):
+        """Unit test: a reset forgets earlier polls before polling again."""
+        mock_page.evaluate = AsyncMock()
+        mock_page.wait_for_function = AsyncMock()
+
+        await navigator.wait_settled(mock_page, reset=True)
+
+        assert "__webtopSettlePolled" in mock_page.evaluate.await_args.args[0]
+        mock_page.wait_for_function.assert_awaited_once()
+
+    async def test_open_homework_goes_straight_to_url(self, navigator, mock_page):
+        """Unit test: a fresh page opens the homework URL without waiting for the dashboard."""
+        mock_page.url = "https://webtop.smartschool.co.il/Student_Card/11"
+        navigator.navigate_to_homework = AsyncMock()
+
+        assert await navigator.open_homework(mock_page) is True
+
+        mock_page.goto.assert_awaited_once_with(navigator.homework_url, wait_until="domcontentloaded")
+        navigator.navigate_to_homework.assert_not_called()
+
+    async def test_open_homework_falls_back_to_click_through(self, navigator, mock_page):
+        """Unit test: the dashboard click-through runs only when the URL does not land on homework."""
+        mock_page.url = "https://webtop.smartschool.co.il/dashboard"
+        mock_page.evaluate = AsyncMock(return_value=False)
+        navigator.navigate_to_homework = AsyncMock(return_value=True)
+
+        assert await navigator.open_homework(mock_page) is True
+
+        navigator.navigate_to_homework.assert_awaited_once_with(mock_page)
 
     async def test_verify_homework_page_success(self, navigator, mock_page):
         """Unit test: verification of homework page."""
@@ -58,6 +156,19 @@ class TestWebtopNavigatorMethods:
         result = await navigator._verify_homework_page(mock_page)
         assert result is True
 
+    async def test_verify_homework_page_content_fallback(self, navigator, mock_page):
+        """Unit test: unexpected URL falls back to a single presence check."""
+        mock_page.url = "https://webtop.smartschool.co.il/dashboard"
+        mock_page.evaluate = AsyncMock(return_value=True)
+
+        result = await navigator._verify_homework_page(mock_page)
+        assert result is True
+        mock_page.evaluate.assert_awaited_once()
+        mock_page.wait_for_selector.assert_not_called()
+
+        mock_page.evaluate = AsyncMock(return_value=False)
+        assert await navigator._verify_homework_page(mock_page) is False
+
     async def test_verify_homework_page_redirected_to_login(self, navigator, mock_page):
         """Unit test: verification fails when redirected to login."""
         mock_page.url = "https://webtop.smartschool.co.il/account/login"
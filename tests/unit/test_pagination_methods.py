@@ -2,14 +2,18 @@
 
 Tests individual methods in isolation with heavy mocking.
 """
+
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from webtop_il_kit.pagination import WebtopPagination
+from webtop_il_kit.pagination import _FORWARD_BUTTON_SELECTORS, WebtopPagination
+from webtop_il_kit.selectors import Selectors, Timeouts
+
+H_TUE = "יום שלישי | 20/01/2026 | ב׳ שְׁבָט תשפ״ו"
+H_WED = "יום רביעי | 21/01/2026 | ג׳ שְׁבָט תשפ״ו"
 
 
-@pytest.mark.asyncio
 class TestWebtopPaginationMethods:
     """Unit tests for individual WebtopPagination methods."""
 
@@ -27,31 +31,34 @@ class TestWebtopPaginationMethods:
         page.locator = MagicMock()
         return page
 
-    async def test_find_date_on_page_found(self, pagination, mock_page):
-        """Unit test: finding date on current page."""
-        heading = AsyncMock()
-        heading.text_content = AsyncMock(return_value="יום רביעי | 21/01/2026 | ג׳ שְׁבָט תשפ״ו")
-        mock_page.locator.return_value.all = AsyncMock(return_value=[heading])
+    @pytest.mark.parametrize(
+        "heading, expected",
+        [(H_WED, True), (H_TUE, False)],
+        ids=["found", "not_found"],
+    )
+    async def test_find_date_on_page(self, pagination, mock_page, heading, expected):
+        """Unit test: finding a date on the current page, or reporting that it is absent."""
+        mock_page.evaluate = AsyncMock(return_value=[heading])
 
         result = await pagination.find_date_on_page(mock_page, "21/01/2026")
-        assert result is True
+        assert result is expected
 
-    async def test_find_date_on_page_not_found(self, pagination, mock_page):
-        """Unit test: when date is not on current page."""
-        heading = AsyncMock()
-        heading.text_content = AsyncMock(return_value="יום שלישי | 20/01/2026 | ב׳ שְׁבָט תשפ״ו")
-        mock_page.locator.return_value.all = AsyncMock(return_value=[heading])
+    async def test_find_date_on_page_passes_target(self, pagination, mock_page):
+        """Unit test: the target date lets the page skip the lazy-load scroll."""
+        mock_page.evaluate = AsyncMock(return_value=["יום רביעי | 21/01/2026"])
 
-        result = await pagination.find_date_on_page(mock_page, "21/01/2026")
-        assert result is False
+        assert await pagination.find_date_on_page(mock_page, "21/01/2026") is True
+        mock_page.evaluate.assert_awaited_once()
+        assert mock_page.evaluate.await_args.args[1]["target"] == "21/01/2026"
 
     async def test_get_dates_on_page(self, pagination, mock_page):
         """Unit test: extracting dates from page."""
-        heading1 = AsyncMock()
-        heading1.text_content = AsyncMock(return_value="יום שלישי | 20/01/2026 | ב׳ שְׁבָט תשפ״ו")
-        heading2 = AsyncMock()
-        heading2.text_content = AsyncMock(return_value="יום רביעי | 21/01/2026 | ג׳ שְׁבָט תשפ״ו")
-        mock_page.locator.return_value.all = AsyncMock(return_value=[heading1, heading2])
+        mock_page.evaluate = AsyncMock(
+            return_value=[
+                H_WED,
+                H_TUE,
+            ]
+        )
 
         dates = await pagination.get_dates_on_page(mock_page)
         assert len(dates) == 2
@@ -60,42 +67,147 @@ class TestWebtopPaginationMethods:
 
     async def test_get_dates_on_page_no_dates(self, pagination, mock_page):
         """Unit test: when no dates found on page."""
-        heading = AsyncMock()
-        heading.text_content = AsyncMock(return_value="No date here")
-        mock_page.locator.return_value.all = AsyncMock(return_value=[heading])
+        mock_page.evaluate = AsyncMock(return_value=["No date here"])
 
         dates = await pagination.get_dates_on_page(mock_page)
         assert len(dates) == 0
 
+    async def test_scan_page_finds_date_and_collects_dates(self, pagination, mock_page):
+        """Unit test: one scan answers both the lookup and the date list."""
+        mock_page.evaluate = AsyncMock(return_value=["יום רביעי | 21/01/2026", "יום שלישי | 20/01/2026"])
+
+        found, dates = await pagination._scan_page(mock_page, "21/01/2026")
+
+        assert found is True
+        assert dates == [datetime(2026, 1, 21), datetime(2026, 1, 20)]
+        assert pagination._date_range(dates) == (datetime(2026, 1, 20), datetime(2026, 1, 21))
+        mock_page.evaluate.assert_awaited_once()
+
+    async def test_navigate_flips_when_date_range_repeats(self, pagination, mock_page):
+        """Unit test: landing on an already seen date range flips direction."""
+        week = (datetime(2026, 1, 18), datetime(2026, 1, 22))
+        pagination._scan_page = AsyncMock(return_value=(False, list(week)))
+        pagination.find_date_on_page = AsyncMock(return_value=False)
+        pagination._find_navigation_button = AsyncMock(return_value=AsyncMock())
+        pagination._click_navigation_button = AsyncMock(side_effect=[(False, "forward", week), (True, "backward", week)])
+
+        result = await pagination.navigate_to_date_page(mock_page, datetime(2026, 1, 30))
+
+        assert result is True
+        assert pagination._click_navigation_button.await_args_list[1].args[2] == "backward"
+        # Each page is scanned once: before the loop or right after a click
+        pagination.find_date_on_page.assert_not_awaited()
+        assert pagination._scan_page.await_count == 1
+
+    async def test_click_navigation_button_waits_without_timers(self, pagination, mock_page):
+        """Unit test: the click step waits on page state, not fixed delays."""
+        nav_button = AsyncMock()
+        mock_page.wait_for_function = AsyncMock()
+        mock_page.evaluate = AsyncMock(side_effect=[None, ["יום שני | 26/01/2026"]])
+
+        found, direction, page_key = await pagination._click_navigation_button(
+            mock_page, nav_button, "forward", 1, datetime(2026, 1, 26), "26/01/2026"
+        )
+
+        assert (found, direction) == (True, "forward")
+        assert page_key == (datetime(2026, 1, 26), datetime(2026, 1, 26))
+        nav_button.click.assert_awaited_once()
+        mock_page.wait_for_timeout.assert_not_called()
+
+    async def test_navigate_stops_when_directions_ping_pong(self, pagination, mock_page):
+        """Unit test: flipping back onto pages seen in both directions ends the walk."""
+        week = (datetime(2026, 1, 18), datetime(2026, 1, 22))
+        pagination._scan_page = AsyncMock(return_value=(False, list(week)))
+        pagination.find_date_on_page = AsyncMock(return_value=False)
+        pagination._find_navigation_button = AsyncMock(return_value=AsyncMock())
+        pagination._click_navigation_button = AsyncMock(side_effect=[(False, "backward", week), (False, "forward", week)])
+
+        result = await pagination.navigate_to_date_page(mock_page, datetime(2026, 1, 30))
+
+        assert result is False
+        assert pagination._click_navigation_button.await_count == 2
+
+    async def test_navigate_skips_pages_once_stride_is_known(self, pagination, mock_page):
+        """Unit test: pages short of a distant target are passed without scanning."""
+        first_week = [datetime(2026, 1, 4), datetime(2026, 1, 8)]
+        target_week = [datetime(2026, 2, 8), datetime(2026, 2, 12)]
+        pagination._scan_page = AsyncMock(side_effect=[(False, first_week), (True, target_week)])
+        pagination.find_date_on_page = AsyncMock(return_value=False)
+        pagination._find_navigation_button = AsyncMock(return_value=AsyncMock())
+        pagination._click_navigation_button = AsyncMock(return_value=(False, "forward", (datetime(2026, 1, 11), datetime(2026, 1, 15))))
+        pagination._advance_pages = AsyncMock(return_value=3)
+
+        result = await pagination.navigate_to_date_page(mock_page, datetime(2026, 2, 12))
+
+        assert result is True
+        pagination._advance_pages.assert_awaited_once_with(mock_page, "forward", 3)
+        pagination._click_navigation_button.assert_awaited_once()
+
+    async def test_pages_to_skip(self, pagination):
+        """Unit test: skip count leaves the final page to the scanning step."""
+        previous = (datetime(2026, 1, 11), datetime(2026, 1, 15))
+        current = (datetime(2026, 1, 4), datetime(2026, 1, 8))
+
+        assert pagination._pages_to_skip(previous, current, datetime(2025, 12, 21), "backward") == 1
+        assert pagination._pages_to_skip(previous, current, datetime(2026, 1, 1), "backward") == 0
+        assert pagination._pages_to_skip(("https://webtop",), current, datetime(2025, 12, 1), "backward") == 0
+
+    async def test_collect_heading_texts_single_evaluate(self, pagination, mock_page):
+        """Unit test: headings are scrolled and read in one evaluate call."""
+        mock_page.evaluate = AsyncMock(return_value=["יום רביעי | 21/01/2026"])
+
+        texts = await pagination._collect_heading_texts(mock_page)
+
+        assert texts == ["יום רביעי | 21/01/2026"]
+        mock_page.evaluate.assert_awaited_once()
+        assert mock_page.evaluate.await_args.args[1] == {
+            "selector": Selectors.DATE_HEADING,
+            "target": None,
+            "quietMs": Timeouts.LAZY_LOAD_QUIET,
+            "maxMs": Timeouts.LAZY_LOAD_MAX,
+        }
+        assert "MutationObserver" in mock_page.evaluate.await_args.args[0]
+        mock_page.wait_for_timeout.assert_not_called()
+        mock_page.locator.return_value.all.assert_not_called()
+
+    async def test_wait_settled_skips_networkidle(self, pagination, mock_page):
+        """Unit test: a settled page does not wait for networkidle."""
+        mock_page.wait_for_function = AsyncMock()
+
+        await pagination._wait_settled(mock_page)
+
+        mock_page.wait_for_function.assert_awaited_once()
+        mock_page.wait_for_load_state.assert_not_called()
+
+    async def test_wait_settled_falls_back_to_networkidle(self, pagination, mock_page):
+        """Unit test: a settle timeout falls back to a short networkidle wait."""
+        mock_page.wait_for_function = AsyncMock(side_effect=Exception("Timeout"))
+
+        await pagination._wait_settled(mock_page)
+
+        mock_page.wait_for_load_state.assert_awaited_once_with("networkidle", timeout=Timeouts.NETWORK_IDLE_FALLBACK)
+
     async def test_find_navigation_button_forward(self, pagination, mock_page):
         """Unit test: finding forward navigation button."""
-        next_button = AsyncMock()
-        next_button.count = AsyncMock(return_value=1)
-        next_button.is_visible = AsyncMock(return_value=True)
-        next_button.get_attribute = AsyncMock(return_value=None)
-        mock_page.locator.return_value.first = next_button
+        mock_page.evaluate = AsyncMock(side_effect=[None, 0])
 
         result = await pagination._find_navigation_button(mock_page, "forward")
-        assert result is not None
+        assert result is mock_page.locator.return_value.first
+        mock_page.locator.assert_called_with(_FORWARD_BUTTON_SELECTORS[0])
 
     async def test_find_navigation_button_backward(self, pagination, mock_page):
         """Unit test: finding backward navigation button."""
-        prev_button = AsyncMock()
-        prev_button.count = AsyncMock(return_value=1)
-        prev_button.is_visible = AsyncMock(return_value=True)
-        prev_button.get_attribute = AsyncMock(return_value=None)
-        mock_page.locator.return_value.first = prev_button
+        mock_page.evaluate = AsyncMock(side_effect=[None, 4])
 
         result = await pagination._find_navigation_button(mock_page, "backward")
         assert result is not None
+        mock_page.locator.assert_called_with('a[role="button"]:has-text("שבוע קודם")')
+        assert mock_page.evaluate.await_args.args[1][4] == ['a[role="button"]', "שבוע קודם"]
 
     async def test_find_navigation_button_disabled(self, pagination, mock_page):
         """Unit test: when navigation button is disabled."""
-        disabled_button = AsyncMock()
-        disabled_button.count = AsyncMock(return_value=1)
-        disabled_button.is_visible = AsyncMock(return_value=True)
-        disabled_button.get_attribute = AsyncMock(return_value="true")
-        mock_page.locator.return_value.first = disabled_button
+        mock_page.evaluate = AsyncMock(side_effect=[None, -1])
 
         result = await pagination._find_navigation_button(mock_page, "forward")
         assert result is None
+        assert mock_page.evaluate.await_count == 2
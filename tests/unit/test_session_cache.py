@@ -0,0 +1,29 @@
+"""Unit tests for the saved session cache."""
+import os
+
+from webtop_il_kit.session_cache import WebtopSessionCache
+
+
+class TestWebtopSessionCache:
+    """Unit tests for WebtopSessionCache."""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Unit test: a saved state loads back unchanged and is private to the user."""
+        cache = WebtopSessionCache(str(tmp_path / "nested" / "session.json"))
+        state = {"cookies": [{"name": "session", "value": "abc"}], "origins": []}
+
+        cache.save(state)
+
+        assert cache.load() == state
+        assert os.stat(cache.path).st_mode & 0o777 == 0o600
+
+    def test_load_missing_or_corrupt_file(self, tmp_path):
+        """Unit test: a missing or unreadable file means no saved session."""
+        cache = WebtopSessionCache(str(tmp_path / "session.json"))
+        assert cache.load() is None
+
+        (tmp_path / "session.json").write_text("not json")
+        assert cache.load() is None
+
+        cache.clear()
+        assert not os.path.exists(cache.path)
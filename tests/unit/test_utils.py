@@ -1,59 +1,107 @@
 """Tests for utility functions."""
+
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from webtop_il_kit.utils import parse_date
+from webtop_il_kit.selectors import Timeouts
+from webtop_il_kit.utils import AsyncWait, _parse_date_string, first_match, parse_date
+
+JAN_21 = datetime(2026, 1, 21)
 
 
 class TestParseDate:
     """Tests for date parsing utility."""
 
-    def test_parse_date_dd_mm_yyyy_dash(self):
-        """Test parsing DD-MM-YYYY format."""
-        result = parse_date("21-01-2026")
-        assert result == datetime(2026, 1, 21)
-
-    def test_parse_date_dd_mm_yyyy_slash(self):
-        """Test parsing DD/MM/YYYY format."""
-        result = parse_date("21/01/2026")
-        assert result == datetime(2026, 1, 21)
-
-    def test_parse_date_yyyy_mm_dd_dash(self):
-        """Test parsing YYYY-MM-DD format."""
-        result = parse_date("2026-01-21")
-        assert result == datetime(2026, 1, 21)
-
-    def test_parse_date_yyyy_mm_dd_slash(self):
-        """Test parsing YYYY/MM/DD format."""
-        result = parse_date("2026/01/21")
-        assert result == datetime(2026, 1, 21)
-
-    def test_parse_date_dd_mm_yyyy_dot(self):
-        """Test parsing DD.MM.YYYY format."""
-        result = parse_date("21.01.2026")
-        assert result == datetime(2026, 1, 21)
-
-    def test_parse_date_with_whitespace(self):
-        """Test parsing date with whitespace."""
-        result = parse_date("  21-01-2026  ")
-        assert result == datetime(2026, 1, 21)
-
-    def test_parse_date_none(self):
-        """Test parsing None returns None."""
-        result = parse_date(None)
-        assert result is None
-
-    def test_parse_date_invalid_format(self):
-        """Test parsing invalid date format raises ValueError."""
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("21-01-2026", JAN_21),
+            ("21/01/2026", JAN_21),
+            ("2026-01-21", JAN_21),
+            ("2026/01/21", JAN_21),
+            ("21.01.2026", JAN_21),
+            ("  21-01-2026  ", JAN_21),
+            ("1-2-2026", datetime(2026, 2, 1)),
+            (None, None),
+        ],
+        ids=["dd_mm_yyyy_dash", "dd_mm_yyyy_slash", "yyyy_mm_dd_dash", "yyyy_mm_dd_slash", "dd_mm_yyyy_dot", "whitespace", "single_digit", "none"],
+    )
+    def test_parse_date(self, value, expected):
+        """Test parsing every supported format, and None."""
+        assert parse_date(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        ["invalid-date", "32-01-2026", "21_01_2026", "21-01/2026", "2026/01-21", "2026.01.21", "٢١-٠١-٢٠٢٦"],
+        ids=[
+            "invalid_format",
+            "invalid_date",
+            "wrong_separator",
+            "mixed_separators_dmy",
+            "mixed_separators_ymd",
+            "dotted_year_first",
+            "non_ascii_digits",
+        ],
+    )
+    def test_parse_date_invalid(self, value):
+        """Test that unsupported formats and impossible dates raise ValueError."""
         with pytest.raises(ValueError, match="Could not parse date"):
-            parse_date("invalid-date")
+            parse_date(value)
+
+    def test_parse_date_datetime_passthrough(self):
+        """Test that a datetime is returned without parsing."""
+        value = JAN_21
+        assert parse_date(value) is value
+
+    def test_parse_date_cached_after_normalizing(self):
+        """Test that the same date with surrounding whitespace is parsed only once."""
+        _parse_date_string.cache_clear()
+
+        first = parse_date("21-01-2026")
+        second = parse_date("  21-01-2026 ")
+
+        assert first is second
+        assert _parse_date_string.cache_info().misses == 1
+
+
+class TestFirstMatch:
+    """Tests for priority-ordered selector lookup."""
+
+    async def test_first_match_follows_selector_order(self):
+        """Test that the first selector with a match wins and later ones are not queried."""
+        counts = {"#specific": 0, ".preferred": 2, "input": 5}
+        page = MagicMock()
+        page.locator.side_effect = lambda selector: MagicMock(first=MagicMock(count=AsyncMock(return_value=counts[selector])))
+
+        result = await first_match(page, ("#specific", ".preferred", "input"))
+
+        assert await result.count() == 2
+        assert [c.args[0] for c in page.locator.call_args_list] == ["#specific", ".preferred"]
+
+    async def test_first_match_none(self):
+        """Test that None is returned when no selector matches."""
+        page = MagicMock()
+        page.locator.return_value.first.count = AsyncMock(return_value=0)
+
+        assert await first_match(page, ("a", "b")) is None
+
+
+class TestAsyncWait:
+    """Tests for the event-driven wait helpers."""
+
+    async def test_after_click_waits_for_selector(self):
+        """Test that a click wait also waits for the given selector."""
+        page = AsyncMock()
+
+        assert await AsyncWait.after_click(page, "input") is True
+        page.wait_for_load_state.assert_called_once_with("domcontentloaded", timeout=Timeouts.ELEMENT_WAIT)
+        page.wait_for_selector.assert_called_once_with("input", state="visible", timeout=Timeouts.ELEMENT_WAIT)
 
-    def test_parse_date_invalid_date(self):
-        """Test parsing invalid date (e.g., 32nd day) raises ValueError."""
-        with pytest.raises(ValueError):
-            parse_date("32-01-2026")
+    async def test_after_navigation_timeout_does_not_raise(self):
+        """Test that a navigation timeout is reported instead of raised."""
+        page = AsyncMock()
+        page.wait_for_url.side_effect = Exception("Timeout")
 
-    def test_parse_date_wrong_separator(self):
-        """Test parsing date with wrong separator raises ValueError."""
-        with pytest.raises(ValueError):
-            parse_date("21_01_2026")
+        assert await AsyncWait.after_navigation(page, "**/login**", timeout=100) is False
+        page.wait_for_url.assert_called_once_with("**/login**", timeout=100)